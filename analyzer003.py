@@ -1,22 +1,24 @@
 import os
 import argparse
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime
 
-from sensors.Accelerometer.AccelerometerAnalyzer import AccelerometerAnalyzer
-from sensors.GNSS_GPS.GNSS_GPS_Analyzer import GNSS_GPS_Analyzer
-from sensors.Gyroscope.GyroscopeAnalyzer import GyroscopeAnalyzer
-from sensors.Light.LightAnalyzer import LightAnalyzer
-from sensors.Magnetometer.MagnetometerAnalyzer import MagnetometerAnalyzer
-from sensors.Orientation.OrientationAnalyzer import OrientationAnalyzer
-from sensors.Pressure.PressureAnalyzer import PressureAnalyzer
+from sensors.Base.LazyRegistry import LazyRegistry
+from sensors.Base.PipelineMetrics import PipelineMetrics
+from sensors.IO.LogFileReader import LogFileReader
+from sensors.IO.SensorFrameLoader import SensorFrameLoader
+from parser003 import SensorDataParser
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class SensorDataAnalyzer:
     """
     A class to handle parsing and analyzing of sensor data.
 
     This class encapsulates all the functionality related to validating input,
-    and running analysis on sensor data from a source CSV file.
+    and running analysis on sensor data from a source file exported by the parser
+    (CSV, Parquet, Feather or NPZ), or from a raw logfile parsed in-process.
     """
 
     def __init__(self):
@@ -25,43 +27,104 @@ class SensorDataAnalyzer:
         """
         self.SENSORS = ['ACCE', 'GYRO', 'MAGN', 'PRES', 'LIGH', 'AHRS', 'GNSS']
 
-        self.sensor_analyzer_map = {
-            'ACCE': AccelerometerAnalyzer,
-            'GYRO': GyroscopeAnalyzer,
-            'MAGN': MagnetometerAnalyzer,
-            'PRES': PressureAnalyzer,
-            'LIGH': LightAnalyzer,
-            'AHRS': OrientationAnalyzer,
-            'GNSS': GNSS_GPS_Analyzer,
-        }
-
-    def analyze(self, file_source: str, target_sensor: Optional[str] = None) -> None:
+        # imported only the analyzer of the analyzed sensor, with its plotting and geodesy libraries
+        self.sensor_analyzer_map = LazyRegistry({
+            'ACCE': 'sensors.Accelerometer.AccelerometerAnalyzer.AccelerometerAnalyzer',
+            'GYRO': 'sensors.Gyroscope.GyroscopeAnalyzer.GyroscopeAnalyzer',
+            'MAGN': 'sensors.Magnetometer.MagnetometerAnalyzer.MagnetometerAnalyzer',
+            'PRES': 'sensors.Pressure.PressureAnalyzer.PressureAnalyzer',
+            'LIGH': 'sensors.Light.LightAnalyzer.LightAnalyzer',
+            'AHRS': 'sensors.Orientation.OrientationAnalyzer.OrientationAnalyzer',
+            'GNSS': 'sensors.GNSS_GPS.GNSS_GPS_Analyzer.GNSS_GPS_Analyzer',
+        })
+        self.metrics = PipelineMetrics()  # metrics of the last analysis, replaced at the start of every analysis
+
+    def analyze(self, file_source: str, target_sensor: Optional[str] = None, use_cache: bool = True) -> None:
         """
         Validate input and run analysis on sensor data from a source file.
 
         This function orchestrates the entire process of validating input and
-        running analysis on sensor data from a CSV file. It follows these main steps:
+        running analysis on sensor data from an exported file or a raw logfile.
+        It follows these main steps:
         1. Validate input parameters
-        2. Run analysis on the sensor data from the source file
+        2. Parse the sensor data in-process if the source file is a raw logfile
+        3. Run analysis on the sensor data from the source file
+
+        The stage timings and counts of the analysis are kept in the metrics attribute.
 
         Args:
-            file_source (str): Path to the source CSV file containing sensor data.
+            file_source (str): Path to the source file (.csv, .parquet, .feather, .npz or a
+                .txt logfile) containing sensor data.
             target_sensor (str, optional): Name of the specific sensor to analyze data for.
+            use_cache (bool): Whether to use the parse cache of the parser for a raw logfile.
 
         Raises:
             FileNotFoundError: If the source file does not exist.
-            ValueError: If the source file is not a .csv file or if the target sensor is invalid.
+            ValueError: If the source file type is not supported, if the target sensor is invalid,
+                or if a raw logfile has no data for the target sensor.
         """
-        self.validate_input_parameters(file_source, target_sensor)
-        
-        self.sensor_analyzer_map[target_sensor](file_source).run_analysis()
+        self.metrics = PipelineMetrics()
+
+        with self.metrics.stage('validate'):
+            self.validate_input_parameters(file_source, target_sensor)
+        self.metrics.file_size = os.path.getsize(file_source)
+
+        # parsed a raw logfile straight into a DataFrame, skipping the exported file
+        is_logfile = LogFileReader.is_supported(file_source)
+        if is_logfile:
+            with self.metrics.stage('parse'):
+                sensor_data = self.load_logfile(file_source, target_sensor, use_cache)
+        else:
+            sensor_data = file_source
+
+        with self.metrics.stage('load'):
+            sensor_analyzer = self.sensor_analyzer_map[target_sensor](sensor_data)
+        if not is_logfile:
+            self.metrics.lines = len(sensor_analyzer.df)  # counted the rows of an exported file as its lines
+        self.metrics.count_records({target_sensor: len(sensor_analyzer.df)})
+
+        with self.metrics.stage('analyze'):
+            sensor_analyzer.run_analysis()
+
+    def load_logfile(self, file_source: str, target_sensor: str, use_cache: bool = True) -> 'pd.DataFrame':
+        """
+        Parse the data of a sensor from a raw logfile into a DataFrame.
+
+        The target sensor is parsed into a columnar table by the parser, or loaded from
+        the parse cache shared with the parser (e.g. filled by exporting the logfile
+        before, or by analyzing another sensor of it), and the DataFrame is built straight
+        from the column buffers of the table, with the same columns as the exported
+        file including the calculated values and the timestamps. The wall-clock time
+        is reconstructed from the date of creation in the preamble of the logfile.
+
+        Args:
+            file_source (str): Path to the logfile containing sensor data.
+            target_sensor (str): Name of the sensor to load data for.
+            use_cache (bool): Whether to use the parse cache of the parser.
+
+        Returns:
+            pd.DataFrame: The sensor data, with one column per header.
+
+        Raises:
+            ValueError: If the logfile has no data for the target sensor.
+        """
+        parser = SensorDataParser()
+        sensors_tables = parser.parse_sensor_tables(file_source, use_cache=use_cache, tags=[target_sensor])
+        parser.error_collector.finish()
+        self.metrics.lines += parser.metrics.lines
+        self.metrics.count_errors(parser.error_collector.category_counts, parser.error_collector.tag_counts)
+        sensor_table = sensors_tables.get(target_sensor)
+        if not sensor_table:
+            raise ValueError(f'No Data Found For Sensor {target_sensor}!')
+        creation_time = LogFileReader(file_source).read_creation_time()
+        return SensorFrameLoader.from_table(sensor_table, include_timestamps=True, creation_time=creation_time)
 
     def validate_input_parameters(self, file_source: str, target_sensor: Optional[str]) -> None:
         """
         Validate the input parameters for the analyzer function.
 
         This function performs several checks:
-        1. Ensures the source file has a .csv extension
+        1. Ensures the source file has a .csv, .parquet, .feather, .npz or logfile extension
         2. Verifies that the source file exists
         3. If a target sensor is specified, ensures it's a valid sensor type
 
@@ -73,8 +136,9 @@ class SensorDataAnalyzer:
             ValueError: If any of the input parameters are invalid.
             FileNotFoundError: If the source file does not exist.
         """
-        if not file_source.endswith('.csv'):
-            raise ValueError('Invalid File Type! Source File Must Be .csv!')
+        if not SensorFrameLoader.is_supported(file_source) and not LogFileReader.is_supported(file_source):
+            raise ValueError(f'Invalid File Type! Source File Must Be One of: {", ".join(SensorFrameLoader.SUPPORTED_EXTENSIONS)} '
+                             f'or a .txt Logfile!')
         
         if not os.path.exists(file_source):
             raise FileNotFoundError('Source File Not Found!')
@@ -93,6 +157,8 @@ def print_help() -> None:
     print('python analyzer003.py <source_file> <sensor_name>')
     print('\nOptions:')
     print('-h, --help\t\tShow this help message and exit')
+    print('--no-cache\t\tParse a .txt logfile again instead of using the parse cache')
+    print('--metrics-json <file>\tWrite the stage timings, throughput and peak memory to a JSON file')
 
 def print_intro() -> None:
     """
@@ -105,7 +171,7 @@ def print_intro() -> None:
     print('=' * ROW_WIDTH)
     print('003 - SENSOR DATA ANALYZER'.center(ROW_WIDTH))
     print('-' * ROW_WIDTH)
-    print('To Analyze Data from CSV Files'.center(ROW_WIDTH))
+    print('To Analyze Data from CSV Files or Logfiles'.center(ROW_WIDTH))
     print('-' * ROW_WIDTH)
     print('Developed By: Saad Mansoor (24015919-003)'.center(ROW_WIDTH))
     print('Programming Languages - Assignment 01 - Task 02'.center(ROW_WIDTH))
@@ -121,9 +187,11 @@ def main() -> None:
     It also handles any exceptions that might occur during execution.
     """
     arg_parser = argparse.ArgumentParser(description='Sensor Data Analyzer', add_help=False)
-    arg_parser.add_argument('source_file', nargs='?', help='Source CSV file containing sensor data')
+    arg_parser.add_argument('source_file', nargs='?', help='Source CSV, Parquet, Feather, NPZ or .txt logfile containing sensor data')
     arg_parser.add_argument('sensor_name', nargs='?', help='Name of the sensor to analyze data for')
     arg_parser.add_argument('-h', '--help', action='store_true', help='Show this help message and exit')
+    arg_parser.add_argument('--no-cache', action='store_true', help='Parse a .txt logfile again instead of using the parse cache')
+    arg_parser.add_argument('--metrics-json', metavar='file', help='Write the stage timings and throughput to a JSON file')
 
     args = arg_parser.parse_args()
 
@@ -145,7 +213,11 @@ def main() -> None:
     
     try:
         analyzer = SensorDataAnalyzer()
-        analyzer.analyze(args.source_file, args.sensor_name)
+        analyzer.analyze(args.source_file, args.sensor_name, use_cache=not args.no_cache)
+
+        if args.metrics_json:
+            analyzer.metrics.save(args.metrics_json)
+            print(f"[INFO] Metrics Saved in '{args.metrics_json}'")
     except Exception as e:
         print(f"An error occurred: {e}")
 
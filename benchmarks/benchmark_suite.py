@@ -0,0 +1,156 @@
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+import warnings
+import contextlib
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+# rendered the analyzer plots off-screen, so run_analysis never blocks on a window
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+# made the repository root importable when the script is run from the benchmarks folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib.pyplot as plt
+
+from parser003 import SensorDataParser
+from analyzer003 import SensorDataAnalyzer
+from sensors.IO.SensorFrameLoader import SensorFrameLoader
+from generate_logfile import DEFAULT_RATES, generate_logfile
+
+def measure(step: Callable[[], object], repeat: int = 1) -> Dict[str, float]:
+    """
+    Measure the wall time and the peak memory of a benchmark step.
+
+    The step is timed `repeat` times without tracing, keeping the best time, and
+    run once more under tracemalloc to find its peak memory, so the tracing
+    overhead never shows up in the timings. The console output of the step is
+    discarded.
+
+    Args:
+        step (Callable[[], object]): A function running the step once.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        Dict[str, float]: The best wall time in 'seconds' and the 'peak' memory in bytes.
+    """
+    best_time = float('inf')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            step()
+            best_time = min(best_time, time.perf_counter() - start_time)
+
+        tracemalloc.start()
+        try:
+            step()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {'seconds': best_time, 'peak': peak}
+
+def print_result(name: str, result: Dict[str, float], records: int, file_size: Optional[int] = None) -> None:
+    """
+    Print one row of the benchmark report.
+
+    Args:
+        name (str): Name of the benchmark step.
+        result (Dict[str, float]): The result of measure for the step.
+        records (int): Number of records processed by the step.
+        file_size (int, optional): Bytes of the logfile read by the step, to report MB/s.
+    """
+    seconds = result['seconds']
+    megabytes_per_second = f"{file_size / (1024 * 1024) / seconds:>9.1f}" if file_size else f"{'-':>9}"
+    print(f"{name:<34}{seconds:>9.3f}{records / seconds:>14,.0f}{megabytes_per_second}"
+          f"{result['peak'] / (1024 * 1024):>11.1f}")
+
+def run_benchmark(file_source: str, repeat: int = 1, analyzers: bool = True) -> None:
+    """
+    Time the parser, the exporter and the analyzers on a logfile.
+
+    Args:
+        file_source (str): Path to the logfile.
+        repeat (int): The number of timed runs of each step.
+        analyzers (bool): Whether to benchmark the analyzers as well.
+    """
+    parser = SensorDataParser()
+    file_size = os.path.getsize(file_source)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sensors_data = parser.parse_sensor_data(file_source)
+        sensors_tables = parser.parse_sensor_tables(file_source)
+    total_records = len(sensors_data)
+
+    print(f"[INFO] Benchmark of '{file_source}' ({file_size / (1024 * 1024):.2f} MB, {total_records} Records)\n")
+    print(f"{'Step':<34}{'Seconds':>9}{'Records/s':>14}{'MB/s':>9}{'Peak (MB)':>11}")
+
+    # timed parsing into sensor objects and into columnar tables
+    print_result('parse_sensor_data', measure(lambda: parser.parse_sensor_data(file_source), repeat),
+                 total_records, file_size)
+    print_result('parse_sensor_tables', measure(lambda: parser.parse_sensor_tables(file_source), repeat),
+                 total_records, file_size)
+
+    # timed exporting the parsed objects and tables to csv files, with and without calculated values
+    with tempfile.TemporaryDirectory() as export_dir:
+        for name, data in (('objects', sensors_data), ('tables', sensors_tables)):
+            for include_calculated in (False, True):
+                step = lambda: parser.export_sensor_data(data, None, include_calculated, export_dir)
+                print_result(f"export_sensor_data ({name}{', -c' if include_calculated else ''})",
+                             measure(step, repeat), total_records)
+
+    if not analyzers:
+        return
+
+    # timed every analyzer on a DataFrame of its sensor, from a temporary working directory for saved maps
+    sensor_analyzer_map = SensorDataAnalyzer().sensor_analyzer_map
+    working_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as analysis_dir, warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        os.chdir(analysis_dir)
+        try:
+            for tag, analyzer_class in sensor_analyzer_map.items():
+                if not sensors_tables.get(tag):
+                    continue
+                records = len(sensors_tables[tag])
+                data_frame = SensorFrameLoader.from_table(sensors_tables[tag])
+
+                analyzer_result = measure(lambda: analyzer_class(data_frame.copy()), repeat)
+                print_result(f'{analyzer_class.__name__}', analyzer_result, records)
+
+                def run_analysis():
+                    analyzer_class(data_frame.copy()).run_analysis()
+                    plt.close('all')
+                print_result(f'{analyzer_class.__name__}.run_analysis', measure(run_analysis, repeat), records)
+        finally:
+            os.chdir(working_dir)
+
+def main() -> None:
+    """
+    Main function to handle command-line arguments and run the benchmark suite.
+    """
+    arg_parser = argparse.ArgumentParser(description='Sensor Data Parser Benchmark Suite')
+    arg_parser.add_argument('source_file', nargs='?',
+                            help='Source logfile to benchmark; if omitted, a synthetic logfile is generated')
+    arg_parser.add_argument('-n', '--lines', type=float, default=1e5,
+                            help='Number of data lines of the generated logfile (default: 1e5)')
+    arg_parser.add_argument('--repeat', type=int, default=1, help='Number of timed runs of each step')
+    arg_parser.add_argument('--no-analyzers', action='store_true', help='Skip the analyzer benchmarks')
+    args = arg_parser.parse_args()
+
+    if args.source_file:
+        run_benchmark(args.source_file, args.repeat, not args.no_analyzers)
+        return
+
+    with tempfile.TemporaryDirectory() as generated_dir:
+        file_source = os.path.join(generated_dir, 'synthetic_logfile.txt')
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_logfile(file_source, int(args.lines), DEFAULT_RATES)
+        run_benchmark(file_source, args.repeat, not args.no_analyzers)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+import os
+import sys
+import argparse
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# made the repository root importable when the script is run from the benchmarks folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sensors.IO.LogFileReader import LogFileReader
+
+PREAMBLE = """% LogFile created by the 'GetSensorData' App for Android.
+% Date of creation: {creation_date}
+% Developed by LOPSI research group at CAR-CSIC, Spain (http://www.car.upm-csic.es/lopsi)
+% Version 2.0 November 2016
+% The 'GetSensorData' program stores information from Smartphone/Tablet internal sensors (Accelerometers, Gyroscopes, Magnetometers, Pressure, Ambient Light, Orientation, Sound level, GPS/GNSS positio, WiFi RSS, Cellular/GSM/3G signal strength,...) and also from external devices (e.g. RFCode RFID reader, XSens IMU or LPMS-B IMU)
+%
+% Phone used for this logfile:
+% Manufacturer:            \tsynthetic
+% Model:                   \tgenerate_logfile.py
+% API Android version:     \t33
+% Android version Release: \t13
+%
+% LogFile Data format:
+% Accelerometer data: \t'ACCE;AppTimestamp(s);SensorTimestamp(s);Acc_X(m/s^2);Acc_Y(m/s^2);Acc_Z(m/s^2);Accuracy(integer)'
+% Gyroscope data:     \t'GYRO;AppTimestamp(s);SensorTimestamp(s);Gyr_X(rad/s);Gyr_Y(rad/s);Gyr_Z(rad/s);Accuracy(integer)'
+% Magnetometer data:  \t'MAGN;AppTimestamp(s);SensorTimestamp(s);Mag_X(uT);;Mag_Y(uT);Mag_Z(uT);Accuracy(integer)'
+% Pressure data:      \t'PRES;AppTimestamp(s);SensorTimestamp(s);Pres(mbar);Accuracy(integer)'
+% Light data:         \t'LIGH;AppTimestamp(s);SensorTimestamp(s);Light(lux);Accuracy(integer)'
+% Proximity data:     \t'PROX;AppTimestamp(s);SensorTimestamp(s);prox(?);Accuracy(integer)'
+% Humidity data:      \t'HUMI;AppTimestamp(s);SensorTimestamp(s);humi(Percentage);Accuracy(integer)'
+% Temperature data:   \t'TEMP;AppTimestamp(s);SensorTimestamp(s);temp(Celsius);Accuracy(integer)'
+% Orientation data:   \t'AHRS;AppTimestamp(s);SensorTimestamp(s);PitchX(deg);RollY(deg);YawZ(deg);RotVecX();RotVecY();RotVecZ();Accuracy(int)'
+% GNSS/GPS data:      \t'GNSS;AppTimestamp(s);SensorTimeStamp(s);Latit(deg);Long(deg);Altitude(m);Bearing(deg);Accuracy(m);Speed(m/s);SatInView;SatInUse'
+% WIFI data:          \t'WIFI;AppTimestamp(s);SensorTimeStamp(s);Name_SSID;MAC_BSSID;RSS(dBm);'
+% Bluetooth data:     \t'BLUE;AppTimestamp(s);Name;MAC_Address;RSS(dBm);'
+% BLE 4.0 data:       \t'BLE4;AppTimestamp(s);MajorID;MinorID;RSS(dBm);'
+% Sound data:         \t'SOUN;AppTimestamp(s);RMS;Pressure(Pa);SPL(dB);'
+% RFID Reader data:   \t'RFID;AppTimestamp(s);ReaderNumber(int);TagID(int);RSS_A(dBm);RSS_B(dBm);'
+% IMU XSens data:     \t'IMUX;AppTimestamp(s);SensorTimestamp(s);Counter;Acc_X(m/s^2);Acc_Y(m/s^2);Acc_Z(m/s^2);Gyr_X(rad/s);Gyr_Y(rad/s);Gyr_Z(rad/s);Mag_X(uT);;Mag_Y(uT);Mag_Z(uT);Roll(deg);Pitch(deg);Yaw(deg);Quat(1);Quat(2);Quat(3);Quat(4);Pressure(mbar);Temp(Celsius)'
+% IMU LPMS-B data:    \t'IMUL;AppTimestamp(s);SensorTimestamp(s);Counter;Acc_X(m/s^2);Acc_Y(m/s^2);Acc_Z(m/s^2);Gyr_X(rad/s);Gyr_Y(rad/s);Gyr_Z(rad/s);Mag_X(uT);;Mag_Y(uT);Mag_Z(uT);Roll(deg);Pitch(deg);Yaw(deg);Quat(1);Quat(2);Quat(3);Quat(4);Pressure(mbar);Temp(Celsius)'
+% POSI Reference:    \t\t'POSI;Timestamp(s);Counter;Latitude(degrees); Longitude(degrees);floor ID(0,1,2..4);Building ID(0,1,2..3);'
+%
+% Note that there are two timestamps:
+%  -'AppTimestamp' is set by the Android App as data is read. It is not representative of when data is actually captured by the sensor (but has a common time reference for all sensors)
+%  -'SensorTimestamp' is set by the sensor itself (the delta_time=SensorTimestamp(k)-SensorTimestamp(k-1) between two consecutive samples is an accurate estimate of the sampling interval). This timestamp is better for integrating inertial data.
+
+"""
+
+# samples per second of each sensor, close to the sample logfiles recorded by a phone while walking
+DEFAULT_RATES = {
+    'ACCE': 50.0, 'GYRO': 50.0, 'MAGN': 50.0, 'AHRS': 50.0, 'PRES': 5.0,
+    'LIGH': 5.0, 'SOUN': 2.0, 'GNSS': 1.0, 'WIFI': 2.0, 'PROX': 0.1
+}
+
+CHUNK_SECONDS = 60.0  # seconds of recording generated and written at a time
+SENSOR_TIME_OFFSET = 304839.1  # SensorTimestamp (s since boot) at AppTimestamp 0
+GNSS_EPOCH = 1727074709.0  # GNSS SensorTimestamp (s since 1970) at AppTimestamp 0
+WALK_SPEED = 1.4  # m/s
+WALK_RADIUS = 150.0  # m, radius of the circular walk of the GNSS track
+START_POSITION = (32.641298, 74.167730)  # latitude and longitude in degrees
+WIFI_ACCESS_POINTS = [(f'AP-{number:02d}', ':'.join(f'{(number * 37 + byte * 11) % 256:02x}' for byte in range(6)))
+                      for number in range(12)]
+BLUETOOTH_DEVICES = [(f'Device-{number}', ':'.join(f'{(number * 53 + byte * 7) % 256:02X}' for byte in range(6)))
+                     for number in range(4)]
+
+def walking(times: np.ndarray, amplitude: float, phase: float = 0.0) -> np.ndarray:
+    """
+    Get a periodic walking motion of the step frequency.
+
+    Args:
+        times (np.ndarray): AppTimestamps of the samples.
+        amplitude (float): Amplitude of the motion.
+        phase (float): Phase shift of the motion in radians.
+
+    Returns:
+        np.ndarray: The motion at each timestamp.
+    """
+    return amplitude * np.sin(2 * np.pi * 1.8 * times + phase)
+
+def inertial_columns(times: np.ndarray, rng: np.random.Generator) -> List:
+    """
+    Get the columns of IMUX/IMUL lines after the AppTimestamp.
+
+    The lines follow the layout of IMU_SensorBase, which has no SensorTimestamp field.
+
+    Args:
+        times (np.ndarray): AppTimestamps of the samples.
+        rng (np.random.Generator): The random number generator.
+
+    Returns:
+        List: The counter, acc, gyr, mag, roll/pitch/yaw, quaternion, pressure and temp columns.
+    """
+    count = len(times)
+    yaw = np.radians((times * 2.0) % 360 - 180)
+    return [
+        np.arange(count) % 65536,
+        walking(times, 0.8) + rng.normal(0, 0.05, count),
+        walking(times, 0.4, 1.0) + rng.normal(0, 0.05, count),
+        9.81 + walking(times, 1.5, 0.5) + rng.normal(0, 0.05, count),
+        walking(times, 0.3) + rng.normal(0, 0.01, count),
+        walking(times, 0.2, 1.0) + rng.normal(0, 0.01, count),
+        np.full(count, 0.035) + rng.normal(0, 0.01, count),
+        -28.0 + rng.normal(0, 0.3, count), -12.5 + rng.normal(0, 0.3, count), -33.0 + rng.normal(0, 0.3, count),
+        walking(times, 2.0) + rng.normal(0, 0.1, count),
+        walking(times, 3.0, 0.5) + rng.normal(0, 0.1, count),
+        np.degrees(yaw),
+        np.cos(yaw / 2), np.zeros(count), np.zeros(count), np.sin(yaw / 2),
+        976.4 + rng.normal(0, 0.02, count),
+        25.0 + rng.normal(0, 0.1, count)
+    ]
+
+def gnss_columns(times: np.ndarray, rng: np.random.Generator) -> List:
+    """
+    Get the columns of GNSS lines after the AppTimestamp, along a circular walk around the start position.
+
+    Args:
+        times (np.ndarray): AppTimestamps of the samples.
+        rng (np.random.Generator): The random number generator.
+
+    Returns:
+        List: The SensorTimestamp, position, altitude, bearing, accuracy, speed and satellite columns.
+    """
+    count = len(times)
+    angle = WALK_SPEED * times / WALK_RADIUS
+    latitude = START_POSITION[0] + np.degrees(WALK_RADIUS * np.sin(angle) / 6371000.0)
+    longitude = START_POSITION[1] + np.degrees(WALK_RADIUS * (1 - np.cos(angle)) /
+                                               (6371000.0 * np.cos(np.radians(START_POSITION[0]))))
+    return [
+        GNSS_EPOCH + np.floor(times), latitude, longitude,
+        201.0 + rng.normal(0, 1.0, count), np.degrees(angle) % 360,
+        np.round(rng.uniform(3, 15, count), 1), np.round(WALK_SPEED + rng.normal(0, 0.2, count), 1).clip(0),
+        rng.integers(7, 13, count), rng.integers(4, 8, count)
+    ]
+
+# line format and column generator of every sensor tag; the AppTimestamp is always the first column
+TAG_LAYOUTS: Dict[str, tuple] = {
+    'ACCE': ('ACCE;%.3f;%.3f;%.5f;%.5f;%.5f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, walking(t, 0.8) + rng.normal(0, 0.05, len(t)),
+        4.5 + walking(t, 0.4, 1.0) + rng.normal(0, 0.05, len(t)),
+        8.5 + walking(t, 1.5, 0.5) + rng.normal(0, 0.05, len(t)), np.full(len(t), 3)]),
+    'GYRO': ('GYRO;%.3f;%.3f;%.5f;%.5f;%.5f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, walking(t, 0.3) + rng.normal(0, 0.01, len(t)),
+        walking(t, 0.2, 1.0) + rng.normal(0, 0.01, len(t)),
+        0.035 + rng.normal(0, 0.01, len(t)), np.full(len(t), 3)]),
+    'MAGN': ('MAGN;%.3f;%.3f;%.5f;%.5f;%.5f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, -28.0 + rng.normal(0, 0.3, len(t)), -12.5 + rng.normal(0, 0.3, len(t)),
+        -33.0 + rng.normal(0, 0.3, len(t)), np.full(len(t), 3)]),
+    'PRES': ('PRES;%.3f;%.3f;%.4f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, 976.4 + 0.05 * np.sin(t / 120) + rng.normal(0, 0.005, len(t)), np.full(len(t), 3)]),
+    'LIGH': ('LIGH;%.3f;%.3f;%.1f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, np.abs(rng.normal(120, 60, len(t))).round(), np.full(len(t), 3)]),
+    'PROX': ('PROX;%.3f;%.3f;%.1f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, rng.choice([0.0, 8.0], len(t)), np.full(len(t), 3)]),
+    'HUMI': ('HUMI;%.3f;%.3f;%.1f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, 45.0 + rng.normal(0, 1.0, len(t)), np.full(len(t), 3)]),
+    'TEMP': ('TEMP;%.3f;%.3f;%.1f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, 25.0 + rng.normal(0, 0.2, len(t)), np.full(len(t), 3)]),
+    'AHRS': ('AHRS;%.3f;%.3f;%.4f;%.4f;%.4f;%.5f;%.5f;%.5f;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, 26.0 + walking(t, 2.0) + rng.normal(0, 0.1, len(t)),
+        2.5 + walking(t, 3.0, 0.5) + rng.normal(0, 0.1, len(t)), (t * 2.0) % 360 - 180,
+        0.18 + rng.normal(0, 0.002, len(t)), -0.14 + rng.normal(0, 0.002, len(t)),
+        np.sin(np.radians((t * 2.0) % 360 - 180) / 2), np.full(len(t), 3)]),
+    'GNSS': ('GNSS;%.3f;%.3f;%.6f;%.6f;%.3f;%.3f;%.1f;%.1f;%d;%d', gnss_columns),
+    'WIFI': ('WIFI;%.3f;%.3f;%s;%s;%d', lambda t, rng: [
+        SENSOR_TIME_OFFSET + t, *zip(*(WIFI_ACCESS_POINTS[index] for index in rng.integers(0, len(WIFI_ACCESS_POINTS), len(t)))),
+        rng.integers(-90, -35, len(t))]),
+    'BLUE': ('BLUE;%.3f;%s;%s;%d', lambda t, rng: [
+        *zip(*(BLUETOOTH_DEVICES[index] for index in rng.integers(0, len(BLUETOOTH_DEVICES), len(t)))),
+        rng.integers(-95, -40, len(t))]),
+    'BLE4': ('BLE4;%.3f;%d;%d;%d', lambda t, rng: [
+        rng.integers(1, 5, len(t)), rng.integers(1, 100, len(t)), rng.integers(-95, -50, len(t))]),
+    'SOUN': ('SOUN;%.3f;%.2f;%.5f;%.2f', lambda t, rng: [
+        rng.uniform(500, 1500, len(t)), rng.uniform(0.01, 0.05, len(t)), rng.uniform(55, 75, len(t))]),
+    'RFID': ('RFID;%.3f;%d;%d;%d;%d', lambda t, rng: [
+        rng.integers(1, 4, len(t)), rng.integers(1000, 1100, len(t)),
+        rng.integers(-90, -40, len(t)), rng.integers(-90, -40, len(t))]),
+    'IMUX': ('IMUX;%.3f;%d' + ';%.5f' * 18, inertial_columns),
+    'IMUL': ('IMUL;%.3f;%d' + ';%.5f' * 18, inertial_columns),
+    'POSI': ('POSI;%.3f;%d;%.6f;%.6f;%d;%d', lambda t, rng: [
+        np.arange(len(t)), np.full(len(t), START_POSITION[0]), np.full(len(t), START_POSITION[1]),
+        np.zeros(len(t), dtype=int), np.zeros(len(t), dtype=int)])
+}
+
+def parse_rates(rates: Optional[str]) -> Dict[str, float]:
+    """
+    Parse a comma-separated list of sensor rates.
+
+    Args:
+        rates (str, optional): Rates as 'TAG=samples per second' pairs, e.g. 'ACCE=200,GYRO=200'.
+            If None, DEFAULT_RATES are used.
+
+    Returns:
+        Dict[str, float]: A mapping of sensor tag to its samples per second.
+
+    Raises:
+        ValueError: If a pair is malformed, or a tag or rate is invalid.
+    """
+    if rates is None:
+        return dict(DEFAULT_RATES)
+
+    tag_rates = {}
+    for pair in rates.split(','):
+        tag, separator, rate = pair.partition('=')
+        if not separator or tag not in TAG_LAYOUTS:
+            raise ValueError(f'Invalid Rate {pair}! Rates Must Be TAG=samples per second, With TAG One of: '
+                             f'{", ".join(TAG_LAYOUTS)}')
+        if float(rate) <= 0:
+            raise ValueError(f'Invalid Rate {pair}! Rates Must Be Positive!')
+        tag_rates[tag] = float(rate)
+    return tag_rates
+
+def generate_chunk(tag_rates: Dict[str, float], start_time: float, rng: np.random.Generator) -> List[str]:
+    """
+    Generate the data lines of all sensors for one chunk of the recording.
+
+    Every sensor is sampled at its rate with a small jitter, its values are generated
+    for the whole chunk at once, and the lines of all sensors are merged in the order
+    of their AppTimestamp, like the app writes them while it records.
+
+    Args:
+        tag_rates (Dict[str, float]): A mapping of sensor tag to its samples per second.
+        start_time (float): AppTimestamp at the start of the chunk.
+        rng (np.random.Generator): The random number generator.
+
+    Returns:
+        List[str]: The data lines of the chunk, without line terminators.
+    """
+    chunk_times = []
+    chunk_lines = []
+    for tag, rate in tag_rates.items():
+        line_format, build_columns = TAG_LAYOUTS[tag]
+        samples = np.arange(np.ceil(start_time * rate), np.ceil((start_time + CHUNK_SECONDS) * rate))
+        if not len(samples):
+            continue
+        times = np.round(samples / rate + rng.uniform(0, 0.002, len(samples)), 3)
+
+        columns = [times, *build_columns(times, rng)]
+        chunk_lines.extend(map(line_format.__mod__, zip(*columns)))
+        chunk_times.append(times)
+
+    if not chunk_times:
+        return []
+    order = np.argsort(np.concatenate(chunk_times), kind='stable')
+    return [chunk_lines[index] for index in order.tolist()]
+
+def generate_logfile(output_path: str, total_lines: int, tag_rates: Dict[str, float], seed: int = 0) -> int:
+    """
+    Write a synthetic GetSensorData logfile.
+
+    Args:
+        output_path (str): Path of the logfile to write.
+        total_lines (int): Number of data lines to write.
+        tag_rates (Dict[str, float]): A mapping of sensor tag to its samples per second.
+        seed (int): Seed of the random number generator, so the same logfile can be generated again.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    rng = np.random.default_rng(seed)
+    creation_date = datetime.now().strftime('%a %b %d %H:%M:%S GMT+05:00 %Y')
+
+    written_lines = 0
+    start_time = 0.0
+    with open(output_path, 'w', newline='\n') as file:
+        file.write(PREAMBLE.format(creation_date=creation_date))
+        while written_lines < total_lines:
+            lines = generate_chunk(tag_rates, start_time, rng)[:total_lines - written_lines]
+            file.write('\n'.join(lines))
+            file.write('\n')
+            written_lines += len(lines)
+            start_time += CHUNK_SECONDS
+
+            print(f"\r[INFO] Written {written_lines} of {total_lines} Lines", end='', flush=True)
+        print()
+        return file.tell()
+
+def main() -> None:
+    """
+    Main function to handle command-line arguments and generate a synthetic logfile.
+    """
+    arg_parser = argparse.ArgumentParser(description='Synthetic GetSensorData Logfile Generator')
+    arg_parser.add_argument('output_file', help='Path of the logfile to write (.txt)')
+    arg_parser.add_argument('-n', '--lines', type=float, default=1e5,
+                            help='Number of data lines to write, e.g. 1e4 to 1e8 (default: 1e5)')
+    arg_parser.add_argument('--rates', metavar='TAG=rate,...',
+                            help=f'Samples per second of each sensor (default: '
+                                 f'{",".join(f"{tag}={rate:g}" for tag, rate in DEFAULT_RATES.items())})')
+    arg_parser.add_argument('--seed', type=int, default=0, help='Seed of the random number generator')
+    args = arg_parser.parse_args()
+
+    try:
+        if not args.output_file.endswith(LogFileReader.SOURCE_EXTENSION):
+            raise ValueError('Invalid File Type! Output File Must Be .txt!')
+        if args.lines < 1:
+            raise ValueError('Invalid Number of Lines! Lines Must Be at Least 1!')
+
+        file_size = generate_logfile(args.output_file, int(args.lines), parse_rates(args.rates), args.seed)
+        print(f"[INFO] Logfile Saved in '{args.output_file}' ({file_size / (1024 * 1024):.2f} MB)")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+if __name__ == '__main__':
+    main()
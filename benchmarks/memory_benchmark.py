@@ -0,0 +1,121 @@
+import os
+import sys
+import argparse
+import tracemalloc
+from typing import Callable, Dict, List
+
+# made the repository root importable when the script is run from the benchmarks folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parser003 import SensorDataParser
+from sensors.Base.SensorTable import SensorTable
+from sensors.IO.LogFileReader import LogFileReader
+
+def read_tag_lines(file_source: str) -> Dict[str, List[bytes]]:
+    """
+    Read the raw data lines of a logfile grouped by sensor tag.
+
+    Args:
+        file_source (str): Path to the logfile.
+
+    Returns:
+        Dict[str, List[bytes]]: A mapping of sensor tag to its raw data lines, in file order.
+    """
+    tag_lines = {}
+    reader = LogFileReader(file_source, SensorDataParser().SENSORS)
+    for _, lines in reader.iter_blocks():
+        for prefix, lines_of_tag in reader.group_lines_by_tag(lines).items():
+            tag_lines.setdefault(prefix[:-1].decode(), []).extend(lines_of_tag)
+    return tag_lines
+
+def measure_retained_bytes(build: Callable[[], object]) -> int:
+    """
+    Measure the memory retained by the result of a build function.
+
+    Args:
+        build (Callable[[], object]): A function creating the data structure to measure.
+
+    Returns:
+        int: The number of bytes allocated by build that are still alive afterwards.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+def measure_tag(tag: str, sensor_class: type, lines: List[bytes]) -> Dict[str, float]:
+    """
+    Measure the bytes per sample of one sensor type in object and columnar mode.
+
+    Args:
+        tag (str): Sensor tag or sensor ID.
+        sensor_class (type): Sensor class of the tag.
+        lines (List[bytes]): Raw data lines of the tag.
+
+    Returns:
+        Dict[str, float]: The number of 'samples' and the bytes per sample of the
+            list of sensor 'objects' and of the 'columnar' SensorTable.
+    """
+    def build_objects():
+        # created one sensor object per line, the same way as the object-based parser
+        return [sensor_class(*line.decode('utf-8').strip().split(';')[1:]) for line in lines]
+
+    def build_table():
+        sensor_table = SensorTable(tag, sensor_class)
+        sensor_table.extend_lines(lines)
+        return sensor_table
+
+    samples = len(lines)
+    return {
+        'samples': samples,
+        'objects': measure_retained_bytes(build_objects) / samples,
+        'columnar': measure_retained_bytes(build_table) / samples
+    }
+
+def run_benchmark(file_source: str) -> None:
+    """
+    Report the memory cost per sample of every sensor type present in a logfile.
+
+    Args:
+        file_source (str): Path to the logfile.
+    """
+    parser = SensorDataParser()
+    tag_lines = read_tag_lines(file_source)
+
+    print(f"[INFO] Memory Per Sample of '{file_source}'\n")
+    print(f"{'Tag':<6}{'Samples':>10}{'Objects (B)':>14}{'Columnar (B)':>15}{'Ratio':>8}")
+
+    total_samples = total_objects = total_columnar = 0
+    for tag in parser.SENSORS:
+        if tag not in tag_lines:
+            continue
+        result = measure_tag(tag, parser.sensor_class_map[tag], tag_lines[tag])
+        print(f"{tag:<6}{result['samples']:>10}{result['objects']:>14.1f}{result['columnar']:>15.1f}"
+              f"{result['objects'] / result['columnar']:>8.1f}")
+
+        total_samples += result['samples']
+        total_objects += result['objects'] * result['samples']
+        total_columnar += result['columnar'] * result['samples']
+
+    if total_samples:
+        print(f"{'Total':<6}{total_samples:>10}{total_objects / total_samples:>14.1f}"
+              f"{total_columnar / total_samples:>15.1f}{total_objects / total_columnar:>8.1f}")
+        print(f"\n[INFO] Objects: {total_objects / (1024 * 1024):.2f} MB, Columnar: {total_columnar / (1024 * 1024):.2f} MB")
+
+def main() -> None:
+    """
+    Main function to handle command-line arguments and run the memory benchmark.
+    """
+    arg_parser = argparse.ArgumentParser(description='Sensor Data Parser Memory Benchmark')
+    arg_parser.add_argument('source_file', help='Source logfile containing sensor data')
+    args = arg_parser.parse_args()
+
+    run_benchmark(args.source_file)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import contextlib
+import subprocess
+from typing import Dict, List, Tuple
+
+# made the repository root importable when the script is run from the benchmarks folder
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from generate_logfile import DEFAULT_RATES, generate_logfile
+
+PARSER_SCRIPT = os.path.join(REPOSITORY_DIR, 'parser003.py')
+ANALYZER_SCRIPT = os.path.join(REPOSITORY_DIR, 'analyzer003.py')
+
+def measure_command(command: List[str], working_dir: str, repeat: int) -> Dict[str, float]:
+    """
+    Measure the wall time of a command run in a fresh Python process.
+
+    Every run starts a new interpreter, so the time includes the interpreter
+    startup and all module imports of the script, as a user of the command line
+    would see it. The console output of the command is discarded.
+
+    Args:
+        command (List[str]): The command line to run.
+        working_dir (str): Directory to run the command in, e.g. for exported files.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        Dict[str, float]: The 'best' and 'median' wall time in seconds.
+    """
+    # rendered the analyzer plots off-screen, so a run never blocks on a window
+    environment = dict(os.environ, MPLBACKEND='Agg', PYTHONDONTWRITEBYTECODE='1')
+
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        subprocess.run(command, cwd=working_dir, env=environment,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start_time)
+    return {'best': min(times), 'median': statistics.median(times)}
+
+def get_commands(file_source: str, sensor: str) -> List[Tuple[str, List[str]]]:
+    """
+    Get the command lines whose startup is measured.
+
+    Args:
+        file_source (str): Path to a small logfile for the single-sensor runs.
+        sensor (str): Sensor tag of the single-sensor runs.
+
+    Returns:
+        List[Tuple[str, List[str]]]: The name and command line of every benchmark step.
+    """
+    missing_file = os.path.join(os.path.dirname(file_source), 'missing_logfile.txt')
+    return [
+        ('python -c pass', [sys.executable, '-c', 'pass']),
+        ('parser003.py -h', [sys.executable, PARSER_SCRIPT, '-h']),
+        ('parser003.py (missing file)', [sys.executable, PARSER_SCRIPT, missing_file, '-all']),
+        (f'parser003.py -o {sensor}', [sys.executable, PARSER_SCRIPT, file_source, '-o', sensor, '--no-cache']),
+        ('analyzer003.py -h', [sys.executable, ANALYZER_SCRIPT, '-h']),
+        ('analyzer003.py (missing file)', [sys.executable, ANALYZER_SCRIPT, missing_file, sensor]),
+        (f'analyzer003.py {sensor}', [sys.executable, ANALYZER_SCRIPT, file_source, sensor, '--no-cache']),
+    ]
+
+def run_benchmark(file_source: str, sensor: str, repeat: int = 5) -> None:
+    """
+    Time the startup of the command-line scripts.
+
+    Args:
+        file_source (str): Path to a small logfile for the single-sensor runs.
+        sensor (str): Sensor tag of the single-sensor runs.
+        repeat (int): The number of timed runs of each command.
+    """
+    print(f"[INFO] Startup Benchmark of '{file_source}' ({os.path.getsize(file_source) / 1024:.1f} KB), "
+          f"{repeat} Runs Each\n")
+    print(f"{'Command':<34}{'Best (ms)':>11}{'Median (ms)':>13}")
+
+    with tempfile.TemporaryDirectory() as working_dir:
+        for name, command in get_commands(os.path.abspath(file_source), sensor):
+            result = measure_command(command, working_dir, repeat)
+            print(f"{name:<34}{result['best'] * 1000:>11.0f}{result['median'] * 1000:>13.0f}")
+
+def main() -> None:
+    """
+    Main function to handle command-line arguments and run the startup benchmark.
+    """
+    arg_parser = argparse.ArgumentParser(description='Sensor Data Parser Startup Benchmark')
+    arg_parser.add_argument('source_file', nargs='?',
+                            help='Small logfile for the single-sensor runs; if omitted, a synthetic logfile is generated')
+    arg_parser.add_argument('-n', '--lines', type=float, default=1e3,
+                            help='Number of data lines of the generated logfile (default: 1e3)')
+    arg_parser.add_argument('--sensor', default='GYRO', help='Sensor of the single-sensor runs (default: GYRO)')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs of each command')
+    args = arg_parser.parse_args()
+
+    if args.source_file:
+        run_benchmark(args.source_file, args.sensor, args.repeat)
+        return
+
+    with tempfile.TemporaryDirectory() as generated_dir:
+        file_source = os.path.join(generated_dir, 'synthetic_logfile.txt')
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_logfile(file_source, int(args.lines), DEFAULT_RATES)
+        run_benchmark(file_source, args.sensor, args.repeat)
+
+if __name__ == '__main__':
+    main()
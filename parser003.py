@@ -1,26 +1,27 @@
+import io
 import os
+import glob
+import json
+import mmap
+import time
 import argparse
-from typing import List, Optional
+import contextlib
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from itertools import chain, repeat
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-from sensors.Accelerometer import AccelerometerSensor
-from sensors.BLE4 import BLE4Sensor
-from sensors.Bluetooth import BluetoothSensor
-from sensors.GNSS_GPS import GNSS_GPS_Sensor
-from sensors.Gyroscope import GyroscopeSensor
-from sensors.Humidity import HumiditySensor
-from sensors.IMU_LPMS_B import IMU_LPMS_B_Sensor
-from sensors.IMU_XSens import IMU_XSensSensor
-from sensors.Light import LightSensor
-from sensors.Magnetometer import MagnetometerSensor
-from sensors.Orientation import OrientationSensor
-from sensors.POSI import POSI_Sensor
-from sensors.Pressure import PressureSensor
-from sensors.Proximity import ProximitySensor
-from sensors.RFID_Reader import RFID_ReaderSensor
-from sensors.Sound import SoundSensor
-from sensors.Temperature import TemperatureSensor
-from sensors.Wifi import WifiSensor
+from sensors.Base.LazyRegistry import LazyRegistry
+from sensors.Base.ParseErrorCollector import ParseError, ParseErrorCollector
+from sensors.Base.PipelineMetrics import PipelineMetrics
+from sensors.Base.SensorTable import SensorTable
+from sensors.IO.LogFileReader import LogFileReader
+from sensors.IO.SensorCsvWriter import SensorCsvWriter
+from sensors.IO.SensorFrameWriter import SensorFrameWriter
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sensors.IO.LogFileIndex import LogFileIndex
 
 class SensorDataParser:
     """
@@ -30,37 +31,70 @@ class SensorDataParser:
     from a source file and exporting it to CSV format.
     """
 
-    def __init__(self):
+    PARSER_VERSION = 2  # version of the parsed tables, raised to invalidate the parse cache
+    FOLLOW_POLL_INTERVAL = 1.0  # seconds between two checks for new lines in follow mode
+    FOLLOW_CHECKPOINT_FILE = 'follow_checkpoint.json'
+
+    def __init__(self, max_error_examples: Optional[int] = None, quarantine_file: Optional[str] = None,
+                 error_budget: Optional[int] = None):
         """
         Initialize the SensorDataParser with necessary constants and mappings.
+
+        Args:
+            max_error_examples (int, optional): Number of parse errors printed per run.
+                If None, ParseErrorCollector.DEFAULT_MAX_EXAMPLES is used.
+            quarantine_file (str, optional): Path of the file to save the lines that failed
+                to parse to. If None, bad lines are only counted.
+            error_budget (int, optional): Maximum number of lines that may fail to parse
+                before a run is aborted. If None, runs are never aborted.
         """
-        self.HEADER_LINES = 36
         self.SENSORS = ['ACCE', 'GYRO', 'MAGN', 'PRES', 'LIGH',
                         'PROX', 'HUMI', 'TEMP', 'AHRS', 'GNSS',
                         'WIFI', 'BLUE', 'BLE4', 'SOUN', 'RFID',
                         'IMUX', 'IMUL', 'POSI']
-        self.sensor_class_map = {
-            'ACCE': AccelerometerSensor.AccelerometerSensor,
-            'GYRO': GyroscopeSensor.GyroscopeSensor,
-            'MAGN': MagnetometerSensor.MagnetometerSensor,
-            'PRES': PressureSensor.PressureSensor,
-            'LIGH': LightSensor.LightSensor,
-            'PROX': ProximitySensor.ProximitySensor,
-            'HUMI': HumiditySensor.HumiditySensor,
-            'TEMP': TemperatureSensor.TemperatureSensor,
-            'AHRS': OrientationSensor.OrientationSensor,
-            'GNSS': GNSS_GPS_Sensor.GNSS_GPS_Sensor,
-            'WIFI': WifiSensor.WifiSensor,
-            'BLUE': BluetoothSensor.BluetoothSensor,
-            'BLE4': BLE4Sensor.BLE4Sensor,
-            'SOUN': SoundSensor.SoundSensor,
-            'RFID': RFID_ReaderSensor.RFID_ReaderSensor,
-            'IMUX': IMU_XSensSensor.IMU_XSensSensor,
-            'IMUL': IMU_LPMS_B_Sensor.IMU_LPMS_B_Sensor,
-            'POSI': POSI_Sensor.POSI_Sensor
-        }
+        # imported the module of a sensor class only once its tag is used, keeping the startup fast
+        self.sensor_class_map = LazyRegistry({
+            'ACCE': 'sensors.Accelerometer.AccelerometerSensor.AccelerometerSensor',
+            'GYRO': 'sensors.Gyroscope.GyroscopeSensor.GyroscopeSensor',
+            'MAGN': 'sensors.Magnetometer.MagnetometerSensor.MagnetometerSensor',
+            'PRES': 'sensors.Pressure.PressureSensor.PressureSensor',
+            'LIGH': 'sensors.Light.LightSensor.LightSensor',
+            'PROX': 'sensors.Proximity.ProximitySensor.ProximitySensor',
+            'HUMI': 'sensors.Humidity.HumiditySensor.HumiditySensor',
+            'TEMP': 'sensors.Temperature.TemperatureSensor.TemperatureSensor',
+            'AHRS': 'sensors.Orientation.OrientationSensor.OrientationSensor',
+            'GNSS': 'sensors.GNSS_GPS.GNSS_GPS_Sensor.GNSS_GPS_Sensor',
+            'WIFI': 'sensors.Wifi.WifiSensor.WifiSensor',
+            'BLUE': 'sensors.Bluetooth.BluetoothSensor.BluetoothSensor',
+            'BLE4': 'sensors.BLE4.BLE4Sensor.BLE4Sensor',
+            'SOUN': 'sensors.Sound.SoundSensor.SoundSensor',
+            'RFID': 'sensors.RFID_Reader.RFID_ReaderSensor.RFID_ReaderSensor',
+            'IMUX': 'sensors.IMU_XSens.IMU_XSensSensor.IMU_XSensSensor',
+            'IMUL': 'sensors.IMU_LPMS_B.IMU_LPMS_B_Sensor.IMU_LPMS_B_Sensor',
+            'POSI': 'sensors.POSI.POSI_Sensor.POSI_Sensor'
+        })
+        self.error_options = (max_error_examples, quarantine_file, error_budget)
+        self.start_run()
+
+    def start_run(self) -> None:
+        """
+        Reset the metrics and the parse errors at the start of a run.
+        """
+        self.metrics = PipelineMetrics()
+        self.error_collector = ParseErrorCollector(*self.error_options)
+
+    def finish_run(self) -> None:
+        """
+        Save the quarantined lines, print the parse error summary and count the errors of a run.
+        """
+        self.error_collector.finish()
+        self.metrics.count_errors(self.error_collector.category_counts, self.error_collector.tag_counts)
 
-    def parser(self, file_source: str, target_sensor: Optional[str] = None, include_calculated: bool = False) -> None:
+    def parser(self, file_source: str, target_sensor: Optional[str] = None, include_calculated: bool = False,
+               columnar: bool = False, stream: bool = False, jobs: int = 1,
+               export_dir: Optional[str] = None, export_format: str = 'csv',
+               compression: Optional[str] = None, use_cache: bool = True,
+               float_precision: Optional[int] = None, include_timestamps: bool = False) -> Dict[str, int]:
         """
         Parse and export sensor data from a source file.
 
@@ -75,26 +109,730 @@ class SensorDataParser:
             target_sensor (str, optional): Name of the specific sensor to export data for.
                 If None, data for all sensors will be processed.
             include_calculated (bool): Whether to include calculated values in the export.
+            columnar (bool): Whether to parse into per-sensor columnar tables instead of
+                a list of sensor objects.
+            stream (bool): Whether to write the CSV file(s) while the source file is being
+                read, keeping memory usage constant regardless of the file size.
+            jobs (int): The number of worker processes to parse the source file with.
+                More than one job always parses into columnar tables.
+            export_dir (str, optional): Directory to write the CSV file(s) into.
+                If None, a timestamped directory (all sensors) or the current directory
+                (single sensor) is used.
+            export_format (str): The file format to export, 'csv' or one of the binary
+                columnar formats 'parquet', 'feather' and 'npz'.
+            compression (str, optional): The compression codec of a binary format.
+                If None, the default codec of the format is used.
+            use_cache (bool): Whether to load the parsed data from the parse cache when the
+                source file was parsed before, and to store it there otherwise.
+            float_precision (int, optional): Number of decimals of the float values in the
+                CSV file(s). If None, floats are written in full.
+            include_timestamps (bool): Whether to export the AppTimestamp and SensorTimestamp of every
+                record, and its wall-clock time from the date of creation of the logfile.
+
+        Returns:
+            Dict[str, int]: A mapping of sensor tag to its number of exported records.
+                The stage timings and counts of the run are kept in the metrics attribute.
 
         Raises:
             FileNotFoundError: If the source file does not exist.
             ValueError: If the source file is not a .txt file or if the target file is not a .csv file.
         """
+        self.start_run()
+
         # validated input parameters to ensure correct file types and sensor names
-        self.validate_input_parameters(file_source, target_sensor)
+        with self.metrics.stage('validate'):
+            self.validate_input_parameters(file_source, target_sensor)
+            if jobs < 1:
+                raise ValueError('Invalid Number of Jobs! Jobs Must Be at Least 1!')
+            if stream and jobs > 1:
+                raise ValueError('Parallel Parsing Is Not Available in Stream Mode!')
+            frame_writer = self.get_frame_writer(export_format, compression)
+            csv_writer = self.get_csv_writer(export_format, float_precision)
+            if stream and frame_writer is not None:
+                raise ValueError('Stream Mode Only Supports the CSV Format!')
+            creation_time = self.get_creation_time(file_source) if include_timestamps else None
+        self.metrics.file_size = os.path.getsize(file_source)
         
-        # parsed sensor data from the source file into a list of sensor objects
-        sensors_data = self.parse_sensor_data(file_source)
+        # pushed the requested sensor down into the readers, so lines of other sensors are never split
+        tags = [target_sensor] if target_sensor is not None else None
+
+        # streamed records of the requested sensors straight into the csv file(s), parsing and exporting in one stage
+        if stream:
+            with self.metrics.stage('stream'):
+                export_counts = self.export_sensor_data(self.iter_records(file_source, tags), target_sensor,
+                                                        include_calculated, export_dir, csv_writer=csv_writer,
+                                                        include_timestamps=include_timestamps,
+                                                        creation_time=creation_time)
+            self.metrics.count_records(export_counts)
+            print(f"\n[INFO] Streamed Total {sum(export_counts.values())} Lines")
+            self.finish_run()
+            return export_counts
+
+        # parsed sensor data from the source file into sensor objects or columnar tables
+        with self.metrics.stage('parse'):
+            if columnar or jobs > 1:
+                sensors_data = self.parse_sensor_tables(file_source, jobs, use_cache, tags)
+            elif use_cache:
+                # created the sensor objects lazily from the (cached) columnar tables
+                sensors_tables = self.parse_sensor_tables(file_source, jobs, use_cache, tags)
+                sensors_data = chain.from_iterable(sensor_table.records() for sensor_table in sensors_tables.values())
+            else:
+                sensors_data = self.parse_sensor_data(file_source, tags)
         
         # exported parsed data to csv file(s) based on the specified parameters
-        self.export_sensor_data(sensors_data, target_sensor, include_calculated)
+        with self.metrics.stage('export'):
+            export_counts = self.export_sensor_data(sensors_data, target_sensor, include_calculated,
+                                                    export_dir, frame_writer, csv_writer,
+                                                    include_timestamps, creation_time)
+        self.metrics.count_records(export_counts)
+        self.finish_run()
+        return export_counts
+
+    def parse_batch(self, file_sources: List[str], target_sensor: Optional[str] = None,
+                    include_calculated: bool = False, columnar: bool = False, stream: bool = False,
+                    jobs: int = 1, export_format: str = 'csv', compression: Optional[str] = None,
+                    use_cache: bool = True, float_precision: Optional[int] = None,
+                    include_timestamps: bool = False) -> List[dict]:
+        """
+        Parse and export sensor data from a batch of source files.
+
+        This function validates every source file upfront, then schedules the files
+        across a pool of worker processes, each running the parser function on one
+        file at a time. The CSV file(s) of each source file are written into its own
+        folder inside a timestamped batch directory, and one aggregated summary of
+        the exported records and the throughput is printed at the end. The error
+        options of this parser apply to every file, with the quarantine file of a
+        source file saved in its own folder.
+
+        Args:
+            file_sources (List[str]): Paths to the source files containing sensor data.
+            target_sensor (str, optional): Name of the specific sensor to export data for.
+                If None, data for all sensors will be processed.
+            include_calculated (bool): Whether to include calculated values in the export.
+            columnar (bool): Whether to parse into per-sensor columnar tables.
+            stream (bool): Whether to write the CSV file(s) while each source file is read.
+            jobs (int): The number of worker processes to schedule the files across.
+            export_format (str): The file format to export, 'csv', 'parquet', 'feather' or 'npz'.
+            compression (str, optional): The compression codec of a binary format.
+            use_cache (bool): Whether to use the parse cache for the source files.
+            float_precision (int, optional): Number of decimals of the float values in the
+                CSV files. If None, floats are written in full.
+            include_timestamps (bool): Whether to export the AppTimestamp and SensorTimestamp of every
+                record, and its wall-clock time from the date of creation of the logfile.
+
+        Returns:
+            List[dict]: The result of each source file, in the order of file_sources, with
+                its 'file_source', 'export_dir', 'export_counts', 'file_size', 'elapsed' and
+                'metrics'. The metrics of the whole batch are kept in the metrics attribute.
+
+        Raises:
+            FileNotFoundError: If a source file does not exist.
+            ValueError: If no source files are given, or if any input parameter is invalid.
+        """
+        self.start_run()
+
+        with self.metrics.stage('validate'):
+            if not file_sources:
+                raise ValueError('No Source Files Found!')
+            for file_source in file_sources:
+                self.validate_input_parameters(file_source, target_sensor)
+            if jobs < 1:
+                raise ValueError('Invalid Number of Jobs! Jobs Must Be at Least 1!')
+            if self.get_frame_writer(export_format, compression) is not None and stream:
+                raise ValueError('Stream Mode Only Supports the CSV Format!')
+            self.get_csv_writer(export_format, float_precision)
+
+        # gave every source file its own folder inside one batch directory
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if include_calculated:
+            timestamp = f"c_{timestamp}"
+        batch_dir = f'batch_sensors_data_{timestamp}'
+        export_dirs = []
+        for file_source in file_sources:
+            export_dir = os.path.join(batch_dir, LogFileReader.get_source_name(file_source))
+            if export_dir in export_dirs:
+                export_dir = f'{export_dir}_{len(export_dirs) + 1}'  # kept same-named files apart
+            export_dirs.append(export_dir)
+
+        print(f"[INFO] Parsing {len(file_sources)} Files With {jobs} Worker(s)...")
+        start_time = time.perf_counter()
+
+        # scheduled the source files across the worker processes
+        options = (target_sensor, include_calculated, columnar, stream, export_format, compression, use_cache,
+                   float_precision, include_timestamps, self.error_options)
+        with self.metrics.stage('batch'):
+            if jobs > 1:
+                with ProcessPoolExecutor(max_workers=jobs) as executor:
+                    batch_results = list(executor.map(parse_sensor_file, file_sources, export_dirs, repeat(options)))
+            else:
+                batch_results = [parse_sensor_file(file_source, export_dir, options)
+                                 for file_source, export_dir in zip(file_sources, export_dirs)]
+        for result in batch_results:
+            self.metrics.add_file(result['metrics'])
+
+        self.print_batch_summary(batch_results, time.perf_counter() - start_time)
+        print(f"[INFO] Exported Data Saved in '{batch_dir}'")
+        return batch_results
+
+    def print_batch_summary(self, batch_results: List[dict], elapsed: float) -> None:
+        """
+        Print the aggregated summary of a batch run.
+
+        The summary holds one row per source file with its number of exported records
+        per sensor, followed by the totals and the overall throughput of the batch.
+
+        Args:
+            batch_results (List[dict]): The per-file results returned by parse_batch.
+            elapsed (float): The wall time of the whole batch in seconds.
+        """
+        # listed only the sensors exported from at least one file, in the order of the sensors list
+        summary_tags = [tag for tag in self.SENSORS
+                        if any(tag in result['export_counts'] for result in batch_results)]
+        name_width = max(len('File'), *(len(os.path.basename(result['file_source'])) for result in batch_results))
+
+        print('\n[INFO] Batch Summary (Exported Records Per Sensor)')
+        print(f"{'File':<{name_width}}  " + ' '.join(f'{tag:>8}' for tag in summary_tags) + f"  {'Total':>9}  {'Time (s)':>8}")
+        for result in batch_results:
+            counts = result['export_counts']
+            print(f"{os.path.basename(result['file_source']):<{name_width}}  "
+                  + ' '.join(f'{counts.get(tag, 0):>8}' for tag in summary_tags)
+                  + f"  {sum(counts.values()):>9}  {result['elapsed']:>8.2f}")
+
+        total_counts = {tag: sum(result['export_counts'].get(tag, 0) for result in batch_results) for tag in summary_tags}
+        total_records = sum(total_counts.values())
+        print(f"{'Total':<{name_width}}  " + ' '.join(f'{total_counts[tag]:>8}' for tag in summary_tags)
+              + f"  {total_records:>9}  {elapsed:>8.2f}")
+
+        total_megabytes = sum(result['file_size'] for result in batch_results) / (1024 * 1024)
+        print(f"\n[INFO] Throughput: {len(batch_results) / elapsed:.2f} Files/s, {total_records / elapsed:.0f} Records/s, "
+              f"{total_megabytes / elapsed:.2f} MB/s")
+
+    def follow_sensor_data(self, file_source: str, target_sensor: Optional[str] = None,
+                           include_calculated: bool = False, export_dir: Optional[str] = None,
+                           poll_interval: Optional[float] = None, idle_timeout: Optional[float] = None,
+                           float_precision: Optional[int] = None, include_timestamps: bool = False) -> Dict[str, int]:
+        """
+        Follow a logfile that is still being recorded and export its new lines.
+
+        This function keeps checking the source file for appended data, parses only
+        the newly appended complete lines into columnar tables, and appends their rows
+        to one CSV file per sensor in the export directory. After every step the byte
+        offset reached is saved in a checkpoint file next to the CSV files, so a
+        restarted process resumes where the previous one stopped instead of parsing
+        the whole file again.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            target_sensor (str, optional): Name of the specific sensor to export data for.
+                If None, data for all sensors will be processed.
+            include_calculated (bool): Whether to include calculated values in the export.
+            export_dir (str, optional): Directory to append the CSV file(s) to. If None,
+                'follow_sensors_data_<source name>' is used.
+            poll_interval (float, optional): Seconds to wait between two checks for new
+                lines. Defaults to FOLLOW_POLL_INTERVAL.
+            idle_timeout (float, optional): Stop after this many seconds without new
+                lines. If None, follow until interrupted with Ctrl+C.
+            float_precision (int, optional): Number of decimals of the float values in the
+                CSV file(s). If None, floats are written in full.
+            include_timestamps (bool): Whether to export the AppTimestamp and SensorTimestamp of every
+                record, and its wall-clock time from the date of creation of the logfile.
+
+        Returns:
+            Dict[str, int]: A mapping of sensor tag to its total number of exported records.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+            ValueError: If an input parameter is invalid, if the source file is compressed,
+                or if the checkpoint does not match the source file or the options.
+        """
+        self.start_run()
+        with self.metrics.stage('validate'):
+            self.validate_input_parameters(file_source, target_sensor)
+            if LogFileReader.get_compression(file_source) is not None:
+                raise ValueError('Follow Mode Only Supports Uncompressed .txt Files!')
+            self.get_csv_writer('csv', float_precision)
+        poll_interval = self.FOLLOW_POLL_INTERVAL if poll_interval is None else poll_interval
+
+        if export_dir is None:
+            source_name = LogFileReader.get_source_name(file_source)
+            export_dir = f"follow_sensors_data_{'c_' if include_calculated else ''}{source_name}"
+        os.makedirs(export_dir, exist_ok=True)
+
+        checkpoint = self.load_follow_checkpoint(file_source, target_sensor, include_calculated, export_dir,
+                                                 float_precision, include_timestamps)
+        print(f"[INFO] Following '{file_source}' From Byte {checkpoint['offset']}, Press Ctrl+C to Stop")
+
+        # parsed the appended lines in steps until interrupted or idle for too long
+        last_data_time = time.monotonic()
+        start_offset, start_counts = checkpoint['offset'], dict(checkpoint['export_counts'])
+        try:
+            while True:
+                with self.metrics.stage('follow'):
+                    new_lines = self.follow_step(file_source, target_sensor, include_calculated, export_dir, checkpoint)
+                if new_lines:
+                    last_data_time = time.monotonic()
+                elif idle_timeout is not None and time.monotonic() - last_data_time >= idle_timeout:
+                    break
+                time.sleep(poll_interval)
+        except KeyboardInterrupt:
+            print("\n[INFO] Stopped Following")
+
+        # counted only the bytes and records parsed by this process
+        export_counts = checkpoint['export_counts']
+        self.metrics.file_size = checkpoint['offset'] - start_offset
+        self.metrics.count_records({tag: count - start_counts.get(tag, 0) for tag, count in export_counts.items()})
+        self.finish_run()
+        for tag in self.SENSORS:
+            if tag in export_counts:
+                print(f"[INFO] Exported Total {export_counts[tag]} Records For Sensor {tag.upper()}")
+        print(f"[INFO] Exported Data Saved in '{export_dir}'")
+        return export_counts
+
+    def follow_step(self, file_source: str, target_sensor: Optional[str], include_calculated: bool,
+                    export_dir: str, checkpoint: dict) -> int:
+        """
+        Parse and export the complete lines appended since the checkpoint.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            target_sensor (str, optional): Name of the specific sensor to export data for.
+            include_calculated (bool): Whether to include calculated values in the export.
+            export_dir (str): Directory of the CSV file(s) to append to.
+            checkpoint (dict): The checkpoint of the follow mode, updated and saved in place.
+
+        Returns:
+            int: The number of new complete lines that were parsed.
+
+        Raises:
+            ValueError: If the source file became smaller than the checkpoint offset.
+        """
+        offset = checkpoint['offset']
+        file_size = os.path.getsize(file_source)
+        if file_size < offset:
+            raise ValueError('Source File Is Smaller Than the Checkpoint! Was It Replaced?')
+        if file_size == offset:
+            return 0
+
+        with open(file_source, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # skipped the preamble when the file was read for the first time
+            if offset == 0:
+                offset, preamble_lines = LogFileReader(file_source).find_data_offset(mapped)
+                checkpoint['line_number'] = preamble_lines
+
+            # stopped after the last complete line, leaving a partly written line for the next step
+            end = mapped.rfind(b'\n', offset) + 1
+        if end <= offset:
+            return 0
+
+        tags = [target_sensor] if target_sensor is not None else None
+        sensors_tables, range_lines, parse_errors = self.parse_sensor_range(file_source, (offset, end), tags)
+        self.error_collector.add_errors(parse_errors, checkpoint['line_number'])
+        self.metrics.lines += range_lines
+
+        appended_records = self.append_sensor_tables(sensors_tables, target_sensor, include_calculated,
+                                                     export_dir, checkpoint)
+
+        checkpoint['offset'] = end
+        checkpoint['line_number'] += range_lines
+        self.save_follow_checkpoint(export_dir, checkpoint)
+
+        print(f"[INFO] Appended {appended_records} Records From {range_lines} New Lines "
+              f"(Up to Line {checkpoint['line_number']})")
+        return range_lines
+
+    def append_sensor_tables(self, sensors_tables: Dict[str, SensorTable], target_sensor: Optional[str],
+                             include_calculated: bool, export_dir: str, checkpoint: dict) -> int:
+        """
+        Append the rows of parsed tables to the CSV file of their sensor.
+
+        The row indices continue from the records already exported, and a CSV file
+        is created with its header line when a sensor is seen for the first time,
+        replacing rows a killed process left behind before it saved a checkpoint.
+
+        Args:
+            sensors_tables (Dict[str, SensorTable]): A mapping of sensor tag to its new rows.
+            target_sensor (str, optional): Name of the specific sensor to export data for.
+            include_calculated (bool): Whether to include calculated values in the export.
+            export_dir (str): Directory of the CSV file(s) to append to.
+            checkpoint (dict): The checkpoint of the follow mode, whose record counts and
+                file sizes are updated in place, and whose float precision and timestamp
+                options are used.
+
+        Returns:
+            int: The number of appended records.
+        """
+        csv_writer = SensorCsvWriter(checkpoint.get('float_precision'))
+        include_timestamps = checkpoint.get('include_timestamps', False)
+        export_counts = checkpoint['export_counts']
+        export_sizes = checkpoint['export_sizes']
+
+        appended_records = 0
+        export_tags = [target_sensor] if target_sensor is not None else self.SENSORS
+        for tag in export_tags:
+            sensor_table = sensors_tables.get(tag)
+            if not sensor_table:
+                continue
+
+            export_count = export_counts.get(tag, 0)
+            with open(os.path.join(export_dir, f'{tag.upper()}_sensor.csv'), 'w' if export_count == 0 else 'a') as file:
+                if export_count == 0:
+                    file.write(f"{self.sensor_class_map[tag].get_headers(include_calculated, include_timestamps)}\n")
+                csv_writer.write_columns(file, sensor_table.export_columns(include_calculated, export_count + 1,
+                                                                           include_timestamps,
+                                                                           checkpoint.get('creation_time')))
+                export_sizes[tag] = file.tell()
+
+            export_counts[tag] = export_count + len(sensor_table)
+            appended_records += len(sensor_table)
+        return appended_records
+
+    def load_follow_checkpoint(self, file_source: str, target_sensor: Optional[str], include_calculated: bool,
+                               export_dir: str, float_precision: Optional[int] = None,
+                               include_timestamps: bool = False) -> dict:
+        """
+        Load the checkpoint of the follow mode, or create a new one.
+
+        When resuming, every CSV file is truncated to the size recorded in the
+        checkpoint, so rows that were written after the last saved checkpoint (e.g.
+        by a process that was killed) are not exported twice. A CSV file that no
+        longer exists is started over with the records parsed from then on.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            target_sensor (str, optional): Name of the specific sensor to export data for.
+            include_calculated (bool): Whether to include calculated values in the export.
+            export_dir (str): Directory of the CSV file(s) and the checkpoint.
+            float_precision (int, optional): Number of decimals of the float values in the
+                CSV file(s), or None to write floats in full.
+            include_timestamps (bool): Whether to export the timestamps and the wall-clock time.
+
+        Returns:
+            dict: The checkpoint with the 'offset' and 'line_number' reached in the source
+                file, the 'export_counts' and 'export_sizes' of every CSV file and the
+                'creation_time' of the logfile used for the wall-clock time.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another source file or other options.
+        """
+        checkpoint_path = os.path.join(export_dir, self.FOLLOW_CHECKPOINT_FILE)
+        options = {
+            'file_source': os.path.abspath(file_source),
+            'target_sensor': target_sensor,
+            'include_calculated': include_calculated,
+            'float_precision': float_precision,
+            'include_timestamps': include_timestamps
+        }
+
+        if not os.path.exists(checkpoint_path):
+            creation_time = self.get_creation_time(file_source) if include_timestamps else None
+            return {**options, 'offset': 0, 'line_number': 0, 'export_counts': {}, 'export_sizes': {},
+                    'creation_time': creation_time}
+
+        with open(checkpoint_path) as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        checkpoint.setdefault('include_timestamps', False)  # checkpoints of older versions never exported them
+        if any(checkpoint.get(key) != value for key, value in options.items()):
+            raise ValueError(f'Checkpoint in {export_dir} Was Created for Another Source File or Other Options!')
+
+        # dropped rows written after the checkpoint was saved
+        for tag, export_size in list(checkpoint['export_sizes'].items()):
+            csv_path = os.path.join(export_dir, f'{tag.upper()}_sensor.csv')
+            if not os.path.exists(csv_path):
+                print(f"[INFO] '{csv_path}' No Longer Exists, Starting It Over")
+                del checkpoint['export_sizes'][tag]
+                checkpoint['export_counts'].pop(tag, None)
+                continue
+            with open(csv_path, 'r+') as file:
+                file.truncate(export_size)
+        return checkpoint
+
+    def save_follow_checkpoint(self, export_dir: str, checkpoint: dict) -> None:
+        """
+        Save the checkpoint of the follow mode.
+
+        The checkpoint is written to a temporary file first and then moved over the
+        previous one, so an interrupted save never leaves a broken checkpoint behind.
+
+        Args:
+            export_dir (str): Directory of the CSV file(s) and the checkpoint.
+            checkpoint (dict): The checkpoint to save.
+        """
+        checkpoint_path = os.path.join(export_dir, self.FOLLOW_CHECKPOINT_FILE)
+        with open(f'{checkpoint_path}.tmp', 'w') as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file, indent=4)
+        os.replace(f'{checkpoint_path}.tmp', checkpoint_path)
+
+    def build_index(self, file_source: str, checkpoint_interval: Optional[float] = None) -> 'LogFileIndex':
+        """
+        Build the sidecar index of a logfile and save it next to the logfile.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            checkpoint_interval (float, optional): Seconds of AppTimestamp between two
+                checkpoints of the index. Defaults to LogFileIndex.CHECKPOINT_INTERVAL.
+
+        Returns:
+            LogFileIndex: The index of the source file.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+            ValueError: If the source file is invalid or compressed.
+        """
+        self.start_run()
+        with self.metrics.stage('validate'):
+            self.validate_input_parameters(file_source, None)
+        self.metrics.file_size = os.path.getsize(file_source)
+
+        # imported the index (and numpy) only for the runs that use it
+        from sensors.IO.LogFileIndex import LogFileIndex
+
+        start_time = time.perf_counter()
+        with self.metrics.stage('index'):
+            index = LogFileIndex.build(file_source, self.SENSORS, checkpoint_interval)
+            index.save()
+
+        indexed_lines = sum(len(offsets) for offsets in index.tag_offsets.values())
+        self.metrics.lines = indexed_lines
+        print(f"[INFO] Indexed {indexed_lines} Lines of {len(index.tag_offsets)} Sensors With "
+              f"{len(index.checkpoint_offsets)} Checkpoints in {time.perf_counter() - start_time:.2f}s")
+        print(f"[INFO] Index Saved in '{LogFileIndex.get_index_path(file_source)}'")
+        return index
+
+    def query(self, file_source: str, tags: Optional[Iterable[str]] = None, time_from: Optional[float] = None,
+              time_to: Optional[float] = None, include_calculated: bool = False, export_dir: Optional[str] = None,
+              export_format: str = 'csv', compression: Optional[str] = None,
+              float_precision: Optional[int] = None, include_timestamps: bool = False) -> Dict[str, int]:
+        """
+        Parse and export the data of some sensors in a time window, using the sidecar index.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            tags (Iterable[str], optional): Sensor tags to export. If None, all sensors are exported.
+            time_from (float, optional): First AppTimestamp (s) to export, or None for the start.
+            time_to (float, optional): Last AppTimestamp (s) to export, or None for the end.
+            include_calculated (bool): Whether to include calculated values in the export.
+            export_dir (str, optional): Directory to write the exported file(s) into.
+                If None, a timestamped directory is used.
+            export_format (str): The file format to export, 'csv', 'parquet', 'feather' or 'npz'.
+            compression (str, optional): The compression codec of a binary format.
+            float_precision (int, optional): Number of decimals of the float values in the
+                CSV file(s). If None, floats are written in full.
+            include_timestamps (bool): Whether to export the AppTimestamp and SensorTimestamp of every
+                record, and its wall-clock time from the date of creation of the logfile.
+
+        Returns:
+            Dict[str, int]: A mapping of sensor tag to its number of exported records.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+            ValueError: If an input parameter is invalid or if the source file is compressed.
+        """
+        self.start_run()
+
+        with self.metrics.stage('validate'):
+            tags = list(tags) if tags is not None else self.SENSORS
+            for tag in tags:
+                self.validate_input_parameters(file_source, tag)
+            if time_from is not None and time_to is not None and time_from > time_to:
+                raise ValueError('Invalid Time Window! The Start Must Not Be After the End!')
+            frame_writer = self.get_frame_writer(export_format, compression)
+            csv_writer = self.get_csv_writer(export_format, float_precision)
+            creation_time = self.get_creation_time(file_source) if include_timestamps else None
+        self.metrics.file_size = os.path.getsize(file_source)
+
+        with self.metrics.stage('parse'):
+            sensors_tables = self.parse_sensor_slice(file_source, tags, time_from, time_to)
+        with self.metrics.stage('export'):
+            export_counts = self.export_sensor_data(sensors_tables, None, include_calculated, export_dir,
+                                                    frame_writer, csv_writer, include_timestamps, creation_time)
+        self.metrics.count_records(export_counts)
+        self.finish_run()
+        return export_counts
+
+    def parse_sensor_slice(self, file_source: str, tags: Iterable[str], time_from: Optional[float] = None,
+                           time_to: Optional[float] = None) -> Dict[str, SensorTable]:
+        """
+        Parse the data lines of some sensors in a time window into columnar tables.
+
+        The sidecar index of the source file (built and saved first if it is missing
+        or outdated) gives the byte offsets of the requested lines, so only those
+        lines are read and parsed.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            tags (Iterable[str]): Sensor tags to parse.
+            time_from (float, optional): First AppTimestamp (s) to parse, or None for the start.
+            time_to (float, optional): Last AppTimestamp (s) to parse, or None for the end.
+
+        Returns:
+            Dict[str, SensorTable]: A mapping of sensor tag to its parsed table, for every
+                requested sensor with lines in the time window.
+        """
+        from sensors.IO.LogFileIndex import LogFileIndex
+        index = LogFileIndex.open(file_source, self.SENSORS)
+
+        sensors_tables = {}  # mapping of sensor tag to its columnar table
+        for tag, lines in index.read_lines(tags, time_from, time_to).items():
+            sensor_table = sensors_tables[tag] = SensorTable(tag, self.sensor_class_map[tag])
+            self.metrics.lines += len(lines)
+
+            # converted the lines in bulk, or line by line to skip bad lines
+            try:
+                sensor_table.extend_lines(lines)
+            except Exception:
+                for line in lines:
+                    try:
+                        sensor_table.append(line.strip().split(b';')[1:])
+                    except Exception as e:
+                        category = ParseErrorCollector.categorize(e, line, len(sensor_table.sensor_class.FIELDS))
+                        self.error_collector.add((None, tag, category, str(e), line))  # the index keeps no line numbers
+
+        total_records = sum(len(sensor_table) for sensor_table in sensors_tables.values())
+        print(f"[INFO] Parsed Total {total_records} Lines From the Index\n")
+        return sensors_tables
+
+    def align_sensor_data(self, file_source: str, tags: Optional[Iterable[str]] = None, rate: Optional[float] = None,
+                          method: str = 'linear', time_base: str = 'app', tolerance: Optional[float] = None,
+                          include_calculated: bool = False, export_dir: Optional[str] = None,
+                          export_format: str = 'csv', compression: Optional[str] = None,
+                          float_precision: Optional[int] = None, use_cache: bool = False) -> 'pd.DataFrame':
+        """
+        Parse several sensors, align them onto a common time grid and export them as one file.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            tags (Iterable[str], optional): Sensor tags to align. If None, the motion, pressure and
+                GNSS sensors present in the source file are aligned.
+            rate (float, optional): Sampling rate of the time grid in Hz (default: 100).
+            method (str): Sampling method, 'nearest', 'linear' or 'asof'.
+            time_base (str): Time base of the alignment, 'app' (AppTimestamp) or 'sensor' (SensorTimestamp).
+            tolerance (float, optional): Maximum distance in seconds between a grid time and the
+                sample(s) it is taken from, beyond which the value is left empty.
+            include_calculated (bool): Whether to align the numeric calculated values as well.
+            export_dir (str, optional): Directory to write the exported file into.
+                If None, the file is written into the current directory.
+            export_format (str): The file format to export, 'csv', 'parquet', 'feather' or 'npz'.
+            compression (str, optional): The compression codec of a binary format.
+            float_precision (int, optional): Number of decimals of the float values in the
+                CSV file. If None, floats are written in full.
+            use_cache (bool): Whether to load the parsed tables from the parse cache.
+
+        Returns:
+            pd.DataFrame: The aligned sensor data, with a 'time' column and one column per sensor field.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+            ValueError: If an input parameter is invalid, or if the sensors cannot be aligned.
+        """
+        # imported the aligner (and numpy and pandas) only for the runs that align
+        from sensors.Fusion.SensorAligner import SensorAligner
+
+        self.start_run()
+
+        with self.metrics.stage('validate'):
+            tags = list(tags) if tags is not None else None
+            for tag in tags or [None]:
+                self.validate_input_parameters(file_source, tag)
+            aligner = SensorAligner(rate, method, time_base, tolerance)
+            frame_writer = self.get_frame_writer(export_format, compression)
+            csv_writer = self.get_csv_writer(export_format, float_precision)
+        self.metrics.file_size = os.path.getsize(file_source)
+
+        with self.metrics.stage('parse'):
+            sensors_tables = self.parse_sensor_tables(file_source, use_cache=use_cache,
+                                                      tags=tags or SensorAligner.DEFAULT_TAGS)
+        with self.metrics.stage('align'):
+            aligned_data = aligner.align(sensors_tables, tags, include_calculated)
+        print(f"[INFO] Aligned {len(aligned_data.columns) - 1} Columns Onto {len(aligned_data)} Grid Times "
+              f"({aligner.rate:g} Hz, {aligner.method}, {aligner.time_base} time)")
+
+        with self.metrics.stage('export'):
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            extension = frame_writer.get_extension() if frame_writer is not None else '.csv'
+            file_name = f'ALIGNED_sensors_{timestamp}{extension}'
+            if export_dir is not None:
+                os.makedirs(export_dir, exist_ok=True)
+                file_name = f'{export_dir}/{file_name}'
+
+            headers = ','.join(aligned_data.columns)
+            if frame_writer is not None:
+                # kept the text columns as lists, so they are written as strings instead of objects
+                columns = [aligned_data[column] for column in aligned_data.columns]
+                frame_writer.write(file_name, headers, [column.tolist() if column.dtype == object else column.to_numpy()
+                                                        for column in columns])
+            else:
+                with open(file_name, 'w') as file:
+                    file.write(f"{headers}\n")
+                    csv_writer.write_columns(file, [aligned_data[column].tolist() for column in aligned_data.columns])
+        print(f"[INFO] Exported {len(aligned_data)} Aligned Records in '{file_name}'")
+
+        self.metrics.count_records({tag: len(sensor_table) for tag, sensor_table in sensors_tables.items()})
+        self.finish_run()
+        return aligned_data
+
+    def get_creation_time(self, file_source: str) -> Optional[float]:
+        """
+        Get the date of creation of a logfile, the origin of its AppTimestamps.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+
+        Returns:
+            float | None: The date of creation as Unix time in seconds, or None if the
+                preamble has no date of creation.
+        """
+        creation_time = LogFileReader(file_source).read_creation_time()
+        if creation_time is None:
+            print("[INFO] No Date of Creation Found in the Logfile Preamble, Exporting an Empty Wall-Clock Time")
+        return creation_time
+
+    def get_frame_writer(self, export_format: str, compression: Optional[str]) -> Optional[SensorFrameWriter]:
+        """
+        Get the writer of a binary columnar export format.
+
+        Args:
+            export_format (str): The file format to export, 'csv', 'parquet', 'feather' or 'npz'.
+            compression (str, optional): The compression codec of a binary format.
+
+        Returns:
+            SensorFrameWriter | None: The writer of the format, or None for CSV.
+
+        Raises:
+            ValueError: If the format or the compression codec is not supported.
+        """
+        if export_format == 'csv':
+            if compression is not None:
+                raise ValueError('Compression Is Not Available For the CSV Format!')
+            return None
+        return SensorFrameWriter(export_format, compression)
+
+    def get_csv_writer(self, export_format: str, float_precision: Optional[int]) -> SensorCsvWriter:
+        """
+        Get the writer of the CSV format.
+
+        Args:
+            export_format (str): The file format to export, 'csv', 'parquet', 'feather' or 'npz'.
+            float_precision (int, optional): Number of decimals of the float values in the
+                CSV file(s). If None, floats are written in full.
+
+        Returns:
+            SensorCsvWriter: The CSV writer with the float precision.
+
+        Raises:
+            ValueError: If a float precision is given for a binary format, or if it is negative.
+        """
+        if export_format != 'csv' and float_precision is not None:
+            raise ValueError('Float Precision Is Only Available For the CSV Format!')
+        return SensorCsvWriter(float_precision)
 
     def validate_input_parameters(self, file_source: str, target_sensor: Optional[str]) -> None:
         """
         Validate the input parameters for the parser function.
 
         This function performs several checks:
-        1. Ensures the source file has a .txt extension
+        1. Ensures the source file has a .txt extension, optionally followed by a
+           .gz, .bz2, .xz or .zst compression extension
         2. Verifies that the source file exists
         3. If a target file is specified, ensures it has a .csv extension
         4. If a target sensor is specified, ensures it's a valid sensor type
@@ -108,8 +846,8 @@ class SensorDataParser:
             FileNotFoundError: If the source file does not exist.
         """
         # checked if the source file had a .txt extension to ensure correct file format
-        if not file_source.endswith('.txt'):
-            raise ValueError('Invalid File Type! Source File Must Be .txt!')
+        if not LogFileReader.is_supported(file_source):
+            raise ValueError('Invalid File Type! Source File Must Be .txt, .txt.gz, .txt.bz2, .txt.xz or .txt.zst!')
         
         # verified that the source file existed to prevent processing non-existent files
         if not os.path.exists(file_source):
@@ -119,143 +857,559 @@ class SensorDataParser:
         if target_sensor is not None and target_sensor not in self.SENSORS:
             raise ValueError(f'Invalid Sensor! Available Sensors: {", ".join(self.SENSORS)}')
 
-    def parse_sensor_data(self, file_source: str) -> List:
+    def parse_sensor_data(self, file_source: str, tags: Optional[Iterable[str]] = None) -> List:
         """
         Parse sensor data from the source file.
 
-        This function reads the source file line by line, skipping header lines,
-        and creates appropriate sensor objects based on the data in each line.
+        This function collects every sensor object yielded by iter_records into a list.
 
         Args:
             file_source (str): Path to the source file containing sensor data.
+            tags (Iterable[str], optional): Sensor tags to parse. Lines of other sensors
+                are skipped without being split or converted. If None, all sensors are parsed.
 
         Returns:
             List: A list of parsed sensor objects.
         """
-        sensors_data = []  # list to store all the parsed sensors data 
-
-        # opened and read the source file to process sensor data
-        with open(file_source, 'r') as file:
-            for line_number, line in enumerate(file, 1):
-                # skipped header lines to focus on actual data
-                if line_number <= self.HEADER_LINES:
-                    continue
-                
-                # parsed each line into sensor type and values for object creation
-                data_row = line.strip().split(';')
-                sensor_type = data_row[0]
-                sensor_values = data_row[1:]
-
-                # created a sensor object based on the sensor tag and appended it to sensors_data list
-                sensor_class = self.sensor_class_map.get(sensor_type)
+        sensors_data = list(self.iter_records(file_source, tags))  # list to store all the parsed sensors data
+
+        print(f"[INFO] Parsed Total {len(sensors_data)} Lines\n")
+        return sensors_data
+
+    def iter_records(self, file_source: str, tags: Optional[Iterable[str]] = None) -> Iterator:
+        """
+        Lazily parse sensor data from the source file.
+
+        This function reads the source file line by line, skipping the header preamble,
+        and yields a sensor object for each data line as soon as it is parsed, so
+        records can be consumed without holding the whole file in memory.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            tags (Iterable[str], optional): Sensor tags to yield records for.
+                If None, records of all sensors are yielded.
+
+        Yields:
+            SensorBase: A parsed sensor object for each valid data line, in file order.
+        """
+        # mapped the raw tag prefix of each requested sensor to its class for byte-level dispatch
+        sensor_prefix_map = self.get_sensor_prefix_map(tags)
+        prefix_length = LogFileReader.TAG_PREFIX_LENGTH
+
+        read_lines = 0
+        try:
+            # read the data lines of the source file past its preamble
+            for line_number, line in LogFileReader(file_source, tags).iter_lines():
+                read_lines += 1
+                # dispatched the line on its first bytes, skipping lines of other sensors undecoded
+                sensor_class = sensor_prefix_map.get(line[:prefix_length])
                 if sensor_class:
+                    # parsed the line into sensor values and created a sensor object from them
                     try:
-                        sensors_data.append(sensor_class(*sensor_values))
+                        sensor_values = line.decode('utf-8').strip().split(';')[1:]
+                        sensor = sensor_class(*sensor_values)
                     except Exception as e:
-                        print(f"Error parsing line {line_number}: {e}")
+                        tag = line[:prefix_length - 1].decode()
+                        category = ParseErrorCollector.categorize(e, line, len(sensor_class.FIELDS))
+                        self.error_collector.add((line_number, tag, category, str(e), line))
+                        continue
+                    yield sensor
+        finally:
+            # counted the lines read so far, even if the records were not consumed to the end
+            self.metrics.lines += read_lines
 
-        print(f"[INFO] Parsed Total {len(sensors_data)} Lines\n")
-        return sensors_data
+    def parse_sensor_tables(self, file_source: str, jobs: int = 1, use_cache: bool = False,
+                            tags: Optional[Iterable[str]] = None) -> Dict[str, SensorTable]:
+        """
+        Parse sensor data from the source file into per-sensor columnar tables.
+
+        This function splits the data lines of the source file into newline-aligned
+        byte ranges, parses each range into columnar chunks with parse_sensor_range
+        (in worker processes if more than one job is requested), and merges the
+        chunks back in their original order, so the result does not depend on the
+        number of jobs. With the parse cache, the tables of a source file with the
+        same contents are loaded from the cache instead of being parsed again. The
+        cache keeps the tables of all sensors of a file (a cache miss parses all of
+        them), so an entry stored by any run serves the runs of any sensors, e.g. the
+        analyzer of one sensor after a full export.
+
+        The lines that failed to parse are collected by the error collector of the
+        run. With an error budget, every range stops parsing as soon as it alone has
+        more bad lines than the budget, and the run is aborted once the errors of
+        all ranges together exceed it.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            jobs (int): The number of worker processes to parse the file with.
+            use_cache (bool): Whether to load the tables from the parse cache, and to
+                store them there after parsing on a cache miss.
+            tags (Iterable[str], optional): Sensor tags to parse. Lines of other sensors
+                are skipped without being split or converted (unless all sensors are parsed
+                for the parse cache). If None, all sensors are parsed.
+
+        Returns:
+            Dict[str, SensorTable]: A mapping of sensor tag to its parsed table, for
+                every requested sensor tag present in the source file.
+
+        Raises:
+            ValueError: If more lines failed to parse than the error budget allows.
+        """
+        if tags is not None:
+            tags = list(tags)
+
+        requested_tags = tags
+        error_budget = self.error_collector.error_budget
+        parse_cache = None
+        if use_cache:
+            # imported the parse cache (and numpy) only for the runs that use it
+            from sensors.IO.SensorParseCache import SensorParseCache
+            parse_cache = SensorParseCache()
+            cache_key = parse_cache.get_key(file_source, self.PARSER_VERSION)
+            cached = parse_cache.load(cache_key, self.sensor_class_map)
+            if cached is not None:
+                sensors_tables, parse_errors = self.select_sensor_tables(*cached, requested_tags)
+                self.error_collector.add_errors(parse_errors)
+                total_records = sum(len(sensor_table) for sensor_table in sensors_tables.values())
+                self.metrics.lines += total_records + len(parse_errors)  # the cache does not keep lines of other sensors
+                print(f"[INFO] Loaded Total {total_records} Lines From Parse Cache\n")
+                return sensors_tables
+
+            # parsed all sensors for the cache entry, counting only the bad lines of the requested ones
+            # against the error budget of the run
+            if tags is not None:
+                tags, error_budget = None, None
+
+        preamble_lines, data_ranges = LogFileReader(file_source).split_data_ranges(jobs)
 
-    def export_sensor_data(self, sensors_data: List, target_sensor: Optional[str], include_calculated: bool) -> None:
+        # parsed each byte range into columnar chunks, in parallel if requested
+        if jobs > 1 and len(data_ranges) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                chunks = list(executor.map(parse_sensor_chunk, repeat(file_source), data_ranges, repeat(tags),
+                                           repeat(error_budget)))
+        else:
+            chunks = [self.parse_sensor_range(file_source, data_range, tags, error_budget) for data_range in data_ranges]
+
+        sensors_tables = {}  # mapping of sensor tag to its columnar table
+        parse_errors = []  # every line that failed to parse, with its file line number
+
+        # merged the chunks in file order, turning range line numbers into file line numbers
+        line_offset = preamble_lines
+        for chunk_tables, chunk_lines, chunk_errors in chunks:
+            chunk_errors = [(line_offset + line_number, tag, category, message, line)
+                            for line_number, tag, category, message, line in chunk_errors]
+            self.error_collector.add_errors(parse_error for parse_error in chunk_errors
+                                            if requested_tags is None or parse_error[1] in requested_tags)
+            parse_errors.extend(chunk_errors)
+            for sensor_type, chunk_table in chunk_tables.items():
+                if sensor_type in sensors_tables:
+                    sensors_tables[sensor_type].extend_table(chunk_table)
+                else:
+                    sensors_tables[sensor_type] = chunk_table
+            line_offset += chunk_lines
+
+        self.metrics.lines += line_offset - preamble_lines
+
+        if parse_cache is not None:
+            parse_cache.store(cache_key, sensors_tables, parse_errors)
+            sensors_tables = self.select_sensor_tables(sensors_tables, parse_errors, requested_tags)[0]
+
+        total_records = sum(len(sensor_table) for sensor_table in sensors_tables.values())
+        print(f"[INFO] Parsed Total {total_records} Lines\n")
+        return sensors_tables
+
+    @staticmethod
+    def select_sensor_tables(sensors_tables: Dict[str, SensorTable], parse_errors: List[ParseError],
+                             tags: Optional[List[str]]) -> Tuple[Dict[str, SensorTable], List[ParseError]]:
+        """
+        Select the tables and parse errors of some sensors, e.g. from a cache entry of all sensors.
+
+        Args:
+            sensors_tables (Dict[str, SensorTable]): A mapping of sensor tag to its parsed table.
+            parse_errors (List[ParseError]): The lines that failed to parse.
+            tags (List[str], optional): The sensor tags to select. If None, all sensors are selected.
+
+        Returns:
+            Tuple[Dict[str, SensorTable], List[ParseError]]: The tables and the parse errors of the
+                selected sensors.
+        """
+        if tags is None:
+            return sensors_tables, parse_errors
+        return ({tag: sensor_table for tag, sensor_table in sensors_tables.items() if tag in tags},
+                [parse_error for parse_error in parse_errors if parse_error[1] in tags])
+
+    def parse_sensor_range(self, file_source: str, data_range: Tuple[int, int], tags: Optional[Iterable[str]] = None,
+                           error_budget: Optional[int] = None) -> Tuple[Dict[str, SensorTable], int, List[ParseError]]:
+        """
+        Parse one byte range of the source file into per-sensor columnar tables.
+
+        This function reads the range in large newline-aligned blocks, groups the
+        lines of each block by sensor tag, and converts every group column by column
+        into the SensorTable of its sensor instead of creating one sensor object per
+        line.
+
+        Args:
+            file_source (str): Path to the source file containing sensor data.
+            data_range (Tuple[int, int]): The (start, end) byte range to parse.
+            tags (Iterable[str], optional): Sensor tags to parse. If None, all sensors are parsed.
+            error_budget (int, optional): Stop parsing the range once more lines than this
+                failed to parse. If None, the whole range is parsed.
+
+        Returns:
+            Tuple[Dict[str, SensorTable], int, List[ParseError]]: The parsed tables of the
+                range, the number of lines parsed, and every line that failed to parse,
+                numbered from the start of the range.
+        """
+        sensors_tables = {}  # mapping of sensor tag to its columnar table
+        parse_errors = []  # every line that failed to parse
+        range_lines = 0
+
+        sensor_prefix_map = self.get_sensor_prefix_map(tags)
+        reader = LogFileReader(file_source, tags if tags is not None else self.SENSORS)
+
+        # read the data lines of the range one block at a time
+        for first_line_number, lines in reader.iter_blocks(data_range):
+            range_lines += len(lines)
+            for prefix, tag_lines in reader.group_lines_by_tag(lines).items():
+                # created the table of a sensor on first use
+                sensor_type = prefix[:-1].decode()
+                sensor_table = sensors_tables.get(sensor_type)
+                if sensor_table is None:
+                    sensor_table = sensors_tables[sensor_type] = SensorTable(sensor_type, sensor_prefix_map[prefix])
+
+                # converted the lines of the sensor in bulk, or line by line to skip bad lines
+                try:
+                    sensor_table.extend_lines(tag_lines)
+                except Exception:
+                    parse_errors.extend(self.append_lines(sensor_table, prefix, first_line_number, lines))
+
+            # stopped early once the range alone exceeded the error budget, as the run is aborted anyway
+            if error_budget is not None and len(parse_errors) > error_budget:
+                break
+
+        return sensors_tables, range_lines, parse_errors
+
+    def append_lines(self, sensor_table: SensorTable, prefix: bytes, first_line_number: int,
+                     lines: List[bytes]) -> List[ParseError]:
+        """
+        Convert the lines of a sensor from a block into its table one by one.
+
+        This is the fallback for blocks that failed bulk conversion, so only the
+        invalid lines are skipped and reported with their line numbers.
+
+        Args:
+            sensor_table (SensorTable): The table to append the lines to.
+            prefix (bytes): The tag prefix of the sensor lines, e.g. b'ACCE;'.
+            first_line_number (int): The line number of the first line of the block.
+            lines (List[bytes]): The raw lines of the block.
+
+        Returns:
+            List[ParseError]: The line number, tag, category, message and raw line of every
+                invalid line.
+        """
+        parse_errors = []
+        expected_fields = len(sensor_table.sensor_class.FIELDS)
+        for line_number, line in enumerate(lines, first_line_number):
+            if not line.startswith(prefix):
+                continue
+            try:
+                sensor_table.append(line.strip().split(b';')[1:])
+            except Exception as e:
+                category = ParseErrorCollector.categorize(e, line, expected_fields)
+                parse_errors.append((line_number, sensor_table.tag, category, str(e), line))
+        return parse_errors
+
+    def get_sensor_prefix_map(self, tags: Optional[Iterable[str]] = None) -> Dict[bytes, type]:
+        """
+        Get the mapping of raw data line prefix to sensor class.
+
+        Args:
+            tags (Iterable[str], optional): Sensor tags to include in the mapping.
+                If None, all sensors are included.
+
+        Returns:
+            Dict[bytes, type]: A mapping of tag prefix (e.g. b'ACCE;') to sensor class.
+        """
+        if tags is None:
+            tags = self.sensor_class_map.keys()
+        return {LogFileReader.get_tag_prefix(tag): self.sensor_class_map[tag] for tag in tags}
+
+    def export_sensor_data(self, sensors_data: Union[Iterable, Dict[str, SensorTable]], target_sensor: Optional[str],
+                           include_calculated: bool, export_dir: Optional[str] = None,
+                           frame_writer: Optional[SensorFrameWriter] = None,
+                           csv_writer: Optional[SensorCsvWriter] = None, include_timestamps: bool = False,
+                           creation_time: Optional[float] = None) -> Dict[str, int]:
         """
         Export the parsed sensor data to CSV file(s).
 
         This function handles the export process, which includes:
         1. Determining whether to export a single sensor or all sensors
         2. Creating necessary directories with timestamps
-        3. Writing data to CSV file(s) with timestamps
-        4. Handling the export process for multiple sensors if required
+        3. Routing every record to the CSV file of its sensor in a single pass, or
+           writing every columnar table as a whole
+        4. Reporting the number of exported records for each sensor
+
+        Columnar tables are exported straight from their columns, with calculated
+        values calculated from the columns instead of from a sensor object per row.
+
+        When exporting all sensors, a CSV file is only created for a sensor once its
+        first record is seen, so sensors that are absent from the source file do not
+        produce empty files.
+
+        With a frame writer, each sensor is written as one binary columnar file
+        (Parquet, Feather or NPZ) once all records have been routed. Columnar
+        tables hand their column buffers to the writer as they are, while the
+        typed row values of sensor objects are collected and transposed.
+
+        CSV lines are formatted and written in chunks by the CSV writer rather than
+        one line at a time.
 
         Args:
-            sensors_data (List): List of parsed sensor objects.
+            sensors_data (Iterable | Dict[str, SensorTable]): Parsed sensor objects,
+                or a mapping of sensor tag to its parsed columnar table.
             target_sensor (str, optional): Name of the specific sensor to export data for.
             include_calculated (bool): Whether to include calculated values in the export.
+            export_dir (str, optional): Directory to write the CSV file(s) into. If None,
+                a timestamped directory is created when exporting all sensors, and a single
+                sensor is exported into the current directory.
+            frame_writer (SensorFrameWriter, optional): The writer of a binary columnar
+                format. If None, CSV file(s) are written.
+            csv_writer (SensorCsvWriter, optional): The writer of the CSV lines. If None,
+                floats are written in full.
+            include_timestamps (bool): Whether to export the AppTimestamp and SensorTimestamp of
+                every record, and its wall-clock time, after the row index.
+            creation_time (float, optional): Unix time of the creation of the logfile, added to the
+                AppTimestamps for the wall-clock time. If None, the wall-clock time is NaN.
+
+        Returns:
+            Dict[str, int]: A mapping of sensor tag to its number of exported records.
         """
         # generated a timestamp for unique file naming
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         if include_calculated:
             timestamp = f"c_{timestamp}"
-        
-        # determined if exporting a single sensor or all sensors based on input parameters
-        export_single_sensor = target_sensor is not None
-
-        target_file_name = None
 
-        # set up export directory and file name if exporting all sensors
-        if target_sensor is None:
+        # set up export directory if exporting all sensors or if a directory was given
+        if export_dir is None and target_sensor is None:
             export_dir = f'all_sensors_data_{timestamp}'
+        if export_dir is not None:
             os.makedirs(export_dir, exist_ok=True)
-            target_sensor = 'ACCE'  # started with accelerometer data
-            target_file_name = f'{export_dir}/{target_sensor.upper()}_sensor_{timestamp}.csv'
-        elif export_single_sensor:
-            # for single sensor, generate file name based on sensor type
-            target_file_name = f'{target_sensor.upper()}_sensor_{timestamp}.csv'
-
-        # defined headers for each sensor type, including calculated values if specified
-        headers = self.get_headers(include_calculated)
-
-        while True:
-            # opened the target file and wrote data
-            with open(target_file_name, 'w') as file:
-                # wrote the header line for the current sensor
-                file.write(f"{headers[target_sensor]}\n")
-
-                # exported data for the current sensor
-                index = 1
+
+        headers = {}  # mapping of sensor tag to its header line, including calculated values if specified
+        export_files = {}  # mapping of sensor tag to its open csv file, or its rows for a frame writer
+        export_counts = {}  # mapping of sensor tag to its number of exported records
+        export_file_names = {}  # mapping of sensor tag to its csv file name
+        extension = frame_writer.get_extension() if frame_writer is not None else '.csv'
+        if csv_writer is None:
+            csv_writer = SensorCsvWriter()
+        pending_rows = {}  # mapping of sensor tag to its rows not yet written to its csv file
+        export_frames = {}  # mapping of sensor tag to the exported columns of its table for a frame writer
+        wall_time_offset = float('nan') if creation_time is None else creation_time
+
+        def open_export_file(tag: str):
+            # opened the csv file of a sensor and wrote its header line, or started its list of rows
+            headers[tag] = self.sensor_class_map[tag].get_headers(include_calculated, include_timestamps)
+            file_name = f'{tag.upper()}_sensor_{timestamp}{extension}'
+            if export_dir is not None:
+                file_name = f'{export_dir}/{file_name}'
+            if frame_writer is not None:
+                file = []
+            else:
+                file = open(file_name, 'w')
+                file.write(f"{headers[tag]}\n")
+            export_files[tag] = file
+            export_counts[tag] = 0
+            export_file_names[tag] = file_name
+            return file
+
+        try:
+            # created the file of a single target sensor upfront, even if it has no records
+            if target_sensor is not None:
+                open_export_file(target_sensor)
+
+            if isinstance(sensors_data, dict):
+                # wrote every table as a whole, with its calculated values calculated column by column
+                export_tags = [target_sensor] if target_sensor is not None else self.SENSORS
+                for tag in export_tags:
+                    sensor_table = sensors_data.get(tag)
+                    if not sensor_table:
+                        continue
+                    file = export_files[tag] if tag in export_files else open_export_file(tag)
+                    if frame_writer is not None:
+                        export_frames[tag] = sensor_table.export_columns(include_calculated, 1, include_timestamps,
+                                                                         creation_time)
+                    else:
+                        csv_writer.write_columns(file, sensor_table.export_columns(include_calculated, 1,
+                                                                                   include_timestamps, creation_time))
+                    export_counts[tag] = len(sensor_table)
+            else:
+                # routed every record to the file of its sensor in a single pass
                 for sensor in sensors_data:
-                    if sensor.tag == target_sensor:
-                        file.write(f'{sensor.export_row(index, include_calculated)}\n')
-                        index += 1
-                
-            print(f"[INFO] Exported Total {index - 1} Records For Sensor {target_sensor.upper()}")
-            print(f"[INFO] Exported Data Saved in '{target_file_name}'")
-
-            # if exporting a single sensor, ended the process
-            if export_single_sensor:
-                break
+                    tag = sensor.tag
+                    file = export_files.get(tag)
+                    if file is None:
+                        if target_sensor is not None:
+                            continue
+                        file = open_export_file(tag)
+                    export_counts[tag] += 1
+                    row = sensor.export_values(export_counts[tag], include_calculated, include_timestamps, wall_time_offset)
+                    if frame_writer is not None:
+                        file.append(row)
+                        continue
+
+                    # buffered the rows of every sensor and wrote them a chunk at a time
+                    rows = pending_rows.setdefault(tag, [])
+                    rows.append(row)
+                    if len(rows) >= csv_writer.CHUNK_ROWS:
+                        csv_writer.write_rows(file, rows)
+                        rows.clear()
+
+                for tag, rows in pending_rows.items():
+                    csv_writer.write_rows(export_files[tag], rows)
+        finally:
+            if frame_writer is None:
+                for file in export_files.values():
+                    file.close()
+
+        # wrote the columns of every sensor as one columnar file, transposing the collected rows of sensor objects
+        if frame_writer is not None:
+            for tag, rows in export_files.items():
+                columns = export_frames[tag] if tag in export_frames else list(zip(*rows))
+                frame_writer.write(export_file_names[tag], headers[tag], columns)
 
-            # moved to the next sensor if exporting all sensors
-            index_of_target_sensor = self.SENSORS.index(target_sensor)
-            if index_of_target_sensor < len(self.SENSORS) - 1:
-                target_sensor = self.SENSORS[index_of_target_sensor + 1]
-                target_file_name = f'{export_dir}/{target_sensor.upper()}_sensor_{timestamp}.csv'
-            else: 
-                break  # finished processing all sensors
+        if not export_files:
+            print("[INFO] No Sensor Records Found to Export")
 
-    def get_headers(self, include_calculated: bool) -> dict:
+        # reported the exported sensors in the order of the sensors list
+        for tag in self.SENSORS:
+            if tag in export_files:
+                print(f"[INFO] Exported Total {export_counts[tag]} Records For Sensor {tag.upper()}")
+                print(f"[INFO] Exported Data Saved in '{export_file_names[tag]}'")
+
+        return export_counts
+
+    def get_headers(self, include_calculated: bool, tags: Optional[Iterable[str]] = None,
+                    include_timestamps: bool = False) -> dict:
         """
         Get the headers for each sensor type.
 
         This function returns a dictionary of headers for each sensor type,
-        including calculated values if specified.
+        including calculated values if specified. Only the sensor classes of
+        the requested tags are imported.
 
         Args:
             include_calculated (bool): Whether to include calculated values in the headers.
+            tags (Iterable[str], optional): Sensor tags to get the headers of. If None,
+                the headers of all sensors are returned.
+            include_timestamps (bool): Whether to include the timestamp columns in the headers.
 
         Returns:
             dict: A dictionary of headers for each sensor type.
         """
-        return {
-            'ACCE': AccelerometerSensor.AccelerometerSensor.get_headers(include_calculated),
-            'GYRO': GyroscopeSensor.GyroscopeSensor.get_headers(include_calculated),
-            'MAGN': MagnetometerSensor.MagnetometerSensor.get_headers(include_calculated),
-            'PRES': PressureSensor.PressureSensor.get_headers(include_calculated),
-            'LIGH': LightSensor.LightSensor.get_headers(include_calculated),
-            'PROX': ProximitySensor.ProximitySensor.get_headers(include_calculated),
-            'HUMI': HumiditySensor.HumiditySensor.get_headers(include_calculated),
-            'TEMP': TemperatureSensor.TemperatureSensor.get_headers(include_calculated),
-            'AHRS': OrientationSensor.OrientationSensor.get_headers(include_calculated),
-            'GNSS': GNSS_GPS_Sensor.GNSS_GPS_Sensor.get_headers(include_calculated),
-            'WIFI': WifiSensor.WifiSensor.get_headers(include_calculated),
-            'BLUE': BluetoothSensor.BluetoothSensor.get_headers(include_calculated),
-            'BLE4': BLE4Sensor.BLE4Sensor.get_headers(include_calculated),
-            'SOUN': SoundSensor.SoundSensor.get_headers(include_calculated),
-            'RFID': RFID_ReaderSensor.RFID_ReaderSensor.get_headers(include_calculated),
-            'IMUX': IMU_XSensSensor.IMU_XSensSensor.get_headers(include_calculated),
-            'IMUL': IMU_LPMS_B_Sensor.IMU_LPMS_B_Sensor.get_headers(include_calculated),
-            'POSI': POSI_Sensor.POSI_Sensor.get_headers(include_calculated)
-        }
+        if tags is None:
+            tags = self.SENSORS
+        return {tag: self.sensor_class_map[tag].get_headers(include_calculated, include_timestamps) for tag in tags}
+
+def parse_sensor_chunk(file_source: str, data_range: Tuple[int, int], tags: Optional[List[str]] = None,
+                       error_budget: Optional[int] = None) -> Tuple[Dict[str, SensorTable], int, List[ParseError]]:
+    """
+    Parse one byte range of a source file in a worker process.
+
+    This function is the entry point of the worker processes used by
+    SensorDataParser.parse_sensor_tables when parsing with more than one job.
+
+    Args:
+        file_source (str): Path to the source file containing sensor data.
+        data_range (Tuple[int, int]): The (start, end) byte range to parse.
+        tags (List[str], optional): Sensor tags to parse. If None, all sensors are parsed.
+        error_budget (int, optional): Stop parsing the range once more lines than this
+            failed to parse. If None, the whole range is parsed.
+
+    Returns:
+        Tuple[Dict[str, SensorTable], int, List[ParseError]]: The result of
+            SensorDataParser.parse_sensor_range for the range.
+    """
+    return SensorDataParser().parse_sensor_range(file_source, data_range, tags, error_budget)
+
+def parse_sensor_file(file_source: str, export_dir: str, options: tuple) -> dict:
+    """
+    Parse and export one source file of a batch in a worker process.
+
+    This function is the entry point of the worker processes used by
+    SensorDataParser.parse_batch. The console output of the parser is captured
+    and saved as 'parser_log.txt' in the export directory of the file, so the
+    output of concurrent workers does not interleave.
+
+    Args:
+        file_source (str): Path to the source file containing sensor data.
+        export_dir (str): Directory to write the CSV file(s) of the source file into.
+        options (tuple): The target_sensor, include_calculated, columnar, stream,
+            export_format, compression, use_cache, float_precision and include_timestamps
+            arguments of the parser function, followed by the error options (max_error_examples,
+            quarantine_file and error_budget) of the SensorDataParser.
+
+    Returns:
+        dict: The 'file_source', 'export_dir', 'export_counts', 'file_size', 'elapsed'
+            wall time and 'metrics' of the source file.
+    """
+    (target_sensor, include_calculated, columnar, stream, export_format, compression, use_cache,
+     float_precision, include_timestamps, error_options) = options
+
+    # kept the quarantined lines of every source file in its own folder
+    max_error_examples, quarantine_file, error_budget = error_options
+    os.makedirs(export_dir, exist_ok=True)
+    if quarantine_file is not None:
+        quarantine_file = os.path.join(export_dir, os.path.basename(quarantine_file))
+
+    start_time = time.perf_counter()
+    parser = SensorDataParser(max_error_examples, quarantine_file, error_budget)
+    parser_log = io.StringIO()
+    with contextlib.redirect_stdout(parser_log):
+        export_counts = parser.parser(file_source, target_sensor, include_calculated,
+                                      columnar=columnar, stream=stream, export_dir=export_dir,
+                                      export_format=export_format, compression=compression,
+                                      use_cache=use_cache, float_precision=float_precision,
+                                      include_timestamps=include_timestamps)
+    elapsed = time.perf_counter() - start_time
+
+    with open(os.path.join(export_dir, 'parser_log.txt'), 'w') as log_file:
+        log_file.write(parser_log.getvalue())
+
+    return {
+        'file_source': file_source,
+        'export_dir': export_dir,
+        'export_counts': export_counts,
+        'file_size': os.path.getsize(file_source),
+        'elapsed': elapsed,
+        'metrics': {'file_source': file_source, **parser.metrics.as_dict()}
+    }
+
+def find_source_files(source: str) -> List[str]:
+    """
+    Find the source files of a batch from a directory or a glob pattern.
+
+    Args:
+        source (str): A directory, whose plain and compressed .txt files are used,
+            or a glob pattern such as 'data/*.txt'.
+
+    Returns:
+        List[str]: The sorted paths of the matching source files.
+    """
+    if os.path.isdir(source):
+        return sorted(path for path in glob.glob(os.path.join(glob.escape(source), '*.txt*'))
+                      if LogFileReader.is_supported(path))
+    return sorted(path for path in glob.glob(source) if os.path.isfile(path))
+
+def is_batch_source(source: str) -> bool:
+    """
+    Check whether a source refers to a batch of files instead of a single file.
+
+    Args:
+        source (str): The source given on the command line.
+
+    Returns:
+        bool: True if the source is a directory or a glob pattern.
+    """
+    return os.path.isdir(source) or any(char in source for char in '*?[')
 
 def print_help() -> None:
     """
@@ -266,11 +1420,36 @@ def print_help() -> None:
     """
     print('Usage:')
     print('python parser003.py <source_file> [options]')
+    print('python parser003.py <source_file.txt.gz | .bz2 | .xz | .zst> [options]')
+    print('python parser003.py <source_directory | "glob_pattern"> [options]')
     print('\nOptions:')
     print('-h, --help\t\tShow this help message and exit')
     print('-all\t\t\tParse all sensors data')
     print('-o <sensor_name>\tParse specific sensor data')
     print('-c\t\t\tInclude calculated values')
+    print('--timestamps\t\tInclude the AppTimestamp, SensorTimestamp and wall-clock time of every record')
+    print('--columnar\t\tParse into compact per-sensor columnar tables')
+    print('--stream\t\tWrite CSV files while reading, with constant memory usage')
+    print('--follow\t\tKeep parsing lines appended to a logfile that is still being recorded')
+    print('--follow-timeout <sec>\tStop following after the given seconds without new lines')
+    print('-j <jobs>\t\tParse with multiple worker processes (per file in batch mode)')
+    print('--format <format>\tExport format: csv (default), parquet, feather or npz')
+    print('--compression <codec>\tCompression codec of the parquet, feather or npz format')
+    print('--float-precision <n>\tWrite float values in CSV files with n decimals')
+    print('--no-cache\t\tParse the source file again instead of using the parse cache')
+    print('--index\t\t\tBuild the sidecar index of a logfile for --tags, --from and --to queries')
+    print('--index-interval <sec>\tSeconds of AppTimestamp between two checkpoints of the index')
+    print('--tags <tags>\t\tExport only these comma-separated sensors, using the index')
+    print('--from <sec>\t\tExport only lines from this AppTimestamp on, using the index')
+    print('--to <sec>\t\tExport only lines up to this AppTimestamp, using the index')
+    print('--align <hz>\t\tAlign the --tags sensors (default: motion, PRES, GNSS) onto one time grid')
+    print('--align-method <m>\tSampling method of the alignment: nearest, linear (default) or asof')
+    print('--align-time <base>\tTime base of the alignment: app (AppTimestamp, default) or sensor')
+    print('--align-tolerance <sec>\tLeave aligned values empty beyond this distance to a sample')
+    print('--metrics-json <file>\tWrite the stage timings, throughput and peak memory to a JSON file')
+    print('--max-errors <count>\tAbort once more than this many lines failed to parse')
+    print('--error-examples <count>\tNumber of lines that failed to parse to print (default: 10)')
+    print('--quarantine <file>\tSave the lines that failed to parse to a file')
 
 def print_intro() -> None:
     """
@@ -306,6 +1485,41 @@ def main() -> None:
     arg_parser.add_argument('-all', action='store_true', help='Parse all sensors data')
     arg_parser.add_argument('-o', nargs=1, metavar='sensor_name', help='Parse specific sensor data')
     arg_parser.add_argument('-c', action='store_true', help='Include calculated values')
+    arg_parser.add_argument('--timestamps', action='store_true',
+                            help='Include the app and sensor timestamps and the wall-clock time')
+    engine_group = arg_parser.add_mutually_exclusive_group()
+    engine_group.add_argument('--columnar', action='store_true', help='Parse into compact per-sensor columnar tables')
+    engine_group.add_argument('--stream', action='store_true', help='Write CSV files while reading, with constant memory usage')
+    engine_group.add_argument('--follow', action='store_true', help='Keep parsing lines appended to a logfile')
+    arg_parser.add_argument('--follow-timeout', type=float, metavar='seconds',
+                            help='Stop following after the given seconds without new lines')
+    arg_parser.add_argument('-j', type=int, default=1, metavar='jobs', help='Parse with multiple worker processes')
+    arg_parser.add_argument('--format', default='csv', choices=['csv', *SensorFrameWriter.FORMAT_EXTENSIONS],
+                            help='Export format of the sensor data')
+    arg_parser.add_argument('--compression', metavar='codec', help='Compression codec of a binary export format')
+    arg_parser.add_argument('--float-precision', type=int, metavar='digits',
+                            help='Write float values in CSV files with this many decimals')
+    arg_parser.add_argument('--no-cache', action='store_true', help='Parse the source file again instead of using the parse cache')
+    arg_parser.add_argument('--index', action='store_true', help='Build the sidecar index of a logfile')
+    arg_parser.add_argument('--index-interval', type=float, metavar='seconds',
+                            help='Seconds of AppTimestamp between two checkpoints of the index')
+    arg_parser.add_argument('--tags', metavar='tags', help='Export only these comma-separated sensors, using the index')
+    arg_parser.add_argument('--from', dest='time_from', type=float, metavar='seconds',
+                            help='Export only lines from this AppTimestamp on, using the index')
+    arg_parser.add_argument('--to', dest='time_to', type=float, metavar='seconds',
+                            help='Export only lines up to this AppTimestamp, using the index')
+    arg_parser.add_argument('--align', type=float, metavar='hz', help='Align the sensors onto a common time grid')
+    arg_parser.add_argument('--align-method', default='linear', choices=['nearest', 'linear', 'asof'],
+                            help='Sampling method of the alignment')
+    arg_parser.add_argument('--align-time', default='app', choices=['app', 'sensor'], help='Time base of the alignment')
+    arg_parser.add_argument('--align-tolerance', type=float, metavar='seconds',
+                            help='Maximum distance between a grid time and its sample(s)')
+    arg_parser.add_argument('--metrics-json', metavar='file', help='Write the stage timings and throughput to a JSON file')
+    arg_parser.add_argument('--max-errors', type=int, metavar='count',
+                            help='Abort once more than this many lines failed to parse')
+    arg_parser.add_argument('--error-examples', type=int, metavar='count',
+                            help='Number of lines that failed to parse to print (default: 10)')
+    arg_parser.add_argument('--quarantine', metavar='file', help='Save the lines that failed to parse to a file')
 
     # parsed command-line arguments
     args = arg_parser.parse_args()
@@ -326,16 +1540,56 @@ def main() -> None:
 
     try:
         # created an instance of SensorDataParser
-        parser = SensorDataParser()
+        parser = SensorDataParser(max_error_examples=args.error_examples, quarantine_file=args.quarantine,
+                                  error_budget=args.max_errors)
         
-        # executed parser based on provided arguments
-        if args.all:
-            parser.parser(args.source_file, include_calculated=args.c)
+        # executed parser based on provided arguments, in batch mode for directories and glob patterns
+        if args.index:
+            parser.build_index(args.source_file, args.index_interval)
+        elif args.align is not None:
+            tags = args.tags.split(',') if args.tags else args.o
+            parser.align_sensor_data(args.source_file, tags, args.align, method=args.align_method,
+                                     time_base=args.align_time, tolerance=args.align_tolerance,
+                                     include_calculated=args.c, export_format=args.format,
+                                     compression=args.compression, float_precision=args.float_precision,
+                                     use_cache=not args.no_cache)
+        elif args.tags or args.time_from is not None or args.time_to is not None:
+            tags = args.tags.split(',') if args.tags else args.o
+            parser.query(args.source_file, tags, args.time_from, args.time_to, include_calculated=args.c,
+                         export_format=args.format, compression=args.compression,
+                         float_precision=args.float_precision, include_timestamps=args.timestamps)
+        elif args.follow and (args.all or args.o):
+            if args.j > 1 or args.format != 'csv':
+                raise ValueError('Follow Mode Only Supports a Single Job and the CSV Format!')
+            parser.follow_sensor_data(args.source_file, target_sensor=args.o[0] if args.o else None,
+                                      include_calculated=args.c, idle_timeout=args.follow_timeout,
+                                      float_precision=args.float_precision, include_timestamps=args.timestamps)
+        elif (args.all or args.o) and is_batch_source(args.source_file):
+            parser.parse_batch(find_source_files(args.source_file), target_sensor=args.o[0] if args.o else None,
+                               include_calculated=args.c, columnar=args.columnar, stream=args.stream, jobs=args.j,
+                               export_format=args.format, compression=args.compression,
+                               use_cache=not args.no_cache, float_precision=args.float_precision,
+                               include_timestamps=args.timestamps)
+        elif args.all:
+            parser.parser(args.source_file, include_calculated=args.c, columnar=args.columnar,
+                          stream=args.stream, jobs=args.j, export_format=args.format,
+                          compression=args.compression, use_cache=not args.no_cache,
+                          float_precision=args.float_precision, include_timestamps=args.timestamps)
         elif args.o:
-            parser.parser(args.source_file, target_sensor=args.o[0], include_calculated=args.c)
+            parser.parser(args.source_file, target_sensor=args.o[0], include_calculated=args.c,
+                          columnar=args.columnar, stream=args.stream, jobs=args.j,
+                          export_format=args.format, compression=args.compression,
+                          use_cache=not args.no_cache, float_precision=args.float_precision,
+                          include_timestamps=args.timestamps)
         else:
             print("Error: Invalid arguments.")
             print_help()
+            return
+
+        # saved the metrics of the run for throughput tracking
+        if args.metrics_json:
+            parser.metrics.save(args.metrics_json)
+            print(f"[INFO] Metrics Saved in '{args.metrics_json}'")
     except Exception as e:
         print(f"An error occurred: {e}")
 
@@ -1,31 +1,34 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+from typing import Union
+from .AccelerometerCalculator import AccelerometerCalculator
+from ..IO.SensorFrameLoader import SensorFrameLoader
 
 class AccelerometerAnalyzer:
     """
     A class to analyze accelerometer data from a CSV file.
     """
 
-    def __init__(self, csv_file_path: str):
+    def __init__(self, data: Union[str, pd.DataFrame]):
         """
         Initialize the AccelerometerAnalyzer object.
 
         Args:
-            csv_file_path (str): Path to the CSV file containing accelerometer data.
+            data (str | pd.DataFrame): Path to the exported file (CSV, Parquet, Feather or NPZ) containing accelerometer data,
+                or a DataFrame of the data, e.g. parsed straight from a logfile.
         """
-        self.df = pd.read_csv(csv_file_path)
-        self.df['timestamp'] = pd.to_datetime(self.df['index'], unit='s')
-        self.df['magnitude'] = np.sqrt(self.df['acc_x']**2 + self.df['acc_y']**2 + self.df['acc_z']**2)
+        self.df = SensorFrameLoader.load(data)
+        self.df['magnitude'] = AccelerometerCalculator.calculate_magnitude_batch(self.df['acc_x'], self.df['acc_y'], self.df['acc_z'])
 
     def plot_acceleration_over_time(self):
         """
         Plot acceleration over time for all axes.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['acc_x'], label='X-axis')
-        plt.plot(self.df['timestamp'], self.df['acc_y'], label='Y-axis')
-        plt.plot(self.df['timestamp'], self.df['acc_z'], label='Z-axis')
+        plt.plot(self.df.index, self.df['acc_x'], label='X-axis')
+        plt.plot(self.df.index, self.df['acc_y'], label='Y-axis')
+        plt.plot(self.df.index, self.df['acc_z'], label='Z-axis')
         plt.title('Acceleration Over Time')
         plt.xlabel('Time')
         plt.ylabel('Acceleration (m/s^2)')
@@ -38,7 +41,7 @@ class AccelerometerAnalyzer:
         Plot acceleration magnitude over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['magnitude'])
+        plt.plot(self.df.index, self.df['magnitude'])
         plt.title('Acceleration Magnitude Over Time')
         plt.xlabel('Time')
         plt.ylabel('Magnitude (m/s^2)')
@@ -62,13 +65,13 @@ class AccelerometerAnalyzer:
                                      labels=['unknown', 'sitting/stationary', 'walking', 'running'])
 
         # plotting the data
-        plt.plot(self.df['timestamp'], self.df['magnitude'], color='black', linewidth=0.8, label='Magnitude')
+        plt.plot(self.df.index, self.df['magnitude'], color='black', linewidth=0.8, label='Magnitude')
 
         # colored the background based on activities
         colors = {'unknown': 'white', 'sitting/stationary': 'lightblue', 'walking': 'lightgreen', 'running': 'lightcoral'}
         for activity in ['sitting/stationary', 'walking', 'running']:
             mask = self.df['activity'] == activity
-            plt.fill_between(self.df['timestamp'], 0, self.df['magnitude'], where=mask, 
+            plt.fill_between(self.df.index, 0, self.df['magnitude'], where=mask, 
                              facecolor=colors[activity], alpha=0.66, label=f'{activity.capitalize()} State')
 
         plt.title('Activity Recognition', fontsize=14)
@@ -119,8 +122,8 @@ class AccelerometerAnalyzer:
         """
         impacts = self.detect_impacts(threshold)
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['magnitude'], label='Magnitude')
-        plt.scatter(impacts['timestamp'], impacts['magnitude'], color='red', label='Impacts')
+        plt.plot(self.df.index, self.df['magnitude'], label='Magnitude')
+        plt.scatter(impacts.index, impacts['magnitude'], color='red', label='Impacts')
         plt.title(f'Impact Detection (Threshold: {threshold} m/s^2)')
         plt.xlabel('Time')
         plt.ylabel('Acceleration Magnitude (m/s^2)')
@@ -149,8 +152,8 @@ class AccelerometerAnalyzer:
         print(f"Number of Detected Impacts: {len(impacts)}")
         if not impacts.empty:
             print("Impact Times:")
-            for _, impact in impacts.iterrows():
-                print(f"  {impact['timestamp']}: Magnitude = {impact['magnitude']:.2f} m/s^2")
+            for timestamp, impact in impacts.iterrows():
+                print(f"  {timestamp}: Magnitude = {impact['magnitude']:.2f} m/s^2")
 
         # to print accelerometer statistics
         print("\nAccelerometer Statistics:")
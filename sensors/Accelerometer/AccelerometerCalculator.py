@@ -1,4 +1,8 @@
-import numpy as np
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class AccelerometerCalculator:
     """
@@ -33,4 +37,40 @@ class AccelerometerCalculator:
         Returns:
             float: The magnitude of acceleration.
         """
-        return np.sqrt(acc_X**2 + acc_Y**2 + acc_Z**2)
\ No newline at end of file
+        return math.sqrt(acc_X**2 + acc_Y**2 + acc_Z**2)
+
+    @staticmethod
+    def calculate_average_acceleration_batch(acc_X: 'np.ndarray', acc_Y: 'np.ndarray', acc_Z: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the average acceleration across all axes for whole columns.
+
+        Args:
+            acc_X (np.ndarray): Accelerations along the X-axis.
+            acc_Y (np.ndarray): Accelerations along the Y-axis.
+            acc_Z (np.ndarray): Accelerations along the Z-axis.
+
+        Returns:
+            np.ndarray: The average acceleration of each sample.
+        """
+        import numpy as np
+
+        acc_X, acc_Y, acc_Z = (np.asarray(axis, dtype=float) for axis in (acc_X, acc_Y, acc_Z))
+        return (acc_X + acc_Y + acc_Z) / 3
+
+    @staticmethod
+    def calculate_magnitude_batch(acc_X: 'np.ndarray', acc_Y: 'np.ndarray', acc_Z: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the magnitude of acceleration across all axes for whole columns.
+
+        Args:
+            acc_X (np.ndarray): Accelerations along the X-axis.
+            acc_Y (np.ndarray): Accelerations along the Y-axis.
+            acc_Z (np.ndarray): Accelerations along the Z-axis.
+
+        Returns:
+            np.ndarray: The magnitude of acceleration of each sample.
+        """
+        import numpy as np
+
+        acc_X, acc_Y, acc_Z = (np.asarray(axis, dtype=float) for axis in (acc_X, acc_Y, acc_Z))
+        return np.sqrt(acc_X**2 + acc_Y**2 + acc_Z**2)
@@ -0,0 +1,68 @@
+import importlib
+from typing import Dict, Iterator, Mapping
+
+class LazyRegistry(Mapping):
+    """
+    A mapping of sensor tag to a class that is only imported when its tag is used.
+
+    Every entry is registered with the dotted path of its class (e.g.
+    'sensors.Gyroscope.GyroscopeSensor.GyroscopeSensor'), and the module of the
+    class is imported the first time its tag is looked up. A run that only needs
+    one sensor therefore never imports the other sensor modules or their heavy
+    dependencies (e.g. NumPy, geopy, pandas or matplotlib), which keeps the
+    startup of the scripts fast. Iterating over the tags does not import anything.
+
+    Attributes:
+        class_paths (Dict[str, str]): Mapping of sensor tag to the dotted path of its class.
+
+    Methods:
+        is_loaded(tag): Check whether the class of a tag was imported already.
+    """
+
+    def __init__(self, class_paths: Dict[str, str]):
+        """
+        Initialize the LazyRegistry with the classes of every sensor tag.
+
+        Args:
+            class_paths (Dict[str, str]): Mapping of sensor tag to the dotted path of its class,
+                i.e. its module path followed by the class name.
+        """
+        self.class_paths = dict(class_paths)
+        self._classes = {}
+
+    def __getitem__(self, tag: str) -> type:
+        """
+        Get the class of a sensor tag, importing its module on first use.
+
+        Args:
+            tag (str): Sensor tag, e.g. 'GYRO'.
+
+        Returns:
+            type: The class registered for the tag.
+
+        Raises:
+            KeyError: If no class is registered for the tag.
+        """
+        sensor_class = self._classes.get(tag)
+        if sensor_class is None:
+            module_path, class_name = self.class_paths[tag].rsplit('.', 1)
+            sensor_class = self._classes[tag] = getattr(importlib.import_module(module_path), class_name)
+        return sensor_class
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.class_paths)
+
+    def __len__(self) -> int:
+        return len(self.class_paths)
+
+    def is_loaded(self, tag: str) -> bool:
+        """
+        Check whether the class of a sensor tag was imported already.
+
+        Args:
+            tag (str): Sensor tag, e.g. 'GYRO'.
+
+        Returns:
+            bool: True if the class of the tag was looked up before.
+        """
+        return tag in self._classes
@@ -0,0 +1,169 @@
+from typing import Iterable, Optional, Tuple
+
+# (line number, sensor tag, category, message, raw line) of a line that failed to parse
+ParseError = Tuple[Optional[int], str, str, str, bytes]
+
+class ParseErrorCollector:
+    """
+    A class to collect the lines of a logfile that failed to parse.
+
+    Instead of printing every bad line, the errors are counted by category and
+    by sensor tag, and only the first few are printed as examples, so a badly
+    corrupted logfile does not spend its parse time writing to the console. The
+    raw bad lines can be saved to a quarantine file for later inspection, and an
+    error budget aborts the run as soon as too many lines have failed.
+
+    The categories of an error are:
+        encoding: The line is not valid UTF-8.
+        field_count: The line has more or fewer values than its sensor layout.
+        invalid_value: A value cannot be converted to its field type.
+        other: Any other error.
+
+    Attributes:
+        max_examples (int): Number of errors printed as examples.
+        quarantine_file (str, optional): Path of the file the raw bad lines are saved to.
+        error_budget (int, optional): Maximum number of bad lines before the run is aborted.
+        total_errors (int): Number of collected errors.
+        category_counts (Dict[str, int]): Mapping of error category to its number of errors.
+        tag_counts (Dict[str, int]): Mapping of sensor tag to its number of errors.
+        examples (List[ParseError]): The first max_examples errors.
+
+    Methods:
+        categorize(error, line, expected_fields): Get the category of a parse error.
+        add(error): Collect one parse error.
+        add_errors(errors, line_offset): Collect parse errors, shifting their line numbers.
+        flush(): Append the pending bad lines to the quarantine file.
+        finish(): Save the remaining bad lines and print the error summary.
+    """
+
+    DEFAULT_MAX_EXAMPLES = 10
+    QUARANTINE_BUFFER_LINES = 10000  # bad lines kept in memory before they are appended to the quarantine file
+    CATEGORIES = ('encoding', 'field_count', 'invalid_value', 'other')
+
+    def __init__(self, max_examples: Optional[int] = None, quarantine_file: Optional[str] = None,
+                 error_budget: Optional[int] = None):
+        """
+        Initialize an empty ParseErrorCollector.
+
+        Args:
+            max_examples (int, optional): Number of errors printed as examples. If None,
+                DEFAULT_MAX_EXAMPLES is used.
+            quarantine_file (str, optional): Path of the file to save the raw bad lines to.
+                If None, bad lines are not saved.
+            error_budget (int, optional): Maximum number of bad lines before the run is
+                aborted. If None, the run is never aborted.
+        """
+        self.max_examples = self.DEFAULT_MAX_EXAMPLES if max_examples is None else max_examples
+        self.quarantine_file = quarantine_file
+        self.error_budget = error_budget
+        self.total_errors = 0
+        self.category_counts = {}
+        self.tag_counts = {}
+        self.examples = []
+        self._quarantine_lines = []
+        self._quarantine_started = False
+
+    @staticmethod
+    def categorize(error: Exception, line: bytes, expected_fields: int) -> str:
+        """
+        Get the category of a parse error.
+
+        Args:
+            error (Exception): The error raised while parsing the line.
+            line (bytes): The raw line, including the sensor tag.
+            expected_fields (int): Number of values in the sensor layout, without the tag.
+
+        Returns:
+            str: One of the CATEGORIES.
+        """
+        try:
+            line.decode('utf-8')
+        except UnicodeDecodeError:
+            return 'encoding'  # also when the raw bytes failed a float or int conversion first
+        if line.strip().count(b';') != expected_fields:
+            return 'field_count'
+        if isinstance(error, (ValueError, TypeError)):
+            return 'invalid_value'
+        return 'other'
+
+    def add(self, error: ParseError) -> None:
+        """
+        Collect one parse error.
+
+        Args:
+            error (ParseError): The (line number, tag, category, message, raw line) of the
+                bad line. The line number is None if it is not known.
+
+        Raises:
+            ValueError: If the error budget is exceeded.
+        """
+        line_number, tag, category, message, line = error
+        self.total_errors += 1
+        self.category_counts[category] = self.category_counts.get(category, 0) + 1
+        self.tag_counts[tag] = self.tag_counts.get(tag, 0) + 1
+
+        # printed only the first errors, so dirty logfiles do not flood the console
+        if len(self.examples) < self.max_examples:
+            self.examples.append(error)
+            if line_number is not None:
+                print(f"Error parsing line {line_number}: {message}")
+            else:
+                print(f"Error parsing {tag} line: {message}")
+
+        if self.quarantine_file is not None:
+            self._quarantine_lines.append(line.rstrip(b'\r\n'))
+            if len(self._quarantine_lines) >= self.QUARANTINE_BUFFER_LINES:
+                self.flush()
+
+        if self.error_budget is not None and self.total_errors > self.error_budget:
+            self.flush()
+            raise ValueError(f'Error Budget Exceeded! More Than {self.error_budget} Lines Failed to Parse!')
+
+    def add_errors(self, errors: Iterable[ParseError], line_offset: int = 0) -> None:
+        """
+        Collect parse errors, shifting their line numbers.
+
+        Args:
+            errors (Iterable[ParseError]): The parse errors, e.g. of one chunk of a logfile.
+            line_offset (int): Number added to the line number of every error, e.g. to turn
+                the line numbers of a chunk into line numbers of the logfile.
+
+        Raises:
+            ValueError: If the error budget is exceeded.
+        """
+        for line_number, tag, category, message, line in errors:
+            if line_number is not None:
+                line_number += line_offset
+            self.add((line_number, tag, category, message, line))
+
+    def flush(self) -> None:
+        """
+        Append the pending bad lines to the quarantine file.
+
+        The quarantine file is created (or emptied) when the first bad lines are saved,
+        so no file is written for a clean logfile.
+        """
+        if self.quarantine_file is None or not self._quarantine_lines:
+            return
+        with open(self.quarantine_file, 'ab' if self._quarantine_started else 'wb') as file:
+            file.write(b'\n'.join(self._quarantine_lines) + b'\n')
+        self._quarantine_started = True
+        self._quarantine_lines = []
+
+    def finish(self) -> None:
+        """
+        Save the remaining bad lines and print the error summary.
+        """
+        self.flush()
+        if not self.total_errors:
+            return
+
+        categories = ', '.join(f'{self.category_counts[category]} {category}'
+                               for category in self.CATEGORIES if category in self.category_counts)
+        tags = ', '.join(f'{tag} {count}' for tag, count in sorted(self.tag_counts.items()))
+        print(f"[INFO] {self.total_errors} Lines Failed to Parse ({categories})")
+        print(f"[INFO] Failed Lines Per Sensor: {tags}")
+        if self.total_errors > len(self.examples):
+            print(f"[INFO] Only the First {len(self.examples)} Errors Were Printed")
+        if self._quarantine_started:
+            print(f"[INFO] Failed Lines Saved in '{self.quarantine_file}'")
@@ -0,0 +1,169 @@
+import sys
+import json
+import time
+import contextlib
+from typing import Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None  # peak memory is only reported on platforms with the resource module (not Windows)
+
+class PipelineMetrics:
+    """
+    A class to record the metrics of one run of the parser or the analyzer.
+
+    Every stage of a run (e.g. validate, parse, export, analyze) is timed with
+    the stage context manager, and the parsing code counts the data lines it read,
+    the bytes of the source file(s), the records of each sensor tag and the lines
+    that failed to parse. The throughput of the run is derived from these counts
+    and the total wall time of its stages.
+
+    Peak memory is the peak resident set size of the process (and of its worker
+    processes, if any) as reported by the operating system, so measuring it costs
+    nothing, unlike tracing every allocation. It is a high-water mark of the whole
+    process, so the peak memory of a stage includes the stages before it.
+
+    Attributes:
+        stages (Dict[str, dict]): Mapping of stage name to its 'seconds' and 'peak_memory_bytes',
+            in the order the stages first ran.
+        file_size (int): Bytes of the source file(s).
+        lines (int): Number of data lines read.
+        errors (int): Number of lines that failed to parse.
+        error_categories (Dict[str, int]): Mapping of error category to its number of bad lines.
+        error_tags (Dict[str, int]): Mapping of sensor tag to its number of bad lines.
+        records (Dict[str, int]): Mapping of sensor tag to its number of records.
+        files (List[dict]): The metrics of every source file of a batch run.
+
+    Methods:
+        stage(name): Context manager timing one stage of the run.
+        count_records(counts): Add the records of each sensor tag.
+        count_errors(category_counts, tag_counts): Add the bad lines of each error category and sensor tag.
+        add_file(file_metrics): Add the metrics of one source file of a batch run.
+        get_peak_memory(): Get the peak resident set size of the process.
+        as_dict(): Get the metrics as a JSON-serializable dictionary.
+        save(file_path): Write the metrics to a JSON file.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty PipelineMetrics object.
+        """
+        self.stages = {}
+        self.file_size = 0
+        self.lines = 0
+        self.errors = 0
+        self.error_categories = {}
+        self.error_tags = {}
+        self.records = {}
+        self.files = []
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Context manager timing one stage of the run.
+
+        The wall time of a stage that runs more than once is added up.
+
+        Args:
+            name (str): Name of the stage, e.g. 'parse'.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            stage_metrics = self.stages.setdefault(name, {'seconds': 0.0, 'peak_memory_bytes': None})
+            stage_metrics['seconds'] += time.perf_counter() - start_time
+            stage_metrics['peak_memory_bytes'] = self.get_peak_memory()
+
+    def count_records(self, counts: Dict[str, int]) -> None:
+        """
+        Add the records of each sensor tag.
+
+        Args:
+            counts (Dict[str, int]): A mapping of sensor tag to its number of records.
+        """
+        for tag, count in counts.items():
+            self.records[tag] = self.records.get(tag, 0) + count
+
+    def count_errors(self, category_counts: Dict[str, int], tag_counts: Dict[str, int]) -> None:
+        """
+        Add the bad lines of each error category and sensor tag.
+
+        Args:
+            category_counts (Dict[str, int]): A mapping of error category to its number of bad lines.
+            tag_counts (Dict[str, int]): A mapping of sensor tag to its number of bad lines.
+        """
+        self.errors += sum(category_counts.values())
+        for category, count in category_counts.items():
+            self.error_categories[category] = self.error_categories.get(category, 0) + count
+        for tag, count in tag_counts.items():
+            self.error_tags[tag] = self.error_tags.get(tag, 0) + count
+
+    def add_file(self, file_metrics: dict) -> None:
+        """
+        Add the metrics of one source file of a batch run.
+
+        The counts of the file are added to the counts of the batch, while the
+        stages of the file stay in its own entry of the files list.
+
+        Args:
+            file_metrics (dict): The metrics of the file, as returned by as_dict.
+        """
+        self.files.append(file_metrics)
+        self.file_size += file_metrics['file_size']
+        self.lines += file_metrics['lines']
+        self.count_errors(file_metrics['errors_by_category'], file_metrics['errors_by_tag'])
+        self.count_records(file_metrics['records'])
+
+    @staticmethod
+    def get_peak_memory() -> Optional[int]:
+        """
+        Get the peak resident set size of the process and its finished worker processes.
+
+        Returns:
+            int, optional: The peak memory in bytes, or None if it is not available on
+                this platform.
+        """
+        if resource is None:
+            return None
+        peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+        return peak if sys.platform == 'darwin' else peak * 1024  # Linux reports kilobytes, macOS bytes
+
+    def as_dict(self) -> dict:
+        """
+        Get the metrics as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The stages, counts, throughput and peak memory of the run. Lines and bytes
+                per second are measured over the total wall time of all stages.
+        """
+        total_seconds = sum(stage_metrics['seconds'] for stage_metrics in self.stages.values())
+        metrics = {
+            'stages': {name: dict(stage_metrics) for name, stage_metrics in self.stages.items()},
+            'total_seconds': total_seconds,
+            'file_size': self.file_size,
+            'lines': self.lines,
+            'lines_per_second': self.lines / total_seconds if total_seconds else None,
+            'bytes_per_second': self.file_size / total_seconds if total_seconds else None,
+            'records': dict(self.records),
+            'total_records': sum(self.records.values()),
+            'errors': self.errors,
+            'errors_by_category': dict(self.error_categories),
+            'errors_by_tag': dict(self.error_tags),
+            'peak_memory_bytes': self.get_peak_memory()
+        }
+        if self.files:
+            metrics['files'] = self.files
+        return metrics
+
+    def save(self, file_path: str) -> None:
+        """
+        Write the metrics to a JSON file.
+
+        Args:
+            file_path (str): Path of the JSON file.
+        """
+        with open(file_path, 'w') as file:
+            json.dump(self.as_dict(), file, indent=4)
@@ -12,11 +12,36 @@ class SensorBase(ABC):
         app_timestamp (float, optional): Application timestamp.
         sensor_timestamp (float, optional): Sensor timestamp.
         accuracy (int, optional): Sensor accuracy.
+        SCHEMA (SensorSchema): Class-level declaration of the fields, exports and calculated columns.
+        FIELDS (tuple): Class-level layout of a logfile data row as (attribute, type) pairs.
+        EXPORT_FIELDS (tuple): Class-level names of the attributes exported after the row index.
 
     Methods:
-        export_row(index): Abstract method to export sensor data as a row for a CSV file.
+        export_values(index, include_calculated, include_timestamps, creation_time): Abstract method to export
+            sensor data as a tuple of row values.
+        export_row(index, include_calculated, include_timestamps, creation_time): Export sensor data as a row for a CSV file.
+        calculate_columns(columns): Calculate the calculated values of whole data columns.
+        calculate_batch_columns(columns): Calculate the calculated values of whole data columns
+            with the vectorized calculations.
+        get_headers(include_calculated, include_timestamps): Get the headers for the CSV file.
     """
 
+    # overridden by every sensor type with the declaration of its layout: its logfile data row as
+    # (attribute, type) pairs, its exported attributes as (attribute, header) pairs and its calculated
+    # columns, from which the constructor, export_values and the headers of the type are derived
+    SCHEMA = None
+
+    # derived from the schema of every sensor type: the layout of its logfile data row
+    FIELDS = ()
+
+    # derived from the schema of every sensor type: the attributes exported after the row index
+    EXPORT_FIELDS = ()
+
+    # attributes stored in fixed slots instead of a per-instance __dict__ to keep records compact;
+    # every sensor type declares the slots of its own attributes (an empty tuple if it adds none),
+    # as a subclass without __slots__ would give its records a __dict__ again
+    __slots__ = ('tag', 'app_timestamp', 'sensor_timestamp', 'accuracy')
+
     def __init__(self, tag, app_timestamp=None, sensor_timestamp=None, accuracy=None):
         """
         Initialize the SensorBase object.
@@ -32,19 +57,100 @@ class SensorBase(ABC):
         self.sensor_timestamp = sensor_timestamp
         self.accuracy = accuracy
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Derive the layouts and compile the methods of a sensor type from its schema.
+
+        A sensor class declaring a SCHEMA gets the FIELDS and EXPORT_FIELDS layouts
+        of the schema, and a constructor and export_values method compiled from it,
+        unless the class defines them itself.
+        """
+        super().__init_subclass__(**kwargs)
+        schema = cls.__dict__.get('SCHEMA')
+        if schema is None:
+            return
+
+        cls.FIELDS = schema.fields
+        cls.EXPORT_FIELDS = schema.export_fields
+        if '__init__' not in cls.__dict__:
+            cls.__init__ = schema.compile_init(SensorBase.__slots__)
+        if 'export_values' not in cls.__dict__:
+            cls.export_values = schema.compile_export_values()
+
     @abstractmethod
-    def export_row(self, index, include_calculated=False):
+    def export_values(self, index, include_calculated=False, include_timestamps=False, creation_time=float('nan')):
         """
-        Export sensor data as a row for a CSV file.
+        Export sensor data as a tuple of row values.
 
-        This method should be implemented by subclasses to format
-        sensor data for CSV export.
+        This method should be implemented by subclasses to collect the
+        sensor data, and the calculated values and timestamps if requested, for export.
 
         Args:
             index (int): The row index in the CSV file.
             include_calculated (bool): Whether to include calculated values in the output.
+            include_timestamps (bool): Whether to include the timestamps and the wall-clock time.
+            creation_time (float): Unix time of the creation of the logfile, added to the
+                AppTimestamp for the wall-clock time. NaN if it is unknown.
+
+        Returns:
+            tuple: The typed values of the row, in the order of the headers.
+        """
+        pass
+
+    def export_row(self, index, include_calculated=False, include_timestamps=False, creation_time=float('nan')):
+        """
+        Export sensor data as a row for a CSV file.
+
+        Args:
+            index (int): The row index.
+            include_calculated (bool): Whether to include calculated values.
+            include_timestamps (bool): Whether to include the timestamps and the wall-clock time.
+            creation_time (float): Unix time of the creation of the logfile, or NaN if it is unknown.
+
+        Returns:
+            str: A comma-separated string of values representing the row.
+        """
+        return ','.join(map(str, self.export_values(index, include_calculated, include_timestamps, creation_time)))
+
+    @classmethod
+    def calculate_columns(cls, columns):
+        """
+        Calculate the calculated values of whole data columns at once.
+
+        The same values as export_values are calculated with the calculations
+        declared in the schema, mapped over the columns.
+
+        Args:
+            columns (dict): Mapping of attribute name to its column of values.
+
+        Returns:
+            tuple: The calculated columns, in the order of the headers.
+        """
+        return cls.SCHEMA.calculate_columns(columns)
+
+    @classmethod
+    def calculate_batch_columns(cls, columns):
+        """
+        Calculate the calculated values of whole data columns with the vectorized calculations.
+
+        Args:
+            columns (dict): Mapping of attribute name to its column of values.
+
+        Returns:
+            tuple: The calculated columns as NumPy arrays, in the order of the headers.
+        """
+        return cls.SCHEMA.calculate_batch_columns(columns)
+
+    @classmethod
+    def get_headers(cls, include_calculated=False, include_timestamps=False):
+        """
+        Get the headers for the CSV file.
+
+        Args:
+            include_calculated (bool): Whether to include headers for calculated values.
+            include_timestamps (bool): Whether to include headers for the timestamps.
 
         Returns:
-            str: A formatted string representing a row in the CSV file.
+            str: A comma-separated string of header names.
         """
-        pass
\ No newline at end of file
+        return cls.SCHEMA.get_headers(include_calculated, include_timestamps)
@@ -0,0 +1,231 @@
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+
+class CalculatedColumn(NamedTuple):
+    """
+    A calculated value of a sensor type, derived from some fields of its rows.
+
+    Attributes:
+        header (str): Header name of the calculated column.
+        fields (Tuple[str, ...]): Names of the fields passed to the calculations, in argument order.
+        calculate (Callable): Calculation of the value of one row, from the field values.
+        calculate_batch (Callable): Vectorized calculation of the whole column, from the field columns.
+    """
+    header: str
+    fields: Tuple[str, ...]
+    calculate: Callable
+    calculate_batch: Callable
+
+class SensorSchema:
+    """
+    A class to declare the layout of a sensor type in one place.
+
+    The schema of a sensor type holds the fields of its logfile data rows with
+    their types, the fields it exports with their header names, and the
+    calculated columns with the fields they derive from. Everything else is
+    derived from it: the header lines are built once, and the constructor and
+    export_values method of the sensor class are compiled once from generated
+    source (as dataclasses do), so converting a row costs the same as a
+    hand-written constructor, with one plain type cast per field.
+
+    A sensor class only declares its SCHEMA (and its __slots__), and SensorBase
+    installs the compiled methods, the FIELDS and EXPORT_FIELDS layouts used by
+    the columnar tables, and the get_headers and calculate_columns methods.
+
+    Attributes:
+        tag (str, optional): Sensor tag, or None for a schema shared by several tags,
+            whose constructor then takes the tag as its first argument.
+        fields (Tuple[Tuple[str, type], ...]): Layout of a logfile data row as (attribute, type) pairs.
+        export_fields (Tuple[str, ...]): Attributes exported after the row index.
+        export_headers (Tuple[str, ...]): Header names of the exported attributes.
+        calculated_columns (Tuple[CalculatedColumn, ...]): The calculated columns, in header order.
+        timestamp_fields (Tuple[str, ...]): The AppTimestamp and SensorTimestamp attributes of the layout.
+        timestamp_headers (Tuple[str, ...]): Header names of the timestamp columns, which add the
+            wall-clock 'wall_time' (Unix time in seconds) to sensors with an AppTimestamp.
+        headers (Dict[Tuple[bool, bool], str]): The header line by whether the calculated columns
+            and the timestamp columns are included.
+
+    Methods:
+        with_tag(tag): Get the same schema for another sensor tag.
+        get_headers(include_calculated, include_timestamps): Get the header line of the CSV file.
+        calculate_columns(columns): Calculate the calculated columns of whole data columns.
+        calculate_batch_columns(columns): Calculate the calculated columns with the vectorized calculations.
+        compile_init(base_attributes): Compile the constructor of the sensor class.
+        compile_export_values(): Compile the export_values method of the sensor class.
+    """
+
+    TIMESTAMP_FIELDS = ('app_timestamp', 'sensor_timestamp')  # exported in this order after the row index
+    WALL_TIME_HEADER = 'wall_time'
+
+    def __init__(self, tag: Optional[str], fields: Sequence[Tuple[str, type]],
+                 export_fields: Sequence[Tuple[str, str]], calculated_columns: Sequence[CalculatedColumn] = ()):
+        """
+        Initialize the SensorSchema and build its header lines.
+
+        Args:
+            tag (str, optional): Sensor tag, or None for a schema shared by several tags.
+            fields (Sequence[Tuple[str, type]]): Layout of a logfile data row as (attribute, type)
+                pairs, in the order of the values in the logfile.
+            export_fields (Sequence[Tuple[str, str]]): Exported attributes as (attribute, header)
+                pairs, in the order of the headers.
+            calculated_columns (Sequence[CalculatedColumn]): The calculated columns, in the order
+                of the headers.
+
+        Raises:
+            ValueError: If an exported or calculated field is not a field of the layout.
+        """
+        export_fields = tuple(export_fields)
+        self.tag = tag
+        self.fields = tuple(fields)
+        self.export_fields = tuple(attribute for attribute, _ in export_fields)
+        self.export_headers = tuple(header for _, header in export_fields)
+        self.calculated_columns = tuple(calculated_columns)
+
+        field_names = {name for name, _ in self.fields}
+        used_fields = set(self.export_fields).union(*(column.fields for column in self.calculated_columns))
+        if not used_fields <= field_names:
+            raise ValueError(f'Unknown Fields in Schema of Sensor {tag}: {", ".join(sorted(used_fields - field_names))}!')
+
+        self.timestamp_fields = tuple(name for name in self.TIMESTAMP_FIELDS if name in field_names)
+        self.timestamp_headers = self.timestamp_fields
+        if 'app_timestamp' in self.timestamp_fields:
+            self.timestamp_headers += (self.WALL_TIME_HEADER,)
+
+        calculated_headers = tuple(column.header for column in self.calculated_columns)
+        self.headers = {
+            (include_calculated, include_timestamps): ','.join(
+                ('index',) + (self.timestamp_headers if include_timestamps else ()) + self.export_headers
+                + (calculated_headers if include_calculated else ()))
+            for include_calculated in (False, True) for include_timestamps in (False, True)
+        }
+
+    def with_tag(self, tag: str) -> 'SensorSchema':
+        """
+        Get the same schema for another sensor tag, e.g. for sensors sharing a layout.
+
+        Args:
+            tag (str): The sensor tag of the new schema.
+
+        Returns:
+            SensorSchema: A schema with the same fields, exports and calculated columns.
+        """
+        return SensorSchema(tag, self.fields, zip(self.export_fields, self.export_headers), self.calculated_columns)
+
+    def get_headers(self, include_calculated: bool = False, include_timestamps: bool = False) -> str:
+        """
+        Get the header line of the CSV file.
+
+        Args:
+            include_calculated (bool): Whether to include the headers of the calculated columns.
+            include_timestamps (bool): Whether to include the headers of the timestamp columns.
+
+        Returns:
+            str: A comma-separated string of header names.
+        """
+        return self.headers[bool(include_calculated), bool(include_timestamps)]
+
+    def calculate_columns(self, columns: Dict[str, Sequence]) -> tuple:
+        """
+        Calculate the calculated columns of whole data columns at once.
+
+        Every value is calculated by the same scalar calculation as export_values, so a
+        columnar export writes exactly the values of the record export.
+
+        Args:
+            columns (Dict[str, Sequence]): Mapping of attribute name to its column of values.
+
+        Returns:
+            tuple: The calculated columns, in the order of the headers.
+        """
+        return tuple(list(map(column.calculate, *(columns[name] for name in column.fields)))
+                     for column in self.calculated_columns)
+
+    def calculate_batch_columns(self, columns: Dict[str, Sequence]) -> tuple:
+        """
+        Calculate the calculated columns of whole data columns with the vectorized calculations.
+
+        The batch methods of the calculators are used for the DataFrames of the
+        analyzers. NumPy rounds some values (e.g. of powers and arctangents)
+        differently from the scalar calculations in the last bit, so the exports
+        use calculate_columns instead.
+
+        Args:
+            columns (Dict[str, Sequence]): Mapping of attribute name to its column of values.
+
+        Returns:
+            tuple: The calculated columns as NumPy arrays, in the order of the headers.
+        """
+        return tuple(column.calculate_batch(*(columns[name] for name in column.fields))
+                     for column in self.calculated_columns)
+
+    def compile_init(self, base_attributes: Sequence[str] = ()) -> Callable:
+        """
+        Compile the constructor of the sensor class.
+
+        The constructor takes the field values in layout order (after the tag, for a
+        schema without a tag) and stores every value cast to its field type. Base
+        attributes that are not fields of the layout are set to None.
+
+        Args:
+            base_attributes (Sequence[str]): Attributes of the base class set by every constructor.
+
+        Returns:
+            Callable: The __init__ function of the sensor class.
+        """
+        names = [name for name, _ in self.fields]
+        namespace = {f'_cast_{position}': field_type for position, (_, field_type) in enumerate(self.fields)}
+
+        lines = [f"    self.tag = {'tag' if self.tag is None else repr(self.tag)}"]
+        lines.extend(f'    self.{name} = None' for name in base_attributes if name != 'tag' and name not in names)
+        lines.extend(f'    self.{name} = _cast_{position}({name})' for position, name in enumerate(names))
+        parameters = ', '.join(['self'] + (['tag'] if self.tag is None else []) + names)
+        return self.compile_function(f'def __init__({parameters}):\n' + '\n'.join(lines), namespace, '__init__')
+
+    def compile_export_values(self) -> Callable:
+        """
+        Compile the export_values method of the sensor class.
+
+        The method returns the row index followed by the exported attributes, and the
+        values of the calculated columns calculated from the attributes of the record
+        if requested, as one tuple in the order of the headers. With the timestamps,
+        the timestamp attributes and the wall-clock time (the AppTimestamp after the
+        creation time of the logfile, NaN if it is unknown) follow the row index.
+
+        Returns:
+            Callable: The export_values function of the sensor class.
+        """
+        namespace = {f'_calculate_{position}': column.calculate
+                     for position, column in enumerate(self.calculated_columns)}
+        namespace['_nan'] = float('nan')
+
+        export_values = [f'self.{name}' for name in self.export_fields]
+        timestamp_values = [f'self.{name}' for name in self.timestamp_fields]
+        if self.WALL_TIME_HEADER in self.timestamp_headers:
+            timestamp_values.append('self.app_timestamp + creation_time')
+        base_row = ', '.join(['index'] + export_values)
+        timestamp_row = ', '.join(['index'] + timestamp_values + export_values)
+        calculated_values = ''.join(f"_calculate_{position}({', '.join(f'self.{name}' for name in column.fields)}), "
+                                    for position, column in enumerate(self.calculated_columns))
+        source = (f'def export_values(self, index, include_calculated=False, include_timestamps=False, creation_time=_nan):\n'
+                  f'    if include_timestamps:\n'
+                  f'        base_row = ({timestamp_row},)\n'
+                  f'    else:\n'
+                  f'        base_row = ({base_row},)\n'
+                  f'    if include_calculated:\n'
+                  f'        return base_row + ({calculated_values})\n'
+                  f'    return base_row')
+        return self.compile_function(source, namespace, 'export_values')
+
+    def compile_function(self, source: str, namespace: dict, name: str) -> Callable:
+        """
+        Compile the generated source of a function.
+
+        Args:
+            source (str): The source of the function definition.
+            namespace (dict): The globals the function refers to, e.g. its type casts.
+            name (str): Name of the defined function.
+
+        Returns:
+            Callable: The compiled function.
+        """
+        exec(compile(source, f'<{self.tag or "sensor"} schema>', 'exec'), namespace)
+        return namespace[name]
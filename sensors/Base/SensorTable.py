@@ -0,0 +1,222 @@
+from array import array
+
+class SensorTable:
+    """
+    A class to store the parsed data of a single sensor type in columnar form.
+
+    Instead of keeping one sensor object per logfile line, every field declared in
+    the sensor class' FIELDS layout is kept in its own column. Numeric fields are
+    stored in compact `array.array` buffers ('d' for floats, 'q' for integers) and
+    text fields in plain lists, so a sample costs only a few bytes per field.
+
+    Attributes:
+        tag (str): Sensor tag or sensor ID to identify the sensor type.
+        sensor_class (type): Sensor class used to create record objects from rows.
+        columns (dict): Mapping of field name to its column buffer.
+
+    Methods:
+        append(values): Convert and append one logfile data row to the table.
+        extend_lines(lines): Convert and append a batch of raw logfile data lines column by column.
+        extend_table(other): Append all rows of another table of the same sensor type.
+        get_column(name): Get the column buffer of a field.
+        records(): Yield sensor objects for every row of the table.
+        export_columns(include_calculated, first_index, include_timestamps, creation_time): Get the exported
+            columns of the table.
+    """
+
+    TYPE_CODES = {float: 'd', int: 'q'}
+
+    def __init__(self, tag, sensor_class):
+        """
+        Initialize an empty SensorTable for a sensor type.
+
+        Args:
+            tag (str): Sensor tag or sensor ID.
+            sensor_class (type): Sensor class whose FIELDS layout defines the columns.
+        """
+        self.tag = tag
+        self.sensor_class = sensor_class
+        self.columns = {}
+        for name, field_type in sensor_class.FIELDS:
+            type_code = self.TYPE_CODES.get(field_type)
+            self.columns[name] = array(type_code) if type_code else []
+        self._cache_converters()
+
+    def _cache_converters(self):
+        """
+        Cache the type casts and bound append methods to keep the per-row cost low.
+        """
+        self._casts = tuple(self.to_text if field_type is str else field_type
+                            for _, field_type in self.sensor_class.FIELDS)
+        self._appenders = tuple(column.append for column in self.columns.values())
+
+    def __getstate__(self):
+        """
+        Get the picklable state of the table, e.g. to send it between processes.
+
+        Returns:
+            dict: The tag, sensor class and columns of the table.
+        """
+        return {'tag': self.tag, 'sensor_class': self.sensor_class, 'columns': self.columns}
+
+    def __setstate__(self, state):
+        """
+        Restore the table from its pickled state.
+
+        Args:
+            state (dict): The state returned by __getstate__.
+        """
+        self.__dict__.update(state)
+        self._cache_converters()
+
+    @staticmethod
+    def to_text(value):
+        """
+        Convert a raw field value to text.
+
+        Args:
+            value (str | bytes): The raw field value, as text or as UTF-8 encoded bytes.
+
+        Returns:
+            str: The field value as text.
+        """
+        return value.decode('utf-8') if isinstance(value, bytes) else str(value)
+
+    def __len__(self):
+        """
+        Get the number of rows stored in the table.
+
+        Returns:
+            int: The number of rows.
+        """
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def append(self, values):
+        """
+        Convert and append one logfile data row to the table.
+
+        The row is converted completely before any column is touched, so a bad
+        value never leaves the columns with different lengths.
+
+        Args:
+            values (list): Raw field values of the row (str or bytes), without the sensor tag.
+
+        Raises:
+            ValueError: If the number of values does not match the sensor layout,
+                or if a value cannot be converted to its field type.
+        """
+        if len(values) != len(self._casts):
+            raise ValueError(f'Expected {len(self._casts)} Values For Sensor {self.tag}, Got {len(values)}!')
+
+        row = [cast(value) for cast, value in zip(self._casts, values)]
+        for append, value in zip(self._appenders, row):
+            append(value)
+
+    def extend_lines(self, lines):
+        """
+        Convert and append a batch of raw logfile data lines column by column.
+
+        All lines of the batch are joined and split into fields in one step, and
+        every column is then sliced out of the fields and converted in bulk (e.g.
+        straight into an `array.array` of floats), which is much cheaper than
+        converting line by line. The whole batch is converted before any column is
+        touched, so a bad line leaves the table unchanged and the caller can fall
+        back to append() to find the offending lines.
+
+        Args:
+            lines (list): Raw data lines (bytes) of this sensor, including the tag.
+
+        Raises:
+            ValueError: If the number of values of any line does not match the sensor
+                layout, or if any value cannot be converted to its field type.
+        """
+        if not lines:
+            return
+
+        # split all lines at once, so every line occupies `stride` consecutive fields
+        stride = len(self._casts) + 1
+        fields = b';'.join(lines).split(b';')
+        if len(fields) != len(lines) * stride or fields[::stride].count(self.tag.encode()) != len(lines):
+            raise ValueError(f'Expected {len(self._casts)} Values For Sensor {self.tag} in Every Line!')
+
+        converted_columns = []
+        for position, (column, cast) in enumerate(zip(self.columns.values(), self._casts), 1):
+            values = fields[position::stride]
+            if isinstance(column, array):
+                converted_columns.append(array(column.typecode, map(cast, values)))
+            else:
+                converted_columns.append(list(map(cast, values)))
+
+        for column, converted_column in zip(self.columns.values(), converted_columns):
+            column.extend(converted_column)
+
+    def extend_table(self, other):
+        """
+        Append all rows of another table of the same sensor type.
+
+        Args:
+            other (SensorTable): The table whose rows are appended after the rows of this table.
+        """
+        for column, other_column in zip(self.columns.values(), other.columns.values()):
+            column.extend(other_column)
+
+    def get_column(self, name):
+        """
+        Get the column buffer of a field.
+
+        Args:
+            name (str): Name of the field as declared in the sensor layout.
+
+        Returns:
+            array.array | list: The column buffer of the field.
+        """
+        return self.columns[name]
+
+    def records(self):
+        """
+        Yield sensor objects for every row of the table.
+
+        The objects are created lazily one row at a time, so the existing
+        export_row/get_headers path can be used on top of the table without
+        materializing the whole recording as objects.
+
+        Yields:
+            SensorBase: A sensor object for each row, in parsed order.
+        """
+        for row in zip(*self.columns.values()):
+            yield self.sensor_class(*row)
+
+    def export_columns(self, include_calculated=False, first_index=1, include_timestamps=False, creation_time=None):
+        """
+        Get the exported columns of the table.
+
+        The exported fields are taken straight from the columns, and the calculated
+        values are calculated from the columns with the calculations declared in the
+        schema of the sensor, so no sensor object is created per row.
+
+        Args:
+            include_calculated (bool): Whether to include calculated values.
+            first_index (int): The row index of the first row, e.g. to continue the
+                rows of an existing export.
+            include_timestamps (bool): Whether to include the timestamp columns and the
+                wall-clock time after the row index.
+            creation_time (float, optional): Unix time of the creation of the logfile, added
+                to the AppTimestamps for the wall-clock time. If None, the wall-clock time is NaN.
+
+        Returns:
+            list: The row index column followed by the exported and calculated columns,
+                in the order of the headers.
+        """
+        export_columns = [range(first_index, first_index + len(self))]
+        if include_timestamps:
+            schema = self.sensor_class.SCHEMA
+            export_columns.extend(self.columns[name] for name in schema.timestamp_fields)
+            if schema.WALL_TIME_HEADER in schema.timestamp_headers:
+                creation_time = float('nan') if creation_time is None else creation_time
+                export_columns.append([app_timestamp + creation_time for app_timestamp in self.columns['app_timestamp']])
+        export_columns.extend(self.columns[name] for name in self.sensor_class.EXPORT_FIELDS)
+        if include_calculated:
+            export_columns.extend(self.sensor_class.calculate_columns(self.columns))
+        return export_columns
@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class BluetoothCalculator:
     """
     A class to perform calculations related to Bluetooth sensor data.
@@ -14,4 +19,19 @@ class BluetoothCalculator:
         Returns:
             str: 'Strong Signal' if RSS >= -60, otherwise 'Weak Signal'.
         """
-        return 'Strong Signal' if RSS >= -60 else 'Weak Signal'
\ No newline at end of file
+        return 'Strong Signal' if RSS >= -60 else 'Weak Signal'
+
+    @staticmethod
+    def calculate_signal_strength_batch(RSS: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the signal strength for a whole column of Received Signal Strengths.
+
+        Args:
+            RSS (np.ndarray): Received Signal Strengths.
+
+        Returns:
+            np.ndarray: 'Strong Signal' where RSS >= -60, otherwise 'Weak Signal'.
+        """
+        import numpy as np
+
+        return np.where(np.asarray(RSS) >= -60, 'Strong Signal', 'Weak Signal')
@@ -0,0 +1,254 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..Base.SensorTable import SensorTable
+
+class SensorAligner:
+    """
+    A class to align the parsed tables of several sensors onto a common time grid.
+
+    Every sensor is sampled at the times of a regular grid (e.g. 100 Hz) spanning
+    the time window that all aligned sensors cover, which fuses them into one
+    DataFrame with a time column and one column per sensor field. The samples are
+    looked up for whole columns at once with np.searchsorted and np.interp, so
+    aligning a long recording costs a few array operations per column instead of
+    a Python loop over its rows.
+
+    The sampling methods are:
+        nearest: The value of the sample closest in time to the grid time.
+        linear: The value interpolated linearly between the samples around the grid time.
+        asof: The value of the last sample at or before the grid time.
+
+    The time base is the AppTimestamp of the rows, which all sensors share, or
+    their SensorTimestamp. Sensor clocks differ between sensors (e.g. GNSS reports
+    Unix time, the motion sensors the time since boot), so the SensorTimestamps of
+    each sensor are shifted onto the app clock by their median offset to the
+    AppTimestamps, keeping the precise spacing of the sensor clock.
+
+    Attributes:
+        rate (float): Sampling rate of the time grid in Hz.
+        method (str): Sampling method, one of METHODS.
+        time_base (str): Time base of the alignment, one of TIME_BASES.
+        tolerance (float, optional): Maximum distance in seconds between a grid time and the
+            sample(s) it is taken from, beyond which the value is NaN.
+
+    Methods:
+        align(sensors_tables, tags, include_calculated): Align sensor tables onto a common time grid.
+        get_times(sensor_table): Get the timestamps of a sensor table on the time base.
+        build_grid(times): Build the time grid covered by all sensors.
+        sample(times, values, grid): Sample a column of values at the grid times.
+    """
+
+    METHODS = ('nearest', 'linear', 'asof')
+    TIME_BASES = ('app', 'sensor')
+    DEFAULT_RATE = 100.0
+    DEFAULT_TAGS = ('ACCE', 'GYRO', 'MAGN', 'AHRS', 'PRES', 'GNSS')
+
+    def __init__(self, rate: Optional[float] = None, method: str = 'linear', time_base: str = 'app',
+                 tolerance: Optional[float] = None):
+        """
+        Initialize the SensorAligner.
+
+        Args:
+            rate (float, optional): Sampling rate of the time grid in Hz. Defaults to DEFAULT_RATE.
+            method (str): Sampling method, 'nearest', 'linear' or 'asof'.
+            time_base (str): Time base of the alignment, 'app' (AppTimestamp) or 'sensor'
+                (SensorTimestamp).
+            tolerance (float, optional): Maximum distance in seconds between a grid time and the
+                sample(s) it is taken from. If None, every grid time gets a value.
+
+        Raises:
+            ValueError: If the rate, method, time base or tolerance is invalid.
+        """
+        rate = self.DEFAULT_RATE if rate is None else rate
+        if rate <= 0:
+            raise ValueError('Invalid Rate! Rate Must Be Greater Than 0!')
+        if method not in self.METHODS:
+            raise ValueError(f'Invalid Alignment Method! Available Methods: {", ".join(self.METHODS)}')
+        if time_base not in self.TIME_BASES:
+            raise ValueError(f'Invalid Time Base! Available Time Bases: {", ".join(self.TIME_BASES)}')
+        if tolerance is not None and tolerance < 0:
+            raise ValueError('Invalid Tolerance! Tolerance Must Be at Least 0!')
+        self.rate = rate
+        self.method = method
+        self.time_base = time_base
+        self.tolerance = tolerance
+
+    def align(self, sensors_tables: Dict[str, SensorTable], tags: Optional[Iterable[str]] = None,
+              include_calculated: bool = False) -> pd.DataFrame:
+        """
+        Align sensor tables onto a common time grid.
+
+        Only the numeric fields of the sensors are aligned. The columns of the result are
+        named after the sensor tag and the header of the field, e.g. 'ACCE_acc_x'.
+
+        Args:
+            sensors_tables (Dict[str, SensorTable]): A mapping of sensor tag to its parsed table.
+            tags (Iterable[str], optional): Sensor tags to align. If None, the DEFAULT_TAGS found
+                in the tables are aligned.
+            include_calculated (bool): Whether to align the numeric calculated columns as well.
+
+        Returns:
+            pd.DataFrame: The 'time' column of the grid followed by the aligned columns of every
+                sensor, in the order of the tags.
+
+        Raises:
+            ValueError: If a requested sensor has no data or no timestamps on the time base, or if
+                the sensors do not overlap in time.
+        """
+        if tags is None:
+            tags = [tag for tag in self.DEFAULT_TAGS if sensors_tables.get(tag)]
+        tags = list(tags)
+        if not tags:
+            raise ValueError('No Sensor Data Found to Align!')
+
+        times = {}  # mapping of sensor tag to its sorted timestamps
+        orders = {}  # mapping of sensor tag to the order sorting its rows, or None if already sorted
+        for tag in tags:
+            sensor_table = sensors_tables.get(tag)
+            if not sensor_table:
+                raise ValueError(f'No Data Found For Sensor {tag}!')
+            times[tag], orders[tag] = self.sort_times(self.get_times(sensor_table))
+
+        grid = self.build_grid(times.values())
+        aligned_columns = {'time': grid}
+        for tag in tags:
+            for header, column in self.get_numeric_columns(sensors_tables[tag], include_calculated):
+                values = np.asarray(column)
+                if orders[tag] is not None:
+                    values = values[orders[tag]]
+                aligned_columns[f'{tag}_{header}'] = self.sample(times[tag], values, grid)
+        return pd.DataFrame(aligned_columns)
+
+    def get_times(self, sensor_table: SensorTable) -> np.ndarray:
+        """
+        Get the timestamps of a sensor table on the time base.
+
+        Args:
+            sensor_table (SensorTable): The parsed table of a sensor.
+
+        Returns:
+            np.ndarray: The timestamp of every row in seconds, in row order.
+
+        Raises:
+            ValueError: If the sensor has no timestamps on the time base.
+        """
+        field_names = [name for name, _ in sensor_table.sensor_class.FIELDS]
+        if 'app_timestamp' not in field_names:
+            raise ValueError(f'Sensor {sensor_table.tag} Has No AppTimestamp to Align On!')
+        app_times = np.asarray(sensor_table.get_column('app_timestamp'), dtype=float)
+        if self.time_base == 'app':
+            return app_times
+
+        if 'sensor_timestamp' not in field_names:
+            raise ValueError(f'Sensor {sensor_table.tag} Has No SensorTimestamp to Align On!')
+        sensor_times = np.asarray(sensor_table.get_column('sensor_timestamp'), dtype=float)
+        # shifted the sensor clock onto the app clock shared by all sensors
+        return sensor_times + np.median(app_times - sensor_times)
+
+    @staticmethod
+    def sort_times(times: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Sort the timestamps of a sensor, if they are out of order.
+
+        Args:
+            times (np.ndarray): The timestamps of the rows, in row order.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray | None]: The sorted timestamps, and the order sorting
+                the rows, or None if the rows were sorted already.
+        """
+        if len(times) < 2 or np.all(times[1:] >= times[:-1]):
+            return times, None
+        order = np.argsort(times, kind='stable')
+        return times[order], order
+
+    def build_grid(self, times: Iterable[np.ndarray]) -> np.ndarray:
+        """
+        Build the time grid covered by all sensors.
+
+        The grid starts at the latest first timestamp of the sensors and ends at or
+        before their earliest last timestamp, so every grid time lies between samples
+        of every sensor and nothing is extrapolated.
+
+        Args:
+            times (Iterable[np.ndarray]): The sorted timestamps of every sensor.
+
+        Returns:
+            np.ndarray: The grid times in seconds.
+
+        Raises:
+            ValueError: If the sensors do not overlap in time.
+        """
+        times = list(times)
+        start = max(sensor_times[0] for sensor_times in times)
+        end = min(sensor_times[-1] for sensor_times in times)
+        if start > end:
+            raise ValueError('The Sensors Do Not Overlap in Time!')
+        # computed every grid time from the start, so rounding errors do not add up
+        count = int(np.floor((end - start) * self.rate + 1e-9)) + 1
+        return start + np.arange(count) / self.rate
+
+    def sample(self, times: np.ndarray, values: np.ndarray, grid: np.ndarray) -> np.ndarray:
+        """
+        Sample a column of values at the grid times.
+
+        Args:
+            times (np.ndarray): The sorted timestamps of the sensor.
+            values (np.ndarray): The values of the column, in the order of the timestamps.
+            grid (np.ndarray): The grid times.
+
+        Returns:
+            np.ndarray: The value of the column at every grid time, NaN where the samples
+                are farther away than the tolerance.
+        """
+        # found the last sample at or before, and the first sample after, every grid time
+        positions = np.searchsorted(times, grid, side='right')
+        before = np.maximum(positions - 1, 0)
+        after = np.minimum(positions, len(times) - 1)
+        distance_before = grid - times[before]
+        distance_after = times[after] - grid
+
+        if self.method == 'linear':
+            sampled = np.interp(grid, times, values.astype(float))
+            distance = np.maximum(distance_before, distance_after)
+        elif self.method == 'nearest':
+            nearest = np.where(distance_after < distance_before, after, before)
+            sampled = values[nearest]
+            distance = np.abs(grid - times[nearest])
+        else:
+            sampled = values[before]
+            distance = distance_before
+
+        if self.tolerance is not None:
+            outside = distance > self.tolerance
+            if outside.any():
+                sampled = sampled.astype(float)
+                sampled[outside] = np.nan
+        return sampled
+
+    @staticmethod
+    def get_numeric_columns(sensor_table: SensorTable, include_calculated: bool = False) -> List[Tuple[str, object]]:
+        """
+        Get the numeric exported (and calculated) columns of a sensor table with their headers.
+
+        Args:
+            sensor_table (SensorTable): The parsed table of a sensor.
+            include_calculated (bool): Whether to include the numeric calculated columns.
+
+        Returns:
+            List[Tuple[str, object]]: The (header, column) pairs, in the order of the headers.
+        """
+        schema = sensor_table.sensor_class.SCHEMA
+        field_types = dict(schema.fields)
+        columns = [(header, sensor_table.get_column(name))
+                   for name, header in zip(schema.export_fields, schema.export_headers)
+                   if field_types[name] in (float, int)]
+        if include_calculated:
+            calculated = sensor_table.sensor_class.calculate_columns(sensor_table.columns)
+            columns.extend((column.header, values)
+                           for column, values in zip(schema.calculated_columns, calculated)
+                           if np.asarray(values).dtype.kind in 'fiub')
+        return columns
@@ -1,31 +1,37 @@
 from datetime import datetime
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
 import seaborn as sns
 import folium
+from typing import Union
 from folium.plugins import HeatMap
 from .GNSS_GPS_Calculator import GNSS_GPS_Calculator
+from ..IO.SensorFrameLoader import SensorFrameLoader
 
 class GNSS_GPS_Analyzer:
     """
     A class to analyze GNSS/GPS data from a CSV file.
     """
 
-    def __init__(self, csv_file_path: str):
+    def __init__(self, data: Union[str, pd.DataFrame], distance_method: str = 'vincenty'):
         """
         Initialize the GNSS_GPS_Analyzer object.
 
         Args:
-            csv_file_path (str): Path to the CSV file containing GPS data.
+            data (str | pd.DataFrame): Path to the exported file (CSV, Parquet, Feather or NPZ) containing GPS data,
+                or a DataFrame of the data, e.g. parsed straight from a logfile.
+            distance_method (str): Distance method, 'vincenty' (WGS-84 ellipsoid, as geopy's geodesic) or
+                'haversine' (spherical).
         """
-        self.df = pd.read_csv(csv_file_path)
-        self.df['timestamp'] = pd.to_datetime(self.df['index'], unit='s')
-        self.df['total_speed'] = self.df.apply(lambda row: GNSS_GPS_Calculator.calculate_total_speed(row['speed'], row['bearing']), axis=1)
-        
-        self.df['distance'] = self.df.apply(lambda row: GNSS_GPS_Calculator.calculate_distance(
-            row['latit'], row['long'],
-            self.df.iloc[0]['latit'], self.df.iloc[0]['long']
-        ), axis=1)
+        self.df = SensorFrameLoader.load(data)
+        self.df['total_speed'] = GNSS_GPS_Calculator.calculate_total_speed_batch(self.df['speed'], self.df['bearing'])
+
+        # calculated the path length and the distance from the start at every fix
+        latitude, longitude = self.df['latit'].to_numpy(), self.df['long'].to_numpy()
+        self.df['path_length'] = GNSS_GPS_Calculator.calculate_path_length_batch(latitude, longitude, distance_method)
+        self.df['distance'] = GNSS_GPS_Calculator.calculate_distance_to_reference_batch(
+            latitude, longitude, latitude[0], longitude[0], distance_method)
 
     def plot_location_tracking(self):
         """
@@ -59,7 +65,7 @@ class GNSS_GPS_Analyzer:
         Plot altitude changes over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['altitude'])
+        plt.plot(self.df.index, self.df['altitude'])
         plt.title('Altitude Changes Over Time')
         plt.xlabel('Time')
         plt.ylabel('Altitude (m)')
@@ -72,7 +78,7 @@ class GNSS_GPS_Analyzer:
         """
         fig = plt.figure(figsize=(12, 8))
         ax = fig.add_subplot(111, projection='3d')
-        scatter = ax.scatter(self.df['long'], self.df['latit'], self.df['altitude'], c=self.df['timestamp'], cmap='viridis')
+        scatter = ax.scatter(self.df['long'], self.df['latit'], self.df['altitude'], c=mdates.date2num(self.df.index), cmap='viridis')
         plt.colorbar(scatter, label='Time')
         ax.set_xlabel('Longitude')
         ax.set_ylabel('Latitude')
@@ -96,8 +102,8 @@ class GNSS_GPS_Analyzer:
         Plot satellite usage over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['sat_in_view'], label='Satellites in View')
-        plt.plot(self.df['timestamp'], self.df['sat_in_use'], label='Satellites in Use')
+        plt.plot(self.df.index, self.df['sat_in_view'], label='Satellites in View')
+        plt.plot(self.df.index, self.df['sat_in_use'], label='Satellites in Use')
         plt.title('Satellite Usage Over Time')
         plt.xlabel('Time')
         plt.ylabel('Number of Satellites')
@@ -118,7 +124,8 @@ class GNSS_GPS_Analyzer:
         self.plot_satellites_usage()
         
         print("\nGPS Statistics:")
-        print(f"Total Distance Traveled: {self.df['distance'].iloc[-1]:.2f} meters")
+        print(f"Total Distance Traveled: {self.df['path_length'].iloc[-1]:.2f} meters")
+        print(f"Distance From Start: {self.df['distance'].iloc[-1]:.2f} meters")
         print(f"Average Speed: {self.df['speed'].mean():.2f} m/s")
         print(f"Maximum Speed: {self.df['speed'].max():.2f} m/s")
         print(f"Average Altitude: {self.df['altitude'].mean():.2f} meters")
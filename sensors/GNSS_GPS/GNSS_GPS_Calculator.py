@@ -1,11 +1,31 @@
 import math
-from geopy.distance import geodesic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class GNSS_GPS_Calculator:
     """
     A class to perform calculations related to GNSS/GPS data.
+
+    The distance calculations of whole tracks are vectorized with NumPy: the
+    Vincenty distance on the WGS-84 ellipsoid by default (as accurate as geopy's
+    geodesic of calculate_distance, iterated for all points at once), or the
+    haversine distance on a sphere of the mean Earth radius (faster, within about
+    0.5% of the ellipsoidal distance).
+
+    Attributes:
+        EARTH_RADIUS (float): Mean radius of the Earth in meters, used by the haversine distance.
+        WGS84_A (float): Semi-major axis of the WGS-84 ellipsoid in meters.
+        WGS84_F (float): Flattening of the WGS-84 ellipsoid.
+        DISTANCE_METHODS (Tuple[str, ...]): Available methods of the batch distance calculations.
     """
 
+    EARTH_RADIUS = 6371008.8
+    WGS84_A = 6378137.0
+    WGS84_F = 1 / 298.257223563
+    DISTANCE_METHODS = ('vincenty', 'haversine')
+
     @staticmethod
     def calculate_total_speed(speed: float, bearing: float) -> float:
         """
@@ -34,4 +54,207 @@ class GNSS_GPS_Calculator:
         Returns:
             float: The calculated distance in meters.
         """
-        return geodesic((lat1, lon1), (lat2, lon2)).meters
\ No newline at end of file
+        from geopy.distance import geodesic
+        return geodesic((lat1, lon1), (lat2, lon2)).meters
+
+    @staticmethod
+    def calculate_total_speed_batch(speed: 'np.ndarray', bearing: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the total speed based on speed and bearing for whole columns.
+
+        Args:
+            speed (np.ndarray): The speed values.
+            bearing (np.ndarray): The bearing values.
+
+        Returns:
+            np.ndarray: The calculated total speed of each sample.
+        """
+        import numpy as np
+
+        speed, bearing = np.asarray(speed, dtype=float), np.asarray(bearing, dtype=float)
+        return np.sqrt(speed ** 2 + bearing ** 2)
+
+    @staticmethod
+    def calculate_distance_batch(lat1: 'np.ndarray', lon1: 'np.ndarray', lat2: 'np.ndarray', lon2: 'np.ndarray',
+                                 method: str = 'vincenty') -> 'np.ndarray':
+        """
+        Calculate the distances between pairs of GPS coordinates for whole columns.
+
+        Args:
+            lat1 (np.ndarray): Latitudes of the first points in degrees.
+            lon1 (np.ndarray): Longitudes of the first points in degrees.
+            lat2 (np.ndarray): Latitudes of the second points in degrees (or a single latitude).
+            lon2 (np.ndarray): Longitudes of the second points in degrees (or a single longitude).
+            method (str): Distance method, 'vincenty' or 'haversine'.
+
+        Returns:
+            np.ndarray: The calculated distance of each pair in meters.
+
+        Raises:
+            ValueError: If the distance method is invalid.
+        """
+        if method == 'haversine':
+            return GNSS_GPS_Calculator.calculate_haversine_distance_batch(lat1, lon1, lat2, lon2)
+        if method == 'vincenty':
+            return GNSS_GPS_Calculator.calculate_vincenty_distance_batch(lat1, lon1, lat2, lon2)
+        raise ValueError(f'Invalid Distance Method! Available Methods: {", ".join(GNSS_GPS_Calculator.DISTANCE_METHODS)}')
+
+    @staticmethod
+    def calculate_haversine_distance_batch(lat1: 'np.ndarray', lon1: 'np.ndarray',
+                                           lat2: 'np.ndarray', lon2: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the great-circle distances between pairs of GPS coordinates with the haversine formula.
+
+        Args:
+            lat1 (np.ndarray): Latitudes of the first points in degrees.
+            lon1 (np.ndarray): Longitudes of the first points in degrees.
+            lat2 (np.ndarray): Latitudes of the second points in degrees.
+            lon2 (np.ndarray): Longitudes of the second points in degrees.
+
+        Returns:
+            np.ndarray: The calculated distance of each pair in meters.
+        """
+        import numpy as np
+
+        lat1, lon1, lat2, lon2 = (np.radians(np.asarray(values, dtype=float)) for values in (lat1, lon1, lat2, lon2))
+        haversine = (np.sin((lat2 - lat1) / 2) ** 2
+                     + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+        # clipped rounding errors above 1, which would make the square root invalid
+        return 2 * GNSS_GPS_Calculator.EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(haversine, 1.0)))
+
+    @staticmethod
+    def calculate_vincenty_distance_batch(lat1: 'np.ndarray', lon1: 'np.ndarray', lat2: 'np.ndarray', lon2: 'np.ndarray',
+                                          max_iterations: int = 200, tolerance: float = 1e-12) -> 'np.ndarray':
+        """
+        Calculate the ellipsoidal distances between pairs of GPS coordinates with Vincenty's inverse formula.
+
+        All pairs are iterated together until every one has converged. Vincenty's formula
+        does not converge for nearly antipodal points, whose haversine distance is
+        returned instead.
+
+        Args:
+            lat1 (np.ndarray): Latitudes of the first points in degrees.
+            lon1 (np.ndarray): Longitudes of the first points in degrees.
+            lat2 (np.ndarray): Latitudes of the second points in degrees.
+            lon2 (np.ndarray): Longitudes of the second points in degrees.
+            max_iterations (int): Maximum number of iterations.
+            tolerance (float): Change of the longitude on the auxiliary sphere (in radians) below
+                which a pair has converged.
+
+        Returns:
+            np.ndarray: The calculated distance of each pair in meters.
+        """
+        import numpy as np
+
+        a, f = GNSS_GPS_Calculator.WGS84_A, GNSS_GPS_Calculator.WGS84_F
+        b = (1 - f) * a
+        lat1, lon1, lat2, lon2 = np.broadcast_arrays(*(np.asarray(values, dtype=float) for values in (lat1, lon1, lat2, lon2)))
+
+        # reduced the latitudes onto the auxiliary sphere
+        L = np.radians(lon2 - lon1)
+        U1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+        U2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+        sin_U1, cos_U1 = np.sin(U1), np.cos(U1)
+        sin_U2, cos_U2 = np.sin(U2), np.cos(U2)
+
+        lam = L
+        converged = np.zeros(L.shape, dtype=bool)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for _ in range(max_iterations):
+                sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+                sin_sigma = np.hypot(cos_U2 * sin_lam, cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lam)
+                cos_sigma = sin_U1 * sin_U2 + cos_U1 * cos_U2 * cos_lam
+                sigma = np.arctan2(sin_sigma, cos_sigma)
+                # coincident points have no azimuth, and points on the equator no midpoint latitude
+                sin_alpha = np.where(sin_sigma == 0, 0.0, cos_U1 * cos_U2 * sin_lam / sin_sigma)
+                cos2_alpha = 1 - sin_alpha ** 2
+                cos_2sigma_m = np.where(cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_U1 * sin_U2 / cos2_alpha)
+                C = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+                previous_lam = lam
+                lam = L + (1 - C) * f * sin_alpha * (
+                    sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)))
+                converged = np.abs(lam - previous_lam) <= tolerance
+                if converged.all():
+                    break
+
+        u2 = cos2_alpha * (a ** 2 - b ** 2) / b ** 2
+        A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+        B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+        delta_sigma = B * sin_sigma * (cos_2sigma_m + B / 4 * (
+            cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+            - B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)))
+        distance = b * A * (sigma - delta_sigma)
+
+        # fell back to the haversine distance for the pairs that did not converge
+        diverged = ~converged & ~np.isnan(lam)
+        if diverged.any():
+            distance = np.where(diverged, GNSS_GPS_Calculator.calculate_haversine_distance_batch(
+                lat1, lon1, lat2, lon2), distance)
+        return distance
+
+    @staticmethod
+    def calculate_step_distance_batch(latitude: 'np.ndarray', longitude: 'np.ndarray',
+                                      method: str = 'vincenty') -> 'np.ndarray':
+        """
+        Calculate the distance from the previous fix of a track to every fix.
+
+        Args:
+            latitude (np.ndarray): The latitudes of the track in degrees, in time order.
+            longitude (np.ndarray): The longitudes of the track in degrees, in time order.
+            method (str): Distance method, 'vincenty' or 'haversine'.
+
+        Returns:
+            np.ndarray: The distance of each fix from the previous one in meters, 0 for the first fix.
+        """
+        import numpy as np
+
+        latitude, longitude = np.asarray(latitude, dtype=float), np.asarray(longitude, dtype=float)
+        step_distance = np.zeros(len(latitude))
+        if len(latitude) > 1:
+            step_distance[1:] = GNSS_GPS_Calculator.calculate_distance_batch(
+                latitude[:-1], longitude[:-1], latitude[1:], longitude[1:], method)
+        return step_distance
+
+    @staticmethod
+    def calculate_path_length_batch(latitude: 'np.ndarray', longitude: 'np.ndarray',
+                                    method: str = 'vincenty') -> 'np.ndarray':
+        """
+        Calculate the cumulative path length of a track (its odometer) at every fix.
+
+        Steps from or to a fix without a position (NaN) are left out of the path length.
+
+        Args:
+            latitude (np.ndarray): The latitudes of the track in degrees, in time order.
+            longitude (np.ndarray): The longitudes of the track in degrees, in time order.
+            method (str): Distance method, 'vincenty' or 'haversine'.
+
+        Returns:
+            np.ndarray: The length of the path traveled up to each fix in meters.
+        """
+        import numpy as np
+
+        return np.nancumsum(GNSS_GPS_Calculator.calculate_step_distance_batch(latitude, longitude, method))
+
+    @staticmethod
+    def calculate_distance_to_reference_batch(latitude: 'np.ndarray', longitude: 'np.ndarray',
+                                              reference_lat: float, reference_lon: float,
+                                              method: str = 'vincenty') -> 'np.ndarray':
+        """
+        Calculate the distance from a reference point (e.g. the start of a track) to every fix.
+
+        Args:
+            latitude (np.ndarray): The latitudes of the fixes in degrees.
+            longitude (np.ndarray): The longitudes of the fixes in degrees.
+            reference_lat (float): Latitude of the reference point in degrees.
+            reference_lon (float): Longitude of the reference point in degrees.
+            method (str): Distance method, 'vincenty' or 'haversine'.
+
+        Returns:
+            np.ndarray: The distance of each fix from the reference point in meters.
+        """
+        import numpy as np
+
+        latitude, longitude = np.asarray(latitude, dtype=float), np.asarray(longitude, dtype=float)
+        return GNSS_GPS_Calculator.calculate_distance_batch(
+            latitude, longitude, np.full(latitude.shape, float(reference_lat)),
+            np.full(longitude.shape, float(reference_lon)), method)
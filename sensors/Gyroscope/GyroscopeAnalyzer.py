@@ -1,7 +1,8 @@
 import pandas as pd
 import matplotlib.pyplot as plt
-from typing import Tuple
+from typing import Optional, Tuple, Union
 from .GyroscopeCalculator import GyroscopeCalculator
+from ..IO.SensorFrameLoader import SensorFrameLoader
 
 class GyroscopeAnalyzer:
     """
@@ -13,28 +14,50 @@ class GyroscopeAnalyzer:
     Methods:
         plot_angular_velocity(): Plot the angular velocity magnitude over time.
         plot_rotation_detection(): Plot the rotation detection for each axis.
+        plot_cumulative_angles(): Plot the cumulative rotation angle around each axis.
         analyze_stabilization(): Analyze the stabilization of the gyroscope.
         run_analysis(): Run a comprehensive analysis of the gyroscope data.
     """
 
-    def __init__(self, csv_file_path: str):
+    def __init__(self, data: Union[str, pd.DataFrame], integration_method: str = 'trapezoid',
+                 max_gap: Optional[float] = None):
         """
         Initialize the GyroscopeAnalyzer object.
 
+        The angular velocities are integrated over the SensorTimestamps of the samples
+        if the file was exported with the timestamps, and over the time index otherwise,
+        leaving out the gaps of the recording.
+
         Args:
-            csv_file_path (str): The path to the CSV file containing the gyroscope data.
+            data (str | pd.DataFrame): The path to the exported file (CSV, Parquet, Feather or NPZ) containing the gyroscope data,
+                or a DataFrame of the data, e.g. parsed straight from a logfile.
+            integration_method (str): Integration method of the rotation angles, 'rectangle' or 'trapezoid'.
+            max_gap (float, optional): Longest time in seconds between two samples that is integrated over.
+                Defaults to GyroscopeCalculator.GAP_FACTOR times the median sampling interval.
         """
-        self.df = pd.read_csv(csv_file_path)
-        self.df['timestamp'] = pd.to_datetime(self.df['index'], unit='s')
-        self.df['time_delta'] = self.df['timestamp'].diff().dt.total_seconds()
-        self.df['rotation_angle'] = self.df.apply(lambda row: GyroscopeCalculator.calculate_rotation_angle(row['angular_velocity_magnitude'], row['time_delta']), axis=1)
+        self.df = SensorFrameLoader.load(data)
+        if 'angular_velocity_magnitude' not in self.df:
+            self.df['angular_velocity_magnitude'] = GyroscopeCalculator.calculate_angular_velocity_batch(
+                self.df['gyr_x'], self.df['gyr_y'], self.df['gyr_z'])
+
+        # integrated the angular velocities over the time between the samples
+        sample_times = SensorFrameLoader.get_sample_times(self.df)
+        integrated_columns = GyroscopeCalculator.integrate_angular_velocity_batch(
+            self.df['gyr_x'], self.df['gyr_y'], self.df['gyr_z'], sample_times, integration_method, max_gap)
+        for name, values in integrated_columns.items():
+            self.df[name] = values
+
+        # calculated the total rotation within a trailing window of about 10 samples
+        self.rotation_window = SensorFrameLoader.get_time_window(self.df, 10).total_seconds()
+        self.df['windowed_rotation'] = GyroscopeCalculator.calculate_windowed_rotation_batch(
+            self.df['rotation_angle'], sample_times, self.rotation_window)
 
     def plot_angular_velocity(self):
         """
         Plot the angular velocity magnitude over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['angular_velocity_magnitude'])
+        plt.plot(self.df.index, self.df['angular_velocity_magnitude'])
         plt.title('Angular Velocity Magnitude Over Time')
         plt.xlabel('Time')
         plt.ylabel('Angular Velocity Magnitude (rad/s)')
@@ -46,9 +69,9 @@ class GyroscopeAnalyzer:
         Plot the rotation detection for each axis.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['gyr_x'], label='X-axis')
-        plt.plot(self.df['timestamp'], self.df['gyr_y'], label='Y-axis')
-        plt.plot(self.df['timestamp'], self.df['gyr_z'], label='Z-axis')
+        plt.plot(self.df.index, self.df['gyr_x'], label='X-axis')
+        plt.plot(self.df.index, self.df['gyr_y'], label='Y-axis')
+        plt.plot(self.df.index, self.df['gyr_z'], label='Z-axis')
         plt.title('Rotation Detection')
         plt.xlabel('Time')
         plt.ylabel('Angular Velocity (rad/s)')
@@ -56,6 +79,21 @@ class GyroscopeAnalyzer:
         plt.grid(True)
         plt.show()
 
+    def plot_cumulative_angles(self):
+        """
+        Plot the cumulative rotation angle around each axis.
+        """
+        plt.figure(figsize=(12, 6))
+        plt.plot(self.df.index, self.df['angle_x'], label='X-axis')
+        plt.plot(self.df.index, self.df['angle_y'], label='Y-axis')
+        plt.plot(self.df.index, self.df['angle_z'], label='Z-axis')
+        plt.title('Cumulative Rotation Angle')
+        plt.xlabel('Time')
+        plt.ylabel('Angle (radians)')
+        plt.legend()
+        plt.grid(True)
+        plt.show()
+
     def analyze_stabilization(self) -> Tuple[float, float, float]:
         """
         Analyze the stabilization of the gyroscope.
@@ -63,8 +101,8 @@ class GyroscopeAnalyzer:
         Returns:
             Tuple[float, float, float]: The mean standard deviation for each axis.
         """
-        window_size = 10  # adjust as needed
-        rolling_std = self.df[['gyr_x', 'gyr_y', 'gyr_z']].rolling(window=window_size).std()
+        window = SensorFrameLoader.get_time_window(self.df, 10)  # adjust as needed
+        rolling_std = self.df[['gyr_x', 'gyr_y', 'gyr_z']].rolling(window).std()
         return rolling_std['gyr_x'].mean(), rolling_std['gyr_y'].mean(), rolling_std['gyr_z'].mean()
 
     def run_analysis(self):
@@ -78,6 +116,9 @@ class GyroscopeAnalyzer:
         
         # plotted rotation detection
         self.plot_rotation_detection()
+
+        # plotted cumulative rotation angles
+        self.plot_cumulative_angles()
         
         # analyzed stabilization
         x_stability, y_stability, z_stability = self.analyze_stabilization()
@@ -92,12 +133,15 @@ class GyroscopeAnalyzer:
         print(f"Min Angular Velocity: {self.df['angular_velocity_magnitude'].min():.4f} rad/s")
         print(f"Mean Angular Velocity: {self.df['angular_velocity_magnitude'].mean():.4f} rad/s")
         print(f"Total Rotation Angle: {self.df['rotation_angle'].sum():.4f} radians")
+        print(f"Max Rotation Within {self.rotation_window:.2f} s: {self.df['windowed_rotation'].max():.4f} radians")
+        print(f"Net Rotation Angle: X-axis {self.df['angle_x'].iloc[-1]:.4f}, "
+              f"Y-axis {self.df['angle_y'].iloc[-1]:.4f}, Z-axis {self.df['angle_z'].iloc[-1]:.4f} radians")
 
         # identified periods of high rotation
         high_rotation_threshold = self.df['angular_velocity_magnitude'].quantile(0.95)
         high_rotation_periods = self.df[self.df['angular_velocity_magnitude'] > high_rotation_threshold]
         print(f"\nPeriods of High Rotation (above {high_rotation_threshold:.4f} rad/s):")
-        for _, period in high_rotation_periods.iterrows():
-            print(f"Time: {period['timestamp']}, Angular Velocity: {period['angular_velocity_magnitude']:.4f} rad/s")
+        for timestamp, period in high_rotation_periods.iterrows():
+            print(f"Time: {timestamp}, Angular Velocity: {period['angular_velocity_magnitude']:.4f} rad/s")
 
         print("\nGyroscope Data Analysis Completed!")
@@ -1,10 +1,29 @@
-import numpy as np
+import math
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class GyroscopeCalculator:
     """
     A class to perform calculations related to gyroscope data.
+
+    The batch methods integrate whole columns of angular velocities over the time
+    between the samples at once, with the rectangle rule (the velocity of a sample
+    held since the previous one) or the trapezoidal rule (the mean velocity of the
+    two samples), into rotation angles per sample, cumulative angles per axis and
+    the total rotation within a trailing time window. Gaps of the recording (e.g.
+    while the sensor was paused) are not integrated over.
+
+    Attributes:
+        INTEGRATION_METHODS (Tuple[str, ...]): Available integration methods.
+        GAP_FACTOR (float): Number of median sampling intervals above which the time between
+            two measurements is a gap of the recording, unless a maximum gap is given.
     """
 
+    INTEGRATION_METHODS = ('rectangle', 'trapezoid')
+    GAP_FACTOR = 5.0
+
     @staticmethod
     def calculate_angular_velocity(gyr_X: float, gyr_Y: float, gyr_Z: float) -> float:
         """
@@ -18,7 +37,7 @@ class GyroscopeCalculator:
         Returns:
             float: The angular velocity magnitude.
         """
-        return np.sqrt(gyr_X**2 + gyr_Y**2 + gyr_Z**2)
+        return math.sqrt(gyr_X**2 + gyr_Y**2 + gyr_Z**2)
 
     @staticmethod
     def calculate_rotation_angle(angular_velocity: float, time_delta: float) -> float:
@@ -32,4 +51,188 @@ class GyroscopeCalculator:
         Returns:
             float: The calculated rotation angle.
         """
-        return angular_velocity * time_delta
\ No newline at end of file
+        return angular_velocity * time_delta
+
+    @staticmethod
+    def calculate_angular_velocity_batch(gyr_X: 'np.ndarray', gyr_Y: 'np.ndarray', gyr_Z: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the angular velocity magnitude for whole columns.
+
+        Args:
+            gyr_X (np.ndarray): Angular velocities around the X-axis.
+            gyr_Y (np.ndarray): Angular velocities around the Y-axis.
+            gyr_Z (np.ndarray): Angular velocities around the Z-axis.
+
+        Returns:
+            np.ndarray: The angular velocity magnitude of each sample.
+        """
+        import numpy as np
+
+        gyr_X, gyr_Y, gyr_Z = (np.asarray(axis, dtype=float) for axis in (gyr_X, gyr_Y, gyr_Z))
+        return np.sqrt(gyr_X**2 + gyr_Y**2 + gyr_Z**2)
+
+    @staticmethod
+    def calculate_rotation_angle_batch(angular_velocity: 'np.ndarray', time_delta: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the rotation angle for whole columns.
+
+        Args:
+            angular_velocity (np.ndarray): The angular velocity magnitudes.
+            time_delta (np.ndarray): The time differences between measurements.
+
+        Returns:
+            np.ndarray: The calculated rotation angle of each sample.
+        """
+        import numpy as np
+
+        return np.asarray(angular_velocity, dtype=float) * np.asarray(time_delta, dtype=float)
+
+    @staticmethod
+    def calculate_time_delta_batch(timestamps: 'np.ndarray', max_gap: Optional[float] = None) -> 'np.ndarray':
+        """
+        Calculate the time differences between consecutive measurements for whole columns.
+
+        A time difference above the maximum gap is a gap of the recording, over which
+        the angular velocity is unknown, and counts as no time.
+
+        Args:
+            timestamps (np.ndarray): The timestamps of the measurements in seconds, in time order.
+            max_gap (float, optional): Longest time in seconds between two measurements that is
+                integrated over. Defaults to GAP_FACTOR times the median time difference.
+
+        Returns:
+            np.ndarray: The time since the previous measurement of each sample, 0 for the first
+                sample, where the clock went backwards and after a gap.
+        """
+        import numpy as np
+
+        timestamps = np.asarray(timestamps, dtype=float)
+        time_delta = np.zeros(len(timestamps))
+        if len(timestamps) > 1:
+            time_delta[1:] = np.diff(timestamps)
+            time_delta[time_delta < 0] = 0.0
+            if max_gap is None:
+                # took the median of the positive differences, as samples may share a timestamp
+                positive_delta = time_delta[time_delta > 0]
+                max_gap = GyroscopeCalculator.GAP_FACTOR * np.median(positive_delta) if len(positive_delta) else np.inf
+            time_delta[time_delta > max_gap] = 0.0
+        return time_delta
+
+    @staticmethod
+    def calculate_angle_increment_batch(angular_velocity: 'np.ndarray', time_delta: 'np.ndarray',
+                                        method: str = 'trapezoid') -> 'np.ndarray':
+        """
+        Calculate the angle rotated since the previous measurement for whole columns.
+
+        Args:
+            angular_velocity (np.ndarray): The angular velocities (of one axis, or their magnitudes).
+            time_delta (np.ndarray): The time differences between measurements.
+            method (str): Integration method, 'rectangle' or 'trapezoid'.
+
+        Returns:
+            np.ndarray: The angle rotated since the previous measurement, 0 for the first sample.
+
+        Raises:
+            ValueError: If the integration method is invalid.
+        """
+        import numpy as np
+
+        angular_velocity, time_delta = np.asarray(angular_velocity, dtype=float), np.asarray(time_delta, dtype=float)
+        if method == 'rectangle':
+            angle_increment = angular_velocity * time_delta
+        elif method == 'trapezoid':
+            angle_increment = np.zeros(len(angular_velocity))
+            angle_increment[1:] = (angular_velocity[:-1] + angular_velocity[1:]) / 2 * time_delta[1:]
+        else:
+            raise ValueError(f'Invalid Integration Method! Available Methods: {", ".join(GyroscopeCalculator.INTEGRATION_METHODS)}')
+        if len(angle_increment):
+            angle_increment[0] = 0.0
+        return angle_increment
+
+    @staticmethod
+    def calculate_cumulative_angle_batch(angular_velocity: 'np.ndarray', time_delta: 'np.ndarray',
+                                         method: str = 'trapezoid') -> 'np.ndarray':
+        """
+        Calculate the angle rotated since the first measurement for whole columns.
+
+        Samples without a value (NaN) add no rotation.
+
+        Args:
+            angular_velocity (np.ndarray): The angular velocities (of one axis, or their magnitudes).
+            time_delta (np.ndarray): The time differences between measurements.
+            method (str): Integration method, 'rectangle' or 'trapezoid'.
+
+        Returns:
+            np.ndarray: The cumulative angle at each sample.
+        """
+        import numpy as np
+
+        return np.nancumsum(GyroscopeCalculator.calculate_angle_increment_batch(angular_velocity, time_delta, method))
+
+    @staticmethod
+    def calculate_windowed_rotation_batch(angle_increment: 'np.ndarray', timestamps: 'np.ndarray',
+                                          window: float) -> 'np.ndarray':
+        """
+        Calculate the total rotation within a trailing time window of each measurement for whole columns.
+
+        The windows span the time of the measurements, so a window after a gap of the
+        recording holds only the measurements since the gap.
+
+        Args:
+            angle_increment (np.ndarray): The angles rotated since the previous measurements.
+            timestamps (np.ndarray): The timestamps of the measurements in seconds, in time order.
+            window (float): Duration of the window in seconds.
+
+        Returns:
+            np.ndarray: The angle rotated within the window ending at each sample.
+        """
+        import numpy as np
+
+        cumulative_angle = np.nancumsum(np.asarray(angle_increment, dtype=float))
+        # kept the time from going backwards with the clock, for the binary search
+        elapsed_time = np.fmax.accumulate(np.asarray(timestamps, dtype=float))
+        # found the first sample inside the window of every sample with a binary search
+        window_start = np.searchsorted(elapsed_time, elapsed_time - window, side='right')
+        angle_before_window = np.where(window_start > 0, cumulative_angle[np.maximum(window_start - 1, 0)], 0.0)
+        return cumulative_angle - angle_before_window
+
+    @staticmethod
+    def integrate_angular_velocity_batch(gyr_X: 'np.ndarray', gyr_Y: 'np.ndarray', gyr_Z: 'np.ndarray',
+                                         timestamps: 'np.ndarray', method: str = 'trapezoid',
+                                         max_gap: Optional[float] = None) -> Dict[str, 'np.ndarray']:
+        """
+        Integrate whole columns of angular velocities over the time of the measurements.
+
+        The per-axis angles are the integrals of the angular velocity around each
+        axis of the device, which is exact for rotations around one axis at a time and
+        an approximation for combined rotations. The rotation angle is the integral of
+        the angular velocity magnitude, i.e. the total rotation regardless of its axis.
+        Nothing is integrated over the gaps of the recording.
+
+        Args:
+            gyr_X (np.ndarray): Angular velocities around the X-axis.
+            gyr_Y (np.ndarray): Angular velocities around the Y-axis.
+            gyr_Z (np.ndarray): Angular velocities around the Z-axis.
+            timestamps (np.ndarray): The timestamps of the measurements in seconds, in time order.
+            method (str): Integration method, 'rectangle' or 'trapezoid'.
+            max_gap (float, optional): Longest time in seconds between two measurements that is
+                integrated over. Defaults to GAP_FACTOR times the median time difference.
+
+        Returns:
+            Dict[str, np.ndarray]: The columns 'time_delta' (0 after a gap), 'angle_x', 'angle_y' and 'angle_z'
+                (cumulative angles per axis), 'rotation_angle' (angle rotated since the previous
+                measurement) and 'cumulative_rotation'.
+        """
+        import numpy as np
+
+        time_delta = GyroscopeCalculator.calculate_time_delta_batch(timestamps, max_gap)
+        angular_velocity = GyroscopeCalculator.calculate_angular_velocity_batch(gyr_X, gyr_Y, gyr_Z)
+        rotation_angle = GyroscopeCalculator.calculate_angle_increment_batch(angular_velocity, time_delta, method)
+        return {
+            'time_delta': time_delta,
+            'angle_x': GyroscopeCalculator.calculate_cumulative_angle_batch(gyr_X, time_delta, method),
+            'angle_y': GyroscopeCalculator.calculate_cumulative_angle_batch(gyr_Y, time_delta, method),
+            'angle_z': GyroscopeCalculator.calculate_cumulative_angle_batch(gyr_Z, time_delta, method),
+            'rotation_angle': rotation_angle,
+            'cumulative_rotation': np.nancumsum(rotation_angle),
+        }
@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class HumidityCalculator:
     """
     A class to perform calculations related to humidity data.
@@ -14,4 +19,19 @@ class HumidityCalculator:
         Returns:
             float: The humidity value in percentage.
         """
-        return humidity * 100
\ No newline at end of file
+        return humidity * 100
+
+    @staticmethod
+    def calculate_humidity_percentage_batch(humidity: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the humidity in percentage for a whole column.
+
+        Args:
+            humidity (np.ndarray): The raw humidity values.
+
+        Returns:
+            np.ndarray: The humidity values in percentage.
+        """
+        import numpy as np
+
+        return np.asarray(humidity, dtype=float) * 100
@@ -1,4 +1,8 @@
 import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class IMUCalculator:
     """
@@ -18,4 +22,23 @@ class IMUCalculator:
         Returns:
             float: The angular velocity magnitude.
         """
-        return math.sqrt(gyr_X ** 2 + gyr_Y ** 2 + gyr_Z ** 2)
\ No newline at end of file
+        return math.sqrt(gyr_X ** 2 + gyr_Y ** 2 + gyr_Z ** 2)
+
+    @staticmethod
+    def calculate_angular_velocity_magnitude_batch(gyr_X: 'np.ndarray', gyr_Y: 'np.ndarray',
+                                                   gyr_Z: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the angular velocity magnitude based on gyroscope data for whole columns.
+
+        Args:
+            gyr_X (np.ndarray): Gyroscope X-axis readings.
+            gyr_Y (np.ndarray): Gyroscope Y-axis readings.
+            gyr_Z (np.ndarray): Gyroscope Z-axis readings.
+
+        Returns:
+            np.ndarray: The angular velocity magnitude of each sample.
+        """
+        import numpy as np
+
+        gyr_X, gyr_Y, gyr_Z = (np.asarray(axis, dtype=float) for axis in (gyr_X, gyr_Y, gyr_Z))
+        return np.sqrt(gyr_X ** 2 + gyr_Y ** 2 + gyr_Z ** 2)
@@ -1,4 +1,5 @@
 from ..Base.SensorBase import SensorBase
+from ..Base.SensorSchema import CalculatedColumn, SensorSchema
 from .IMUCalculator import IMUCalculator
 
 class IMU_SensorBase(SensorBase):
@@ -34,62 +35,58 @@ class IMU_SensorBase(SensorBase):
         app_timestamp (float): Application timestamp.
     """
 
-    def __init__(self, tag, app_timestamp, counter, acc_X, acc_Y, acc_Z, gyr_X, gyr_Y, gyr_Z, 
-                 mag_X, mag_Y, mag_Z, roll, pitch, yaw, quat_1, quat_2, quat_3, quat_4, 
-                 pressure, temp):
-        """
-        Initialize the IMU_SensorBase object.
+    SCHEMA = SensorSchema(
+        None,  # shared by every IMU, whose constructor takes its tag first
+        fields=(
+            ('app_timestamp', float),
+            ('counter', int),
+            ('acc_X', float),
+            ('acc_Y', float),
+            ('acc_Z', float),
+            ('gyr_X', float),
+            ('gyr_Y', float),
+            ('gyr_Z', float),
+            ('mag_X', float),
+            ('mag_Y', float),
+            ('mag_Z', float),
+            ('roll', float),
+            ('pitch', float),
+            ('yaw', float),
+            ('quat_1', float),
+            ('quat_2', float),
+            ('quat_3', float),
+            ('quat_4', float),
+            ('pressure', float),
+            ('temp', float)
+        ),
+        export_fields=(
+            ('acc_X', 'acc_x'),
+            ('acc_Y', 'acc_y'),
+            ('acc_Z', 'acc_z'),
+            ('gyr_X', 'gyr_x'),
+            ('gyr_Y', 'gyr_y'),
+            ('gyr_Z', 'gyr_z'),
+            ('mag_X', 'mag_x'),
+            ('mag_Y', 'mag_y'),
+            ('mag_Z', 'mag_z'),
+            ('roll', 'roll'),
+            ('pitch', 'pitch'),
+            ('yaw', 'yaw'),
+            ('quat_1', 'quat_1'),
+            ('quat_2', 'quat_2'),
+            ('quat_3', 'quat_3'),
+            ('quat_4', 'quat_4'),
+            ('pressure', 'pressure'),
+            ('temp', 'temp')
+        ),
+        calculated_columns=(
+            CalculatedColumn('angular_velocity_magnitude', ('gyr_X', 'gyr_Y', 'gyr_Z'),
+                             IMUCalculator.calculate_angular_velocity_magnitude,
+                             IMUCalculator.calculate_angular_velocity_magnitude_batch),
+        )
+    )
 
-        Args:
-            tag (str): Sensor tag or ID.
-            app_timestamp (float): Application timestamp.
-            counter (int): Counter value.
-            acc_X, acc_Y, acc_Z (float): Accelerometer readings.
-            gyr_X, gyr_Y, gyr_Z (float): Gyroscope readings.
-            mag_X, mag_Y, mag_Z (float): Magnetometer readings.
-            roll, pitch, yaw (float): Orientation angles.
-            quat_1, quat_2, quat_3, quat_4 (float): Quaternion components.
-            pressure (float): Pressure reading.
-            temp (float): Temperature reading.
-        """
-        super().__init__(tag, float(app_timestamp))
-        self.counter = int(counter)
-        self.acc_X = float(acc_X)
-        self.acc_Y = float(acc_Y)
-        self.acc_Z = float(acc_Z)
-        self.gyr_X = float(gyr_X)
-        self.gyr_Y = float(gyr_Y)
-        self.gyr_Z = float(gyr_Z)
-        self.mag_X = float(mag_X)
-        self.mag_Y = float(mag_Y)
-        self.mag_Z = float(mag_Z)
-        self.roll = float(roll)
-        self.pitch = float(pitch)
-        self.yaw = float(yaw)
-        self.quat_1 = float(quat_1)
-        self.quat_2 = float(quat_2)
-        self.quat_3 = float(quat_3)
-        self.quat_4 = float(quat_4)
-        self.pressure = float(pressure)
-        self.temp = float(temp)
-    
-    def export_row(self, index, include_calculated=False):
-        """
-        Export IMU data as a row for a CSV file.
-
-        Args:
-            index (int): The row index.
-            include_calculated (bool): Whether to include calculated values.
-
-        Returns:
-            str: A comma-separated string containing all IMU data and optionally the calculated angular velocity magnitude.
-        """
-        # created base row with all IMU data
-        base_row = f'{index},{self.acc_X},{self.acc_Y},{self.acc_Z},{self.gyr_X},{self.gyr_Y},{self.gyr_Z},{self.mag_X},{self.mag_Y},{self.mag_Z},{self.roll},{self.pitch},{self.yaw},{self.quat_1},{self.quat_2},{self.quat_3},{self.quat_4},{self.pressure},{self.temp}'
-        
-        if include_calculated:
-            # calculated angular velocity magnitude using IMUCalculator
-            angular_velocity_magnitude = IMUCalculator.calculate_angular_velocity_magnitude(self.gyr_X, self.gyr_Y, self.gyr_Z)
-            return f'{base_row},{angular_velocity_magnitude}'
-        
-        return base_row
\ No newline at end of file
+    __slots__ = (
+        'counter', 'acc_X', 'acc_Y', 'acc_Z', 'gyr_X', 'gyr_Y', 'gyr_Z', 'mag_X', 'mag_Y', 'mag_Z', 'roll',
+        'pitch', 'yaw', 'quat_1', 'quat_2', 'quat_3', 'quat_4', 'pressure', 'temp'
+    )
@@ -0,0 +1,319 @@
+import os
+import mmap
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .LogFileReader import LogFileReader
+
+class LogFileIndex:
+    """
+    A class to build and query a sidecar index of byte offsets over a logfile.
+
+    The index keeps, for every sensor tag, the byte offset of each of its data
+    lines, and a checkpoint every few seconds of AppTimestamp that maps the
+    timestamp to the byte offset of the first line reaching it. It is saved next
+    to the logfile as '<logfile>.idx.npz', so later queries for some sensors in a
+    time window seek straight to the lines they need instead of reading the
+    whole logfile.
+
+    AppTimestamp is set by the app as data is read, so it increases along the
+    logfile. Queries read one extra checkpoint interval on both sides of the time
+    window and then filter the lines on their exact AppTimestamp, so small
+    disorders between lines do not drop any of them.
+
+    Attributes:
+        file_source (str): Path to the logfile.
+        tag_offsets (Dict[str, np.ndarray]): A mapping of sensor tag to the byte offsets
+            of its data lines, in file order.
+        checkpoint_times (np.ndarray): The AppTimestamp of each checkpoint.
+        checkpoint_offsets (np.ndarray): The byte offset of the line of each checkpoint.
+        checkpoint_interval (float): Seconds of AppTimestamp between two checkpoints.
+        file_size (int): Size of the logfile when it was indexed.
+        file_mtime (int): Modification time of the logfile in nanoseconds when it was indexed.
+
+    Methods:
+        get_index_path(file_source): Get the path of the sidecar index of a logfile.
+        build(file_source, tags, checkpoint_interval): Build the index of a logfile by scanning it once.
+        load(file_source): Load the sidecar index of a logfile if it is up to date.
+        open(file_source, tags, checkpoint_interval): Load the sidecar index of a logfile, or build and save it.
+        save(): Save the index next to its logfile.
+        get_app_timestamp(line): Get the AppTimestamp of a data line.
+        find_range(time_from, time_to): Find the byte range of the lines in a time window.
+        read_lines(tags, time_from, time_to): Read the data lines of some sensors in a time window.
+    """
+
+    VERSION = 1  # version of the index layout, raised to rebuild older indexes
+    INDEX_EXTENSION = '.idx.npz'
+    CHECKPOINT_INTERVAL = 1.0  # seconds of AppTimestamp between two checkpoints
+    TAG_KEY_PREFIX = 'tag.'
+
+    def __init__(self, file_source: str, tag_offsets: Dict[str, np.ndarray], checkpoint_times: np.ndarray,
+                 checkpoint_offsets: np.ndarray, checkpoint_interval: float, file_size: int, file_mtime: int):
+        """
+        Initialize the LogFileIndex object.
+
+        Args:
+            file_source (str): Path to the logfile.
+            tag_offsets (Dict[str, np.ndarray]): A mapping of sensor tag to the byte offsets
+                of its data lines.
+            checkpoint_times (np.ndarray): The AppTimestamp of each checkpoint.
+            checkpoint_offsets (np.ndarray): The byte offset of the line of each checkpoint.
+            checkpoint_interval (float): Seconds of AppTimestamp between two checkpoints.
+            file_size (int): Size of the logfile when it was indexed.
+            file_mtime (int): Modification time of the logfile in nanoseconds when it was indexed.
+        """
+        self.file_source = file_source
+        self.tag_offsets = tag_offsets
+        self.checkpoint_times = checkpoint_times
+        self.checkpoint_offsets = checkpoint_offsets
+        self.checkpoint_interval = checkpoint_interval
+        self.file_size = file_size
+        self.file_mtime = file_mtime
+
+    @classmethod
+    def get_index_path(cls, file_source: str) -> str:
+        """
+        Get the path of the sidecar index of a logfile.
+
+        Args:
+            file_source (str): Path to the logfile.
+
+        Returns:
+            str: The path of the index, next to the logfile.
+        """
+        return f'{file_source}{cls.INDEX_EXTENSION}'
+
+    @classmethod
+    def build(cls, file_source: str, tags: Iterable[str], checkpoint_interval: Optional[float] = None) -> 'LogFileIndex':
+        """
+        Build the index of a logfile by scanning it once.
+
+        The logfile is scanned in newline-aligned blocks. The line starts of a block
+        are found with NumPy and the tag of every line is read from its first bytes,
+        so no line is split or converted, except for the few lines whose AppTimestamp
+        is looked up by a binary search to place the checkpoints.
+
+        Args:
+            file_source (str): Path to the logfile.
+            tags (Iterable[str]): Sensor tags to index the lines of.
+            checkpoint_interval (float, optional): Seconds of AppTimestamp between two
+                checkpoints. Defaults to CHECKPOINT_INTERVAL.
+
+        Returns:
+            LogFileIndex: The index of the logfile.
+
+        Raises:
+            ValueError: If the logfile is compressed, since it cannot be seeked.
+        """
+        reader = LogFileReader(file_source)
+        if reader.compression is not None:
+            raise ValueError('Index Is Only Available For Uncompressed .txt Files!')
+        checkpoint_interval = checkpoint_interval or cls.CHECKPOINT_INTERVAL
+
+        file_stat = os.stat(file_source)
+        tag_prefixes = {LogFileReader.get_tag_prefix(tag): tag for tag in tags}
+        tag_chunks = {tag: [] for tag in tag_prefixes.values()}
+        checkpoint_times = []
+        checkpoint_offsets = []
+
+        if file_stat.st_size > 0:
+            with open(file_source, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                offset, _ = reader.find_data_offset(mapped)
+                next_time = None
+                while offset < len(mapped):
+                    # ended the block after the last complete line that fits into it
+                    end = mapped.rfind(b'\n', offset, offset + LogFileReader.BLOCK_SIZE) + 1
+                    if end <= offset:
+                        end = mapped.find(b'\n', offset) + 1 or len(mapped)
+                    block = mapped[offset:end]
+
+                    # found the start of every line and read its tag prefix
+                    block_bytes = np.frombuffer(block, dtype=np.uint8)
+                    line_starts = np.concatenate(([0], np.flatnonzero(block_bytes[:-1] == ord('\n')) + 1))
+                    prefix_positions = np.minimum(line_starts[:, None] + np.arange(LogFileReader.TAG_PREFIX_LENGTH),
+                                                  len(block_bytes) - 1)
+                    line_prefixes = block_bytes[prefix_positions].view(f'S{LogFileReader.TAG_PREFIX_LENGTH}').ravel()
+
+                    known_lines = np.zeros(len(line_starts), dtype=bool)
+                    for prefix, tag in tag_prefixes.items():
+                        tag_lines = line_prefixes == prefix
+                        if tag_lines.any():
+                            tag_chunks[tag].append(line_starts[tag_lines] + offset)
+                            known_lines |= tag_lines
+
+                    # placed the checkpoints of the block by a binary search on AppTimestamp
+                    def line_time(line_start):
+                        return cls.get_app_timestamp(block[line_start:block.find(b'\n', line_start)])
+
+                    data_starts = line_starts[known_lines].tolist()
+                    position = 0
+                    if data_starts and next_time is None:
+                        next_time = line_time(data_starts[0])
+                    while data_starts:
+                        position = bisect_left(data_starts, next_time, lo=position, key=line_time)
+                        if position == len(data_starts):
+                            break
+                        checkpoint_time = line_time(data_starts[position])
+                        checkpoint_times.append(checkpoint_time)
+                        checkpoint_offsets.append(data_starts[position] + offset)
+                        next_time = max(next_time, checkpoint_time) + checkpoint_interval
+                        position += 1
+
+                    offset = end
+
+        tag_offsets = {tag: np.concatenate(chunks) for tag, chunks in tag_chunks.items() if chunks}
+        return cls(file_source, tag_offsets, np.array(checkpoint_times, dtype=np.float64),
+                   np.array(checkpoint_offsets, dtype=np.int64), checkpoint_interval,
+                   file_stat.st_size, file_stat.st_mtime_ns)
+
+    @classmethod
+    def load(cls, file_source: str) -> Optional['LogFileIndex']:
+        """
+        Load the sidecar index of a logfile if it is up to date.
+
+        Args:
+            file_source (str): Path to the logfile.
+
+        Returns:
+            LogFileIndex, optional: The index, or None if there is no index, or if the
+                logfile changed or the index layout is older than VERSION.
+        """
+        try:
+            with np.load(cls.get_index_path(file_source)) as entry:
+                arrays = {name: entry[name] for name in entry.files}
+        except (OSError, ValueError):
+            return None
+
+        file_stat = os.stat(file_source)
+        if (int(arrays['version']) != cls.VERSION or int(arrays['file_size']) != file_stat.st_size
+                or int(arrays['file_mtime']) != file_stat.st_mtime_ns):
+            return None
+
+        tag_offsets = {name[len(cls.TAG_KEY_PREFIX):]: offsets for name, offsets in arrays.items()
+                       if name.startswith(cls.TAG_KEY_PREFIX)}
+        return cls(file_source, tag_offsets, arrays['checkpoint_times'], arrays['checkpoint_offsets'],
+                   float(arrays['checkpoint_interval']), file_stat.st_size, file_stat.st_mtime_ns)
+
+    @classmethod
+    def open(cls, file_source: str, tags: Iterable[str], checkpoint_interval: Optional[float] = None) -> 'LogFileIndex':
+        """
+        Load the sidecar index of a logfile, or build and save it if it is missing or outdated.
+
+        Args:
+            file_source (str): Path to the logfile.
+            tags (Iterable[str]): Sensor tags to index the lines of, if the index is built.
+            checkpoint_interval (float, optional): Seconds of AppTimestamp between two
+                checkpoints of a newly built index. Defaults to CHECKPOINT_INTERVAL.
+
+        Returns:
+            LogFileIndex: The index of the logfile.
+        """
+        index = cls.load(file_source)
+        if index is None:
+            index = cls.build(file_source, tags, checkpoint_interval)
+            index.save()
+        return index
+
+    def save(self) -> None:
+        """
+        Save the index next to its logfile.
+        """
+        arrays = {f'{self.TAG_KEY_PREFIX}{tag}': offsets for tag, offsets in self.tag_offsets.items()}
+        index_path = self.get_index_path(self.file_source)
+        temp_path = f'{index_path}.{os.getpid()}.tmp.npz'
+        np.savez(temp_path, version=self.VERSION, file_size=self.file_size, file_mtime=self.file_mtime,
+                 checkpoint_interval=self.checkpoint_interval, checkpoint_times=self.checkpoint_times,
+                 checkpoint_offsets=self.checkpoint_offsets, **arrays)
+        os.replace(temp_path, index_path)
+
+    @staticmethod
+    def get_app_timestamp(line: bytes) -> float:
+        """
+        Get the AppTimestamp of a data line.
+
+        Args:
+            line (bytes): A raw data line, starting with its tag prefix.
+
+        Returns:
+            float: The AppTimestamp (the first field after the tag), or -inf if it
+                cannot be read, so a broken line never moves a checkpoint forward and
+                never falls inside a time window.
+        """
+        try:
+            return float(line[LogFileReader.TAG_PREFIX_LENGTH:].split(b';', 1)[0])
+        except ValueError:
+            return float('-inf')
+
+    def find_range(self, time_from: Optional[float] = None, time_to: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Find the byte range of the lines in a time window.
+
+        The range starts one checkpoint before the last checkpoint at or before
+        time_from, and ends one checkpoint after the first checkpoint after time_to.
+
+        Args:
+            time_from (float, optional): First AppTimestamp of the window, or None for the start.
+            time_to (float, optional): Last AppTimestamp of the window, or None for the end.
+
+        Returns:
+            Tuple[int, int]: The (start, end) byte offsets of the range.
+        """
+        checkpoints = len(self.checkpoint_offsets)
+        start, end = 0, self.file_size
+        if time_from is not None and checkpoints:
+            position = int(np.searchsorted(self.checkpoint_times, time_from, side='right')) - 2
+            start = int(self.checkpoint_offsets[max(position, 0)])
+        if time_to is not None:
+            position = int(np.searchsorted(self.checkpoint_times, time_to, side='right')) + 1
+            if position < checkpoints:
+                end = int(self.checkpoint_offsets[position])
+        return start, end
+
+    def read_lines(self, tags: Iterable[str], time_from: Optional[float] = None,
+                   time_to: Optional[float] = None) -> Dict[str, List[bytes]]:
+        """
+        Read the data lines of some sensors in a time window.
+
+        Only the lines of the requested sensors inside the byte range of the time
+        window are read, by seeking to their offsets in the memory-mapped logfile.
+
+        Args:
+            tags (Iterable[str]): Sensor tags to read lines for.
+            time_from (float, optional): First AppTimestamp of the window, or None for the start.
+            time_to (float, optional): Last AppTimestamp of the window, or None for the end.
+
+        Returns:
+            Dict[str, List[bytes]]: A mapping of sensor tag to its raw data lines in the time
+                window (without line terminators), for the requested sensors with lines.
+        """
+        tag_lines = {}
+        if self.file_size == 0:
+            return tag_lines
+
+        start, end = self.find_range(time_from, time_to)
+        low = float('-inf') if time_from is None else time_from
+        high = float('inf') if time_to is None else time_to
+
+        with open(self.file_source, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for tag in tags:
+                offsets = self.tag_offsets.get(tag)
+                if offsets is None:
+                    continue
+
+                # sliced out the lines of the sensor inside the byte range
+                first, last = np.searchsorted(offsets, (start, end))
+                lines = []
+                for offset in offsets[first:last].tolist():
+                    line_end = mapped.find(b'\n', offset)
+                    lines.append(mapped[offset:line_end if line_end >= 0 else len(mapped)])
+
+                # kept only the lines inside the time window
+                if time_from is not None or time_to is not None:
+                    lines = [line for line in lines if low <= self.get_app_timestamp(line) <= high]
+                if lines:
+                    tag_lines[tag] = lines
+        return tag_lines
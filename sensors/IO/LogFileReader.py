@@ -0,0 +1,434 @@
+import io
+import os
+import bz2
+import gzip
+import lzma
+import mmap
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # .zst logfiles are only supported if the zstandard package is installed
+
+class LogFileReader:
+    """
+    A class to read the data lines of a GetSensorData logfile.
+
+    The logfile is memory-mapped and read as raw bytes, so lines are never run
+    through text decoding by the reader. Every data line starts with its sensor
+    tag followed by a ';' (e.g. b'ACCE;'), which lets the reader dispatch on the
+    first bytes of a line and drop lines of unwanted sensors without splitting
+    or decoding them. The '%' preamble at the top of the logfile is skipped by
+    scanning for the first data line instead of assuming a fixed header length.
+
+    Compressed logfiles (.txt.gz, .txt.bz2, .txt.xz and .txt.zst) are decompressed
+    as a stream straight into the same line and block readers, without writing the
+    decompressed logfile to disk. A compressed logfile cannot be memory-mapped or
+    split into byte ranges, so it is always read as a single range.
+
+    Attributes:
+        file_source (str): Path to the logfile.
+        tag_prefixes (set, optional): Byte prefixes (b'TAG;') of the sensors to read,
+            or None to read the lines of all sensors.
+        compression (str, optional): The compression extension of the logfile (e.g. '.gz'),
+            or None for a plain text logfile.
+
+    Methods:
+        get_compression(file_source): Get the compression extension of a logfile.
+        is_supported(file_source): Check whether a logfile has a supported extension.
+        get_source_name(file_source): Get the name of a logfile without its extensions.
+        open_stream(): Open the logfile as a decompressed binary stream.
+        find_data_offset(mapped): Find the byte offset of the first data line.
+        read_creation_time(): Read the date of creation of the logfile from its preamble.
+        iter_lines(): Yield the data lines of the requested sensors.
+        split_data_ranges(parts): Split the data region into newline-aligned byte ranges.
+        iter_blocks(data_range, block_size): Yield newline-aligned blocks of data lines.
+        group_lines_by_tag(lines): Group a block of data lines by their sensor tag.
+    """
+
+    PREAMBLE_PREFIX = b'%'
+    TAG_PREFIX_LENGTH = 5  # four character sensor tag followed by ';'
+    BLOCK_SIZE = 8 * 1024 * 1024  # bytes of the logfile read per block by iter_blocks
+    SOURCE_EXTENSION = '.txt'
+    COMPRESSION_EXTENSIONS = ('.gz', '.bz2', '.xz', '.zst')
+    CREATION_DATE_PREFIX = b'% Date of creation:'
+    CREATION_DATE_FORMATS = ('%a %b %d %H:%M:%S GMT%z %Y', '%a %b %d %H:%M:%S GMT %Y')  # e.g. 'Tue Oct 15 13:52:14 GMT+05:00 2024'
+
+    def __init__(self, file_source: str, tags: Optional[Iterable[str]] = None):
+        """
+        Initialize the LogFileReader object.
+
+        Args:
+            file_source (str): Path to the logfile.
+            tags (Iterable[str], optional): Sensor tags to read lines for.
+                If None, the lines of all sensors are read.
+        """
+        self.file_source = file_source
+        self.tag_prefixes = None if tags is None else {self.get_tag_prefix(tag) for tag in tags}
+        self.compression = self.get_compression(file_source)
+
+    @classmethod
+    def get_compression(cls, file_source: str) -> Optional[str]:
+        """
+        Get the compression extension of a logfile.
+
+        Args:
+            file_source (str): Path to the logfile.
+
+        Returns:
+            str | None: The compression extension (e.g. '.gz'), or None if the logfile
+                is not compressed.
+        """
+        extension = os.path.splitext(file_source)[1].lower()
+        return extension if extension in cls.COMPRESSION_EXTENSIONS else None
+
+    @classmethod
+    def is_supported(cls, file_source: str) -> bool:
+        """
+        Check whether a logfile has a supported extension.
+
+        Args:
+            file_source (str): Path to the logfile.
+
+        Returns:
+            bool: True for .txt logfiles and for .txt logfiles compressed with
+                gzip, bz2, xz or zstd.
+        """
+        compression = cls.get_compression(file_source)
+        base_name = file_source[:-len(compression)] if compression else file_source
+        return base_name.lower().endswith(cls.SOURCE_EXTENSION)
+
+    @classmethod
+    def get_source_name(cls, file_source: str) -> str:
+        """
+        Get the name of a logfile without its directory and extensions.
+
+        Args:
+            file_source (str): Path to the logfile.
+
+        Returns:
+            str: The logfile name, e.g. 'logfile' for 'data/logfile.txt.gz'.
+        """
+        source_name = os.path.basename(file_source)
+        compression = cls.get_compression(source_name)
+        if compression:
+            source_name = source_name[:-len(compression)]
+        return os.path.splitext(source_name)[0]
+
+    def open_stream(self) -> BinaryIO:
+        """
+        Open the logfile as a decompressed binary stream.
+
+        Returns:
+            BinaryIO: A buffered binary file object yielding the decompressed logfile.
+
+        Raises:
+            ImportError: If the logfile is zstd compressed and zstandard is not installed.
+        """
+        if self.compression == '.gz':
+            return gzip.open(self.file_source, 'rb')
+        if self.compression == '.bz2':
+            return bz2.open(self.file_source, 'rb')
+        if self.compression == '.xz':
+            return lzma.open(self.file_source, 'rb')
+        if self.compression == '.zst':
+            if zstandard is None:
+                raise ImportError('Reading .zst Logfiles Requires zstandard! Install It With: pip install zstandard')
+            stream = zstandard.ZstdDecompressor().stream_reader(open(self.file_source, 'rb'), closefd=True)
+            return io.BufferedReader(stream)
+        return open(self.file_source, 'rb')
+
+    @staticmethod
+    def get_tag_prefix(tag: str) -> bytes:
+        """
+        Get the raw byte prefix that starts every data line of a sensor.
+
+        Args:
+            tag (str): Sensor tag or sensor ID.
+
+        Returns:
+            bytes: The tag followed by the field separator, e.g. b'ACCE;'.
+        """
+        return f'{tag};'.encode()
+
+    def find_data_offset(self, mapped: mmap.mmap) -> Tuple[int, int]:
+        """
+        Find the byte offset of the first data line.
+
+        This function scans past the '%' preamble and any blank lines that
+        surround it.
+
+        Args:
+            mapped (mmap.mmap): The memory-mapped logfile.
+
+        Returns:
+            Tuple[int, int]: The byte offset of the first data line and the number
+                of preamble lines before it.
+        """
+        offset = 0
+        preamble_lines = 0
+        mapped.seek(0)
+        for line in iter(mapped.readline, b''):
+            if not line.startswith(self.PREAMBLE_PREFIX) and line.strip():
+                break
+            offset += len(line)
+            preamble_lines += 1
+        return offset, preamble_lines
+
+    def read_creation_time(self) -> Optional[float]:
+        """
+        Read the date of creation of the logfile from its preamble.
+
+        The AppTimestamps of the data lines count the seconds since this date, so
+        adding them to it gives the wall-clock time of every line.
+
+        Returns:
+            float | None: The date of creation as Unix time in seconds, or None if the
+                preamble has no date of creation in a known format.
+        """
+        with self.open_stream() as stream:
+            for line in stream:
+                if not line.startswith(self.PREAMBLE_PREFIX) and line.strip():
+                    break  # reached the first data line
+                if not line.startswith(self.CREATION_DATE_PREFIX):
+                    continue
+
+                creation_date = line[len(self.CREATION_DATE_PREFIX):].decode(errors='replace').strip()
+                for date_format in self.CREATION_DATE_FORMATS:
+                    try:
+                        creation_time = datetime.strptime(creation_date, date_format)
+                    except ValueError:
+                        continue
+                    if creation_time.tzinfo is None:
+                        creation_time = creation_time.replace(tzinfo=timezone.utc)  # plain 'GMT'
+                    return creation_time.timestamp()
+                return None
+        return None
+
+    def iter_lines(self) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yield the data lines of the requested sensors.
+
+        Yields:
+            Tuple[int, bytes]: The 1-based line number and the raw bytes of each data
+                line, including its line terminator.
+        """
+        if self.compression is not None:
+            yield from self.iter_stream_lines()
+            return
+
+        # skipped empty files, which cannot be memory-mapped
+        if os.path.getsize(self.file_source) == 0:
+            return
+
+        with open(self.file_source, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # seeked straight past the preamble to the first data line
+            offset, preamble_lines = self.find_data_offset(mapped)
+            mapped.seek(offset)
+
+            tag_prefixes = self.tag_prefixes
+            prefix_length = self.TAG_PREFIX_LENGTH
+            for line_number, line in enumerate(iter(mapped.readline, b''), preamble_lines + 1):
+                # dropped lines of unwanted sensors based on their first bytes only
+                if tag_prefixes is not None and line[:prefix_length] not in tag_prefixes:
+                    continue
+                yield line_number, line
+
+    def iter_stream_lines(self) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yield the data lines of the requested sensors from the decompressed stream.
+
+        Yields:
+            Tuple[int, bytes]: The 1-based line number and the raw bytes of each data
+                line, including its line terminator.
+        """
+        tag_prefixes = self.tag_prefixes
+        prefix_length = self.TAG_PREFIX_LENGTH
+        with self.open_stream() as stream:
+            in_preamble = True
+            for line_number, line in enumerate(stream, 1):
+                # skipped the preamble lines until the first data line
+                if in_preamble:
+                    if line.startswith(self.PREAMBLE_PREFIX) or not line.strip():
+                        continue
+                    in_preamble = False
+
+                # dropped lines of unwanted sensors based on their first bytes only
+                if tag_prefixes is not None and line[:prefix_length] not in tag_prefixes:
+                    continue
+                yield line_number, line
+
+    def split_data_ranges(self, parts: int) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Split the data region of the logfile into newline-aligned byte ranges.
+
+        The region after the preamble is cut into (at most) `parts` ranges of about
+        equal size, each ending right after a line terminator, so every range holds
+        only complete lines and can be parsed independently.
+
+        Args:
+            parts (int): The number of ranges to split the data region into.
+
+        A compressed logfile cannot be split, so it is returned as a single range of
+        None with no preamble lines, for which iter_blocks reads the whole file with
+        line numbers counted from the start of the file.
+
+        Returns:
+            Tuple[int, List[Tuple[int, int]]]: The number of preamble lines and the
+                (start, end) byte offsets of each non-empty range, in file order.
+        """
+        if self.compression is not None:
+            return 0, [None]
+
+        # skipped empty files, which cannot be memory-mapped
+        if os.path.getsize(self.file_source) == 0:
+            return 0, []
+
+        with open(self.file_source, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data_offset, preamble_lines = self.find_data_offset(mapped)
+            file_size = len(mapped)
+
+            data_ranges = []
+            start = data_offset
+            range_size = max(1, (file_size - data_offset) // max(1, parts))
+            while start < file_size:
+                # moved the end of the range past the next line terminator
+                end = mapped.find(b'\n', min(start + range_size, file_size) - 1) + 1 or file_size
+                data_ranges.append((start, end))
+                start = end
+
+        return preamble_lines, data_ranges
+
+    def iter_blocks(self, data_range: Optional[Tuple[int, int]] = None,
+                    block_size: Optional[int] = None) -> Iterator[Tuple[int, List[bytes]]]:
+        """
+        Yield newline-aligned blocks of data lines.
+
+        The logfile is cut into blocks of about block_size bytes that always end on a
+        line boundary, and each block is split into lines in a single step. This lets
+        callers process many lines at once instead of paying a per-line cost.
+
+        Args:
+            data_range (Tuple[int, int], optional): A (start, end) byte range from
+                split_data_ranges to read. If None, the whole data region past the
+                preamble is read.
+            block_size (int, optional): Approximate size of a block in bytes.
+                Defaults to BLOCK_SIZE.
+
+        Yields:
+            Tuple[int, List[bytes]]: The 1-based line number of the first line of the
+                block and the raw lines of the block, without line terminators. Line
+                numbers count from the start of the file, or from the start of the
+                range if data_range is given.
+        """
+        block_size = block_size or self.BLOCK_SIZE
+
+        if self.compression is not None:
+            yield from self.iter_stream_blocks(block_size)
+            return
+
+        # skipped empty files, which cannot be memory-mapped
+        if os.path.getsize(self.file_source) == 0:
+            return
+
+        with open(self.file_source, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if data_range is None:
+                # seeked straight past the preamble to the first data line
+                offset, preamble_lines = self.find_data_offset(mapped)
+                line_number = preamble_lines + 1
+                range_end = len(mapped)
+            else:
+                offset, range_end = data_range
+                line_number = 1
+
+            while offset < range_end:
+                # ended the block after the last complete line that fits into it
+                end = mapped.rfind(b'\n', offset, min(offset + block_size, range_end)) + 1
+                if end <= offset:
+                    end = mapped.find(b'\n', offset, range_end) + 1 or range_end
+
+                lines = mapped[offset:end].split(b'\n')
+                if not lines[-1]:
+                    lines.pop()  # dropped the empty remainder after the final line terminator
+
+                yield line_number, lines
+                line_number += len(lines)
+                offset = end
+
+    def iter_stream_blocks(self, block_size: int) -> Iterator[Tuple[int, List[bytes]]]:
+        """
+        Yield newline-aligned blocks of data lines from the decompressed stream.
+
+        The stream is read in chunks of block_size bytes, and the incomplete last line
+        of every chunk is carried over to the next block.
+
+        Args:
+            block_size (int): Size of a decompressed chunk in bytes.
+
+        Yields:
+            Tuple[int, List[bytes]]: The 1-based line number of the first line of the
+                block and the raw lines of the block, without line terminators.
+        """
+        with self.open_stream() as stream:
+            # skipped the preamble lines and kept the first data line for the first block
+            line_number = 1
+            for remainder in iter(stream.readline, b''):
+                if not remainder.startswith(self.PREAMBLE_PREFIX) and remainder.strip():
+                    break
+                line_number += 1
+            else:
+                return
+
+            for chunk in iter(lambda: stream.read(block_size), b''):
+                data = remainder + chunk
+                end = data.rfind(b'\n') + 1
+                if end == 0:
+                    remainder = data  # kept reading until a line terminator was found
+                    continue
+
+                lines = data[:end - 1].split(b'\n')
+                remainder = data[end:]
+                yield line_number, lines
+                line_number += len(lines)
+
+            # yielded the final lines that were not followed by another chunk
+            lines = remainder.split(b'\n')
+            if not lines[-1]:
+                lines.pop()  # dropped the empty remainder after the final line terminator
+            if lines:
+                yield line_number, lines
+
+    def group_lines_by_tag(self, lines: List[bytes]) -> Dict[bytes, List[bytes]]:
+        """
+        Group a block of data lines by their sensor tag.
+
+        The lines are grouped with a stable sort on their tag prefix, so the lines of
+        each sensor keep their order from the logfile.
+
+        Args:
+            lines (List[bytes]): Raw data lines, e.g. a block from iter_blocks.
+
+        Returns:
+            Dict[bytes, List[bytes]]: A mapping of tag prefix (e.g. b'ACCE;') to the lines
+                of that sensor, for the requested sensors present in the lines.
+        """
+        tag_prefixes = self.tag_prefixes
+        prefix_length = self.TAG_PREFIX_LENGTH
+
+        # dropped lines of unwanted sensors before sorting, based on their first bytes only
+        if tag_prefixes is not None:
+            if len(tag_prefixes) == 1:
+                prefix, = tag_prefixes
+                lines = [line for line in lines if line.startswith(prefix)]
+                return {prefix: lines} if lines else {}
+            lines = [line for line in lines if line[:prefix_length] in tag_prefixes]
+
+        prefix_key = itemgetter(slice(0, prefix_length))
+        return {prefix: list(group) for prefix, group in groupby(sorted(lines, key=prefix_key), key=prefix_key)}
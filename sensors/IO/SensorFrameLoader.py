@@ -0,0 +1,216 @@
+import os
+from array import array
+from typing import TYPE_CHECKING, Optional, Union
+
+from ..Base.SensorSchema import SensorSchema
+from ..Base.SensorTable import SensorTable
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+class SensorFrameLoader:
+    """
+    A class to load an exported sensor data file into a DataFrame.
+
+    The file format is detected from the file extension, so the analyzers can
+    read the CSV files as well as the Parquet, Arrow IPC (Feather) and NumPy
+    .npz files written by the parser, without a text round-trip for the
+    binary formats. A SensorTable parsed straight from a logfile can be turned
+    into the same DataFrame without writing and reading an exported file at all.
+
+    Every loaded DataFrame is indexed by a sorted DatetimeIndex named 'timestamp',
+    taken from the exported timestamp columns, so the analyzers can slice time
+    windows with a binary search (e.g. df.loc[start:end]) and roll windows over
+    a duration instead of a number of rows.
+
+    Methods:
+        is_supported(file_path): Check whether a file has a supported extension.
+        load(data): Load an exported sensor data file into a time-indexed DataFrame.
+        from_table(sensor_table, include_calculated, include_timestamps, creation_time): Build a DataFrame
+            from a parsed SensorTable.
+        set_time_index(frame): Index a DataFrame of sensor data by the time of its rows.
+        get_time_window(frame, samples): Get a time window covering about a number of samples.
+        get_sample_times(frame): Get the time of every row in seconds, preferring the sensor clock.
+    """
+
+    SUPPORTED_EXTENSIONS = ('.csv', '.parquet', '.feather', '.npz')
+
+    @classmethod
+    def is_supported(cls, file_path: str) -> bool:
+        """
+        Check whether a file has a supported extension.
+
+        Args:
+            file_path (str): Path to the exported sensor data file.
+
+        Returns:
+            bool: True if the file can be loaded.
+        """
+        return os.path.splitext(file_path)[1].lower() in cls.SUPPORTED_EXTENSIONS
+
+    @classmethod
+    def load(cls, data: Union[str, 'pd.DataFrame']) -> 'pd.DataFrame':
+        """
+        Load an exported sensor data file into a time-indexed DataFrame.
+
+        Args:
+            data (str | pd.DataFrame): Path to the exported sensor data file, or a DataFrame
+                that already holds the sensor data.
+
+        Returns:
+            pd.DataFrame: The sensor data, with one column per header, indexed by time.
+
+        Raises:
+            ValueError: If the file extension is not supported.
+        """
+        # imported numpy and pandas on first use, so checking a file type stays cheap
+        import numpy as np
+        import pandas as pd
+
+        if isinstance(data, pd.DataFrame):
+            return cls.set_time_index(data)
+
+        file_path = data
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == '.csv':
+            frame = pd.read_csv(file_path)
+        elif extension == '.parquet':
+            frame = pd.read_parquet(file_path)
+        elif extension == '.feather':
+            frame = pd.read_feather(file_path)
+        elif extension == '.npz':
+            with np.load(file_path) as columns:
+                frame = pd.DataFrame({name: columns[name] for name in columns.files})
+        else:
+            raise ValueError(f'Invalid File Type! Source File Must Be One of: {", ".join(cls.SUPPORTED_EXTENSIONS)}')
+        return cls.set_time_index(frame)
+
+    @staticmethod
+    def from_table(sensor_table: SensorTable, include_calculated: bool = True, include_timestamps: bool = False,
+                   creation_time: Optional[float] = None) -> 'pd.DataFrame':
+        """
+        Build a DataFrame from a parsed SensorTable.
+
+        The DataFrame has the same columns as the file exported by the parser, but
+        every column is copied straight from the column buffers of the table (and
+        the calculated columns calculated from them for whole columns by the batch
+        methods of the sensor calculators), without formatting and parsing any text.
+
+        Args:
+            sensor_table (SensorTable): The parsed table of a sensor.
+            include_calculated (bool): Whether to include the calculated columns.
+            include_timestamps (bool): Whether to include the timestamp columns and the wall-clock time.
+            creation_time (float, optional): Unix time of the creation of the logfile, added to the
+                AppTimestamps for the wall-clock time. If None, the wall-clock time is NaN.
+
+        Returns:
+            pd.DataFrame: The sensor data, with one column per header.
+        """
+        import numpy as np
+        import pandas as pd
+
+        sensor_class = sensor_table.sensor_class
+        schema = sensor_class.SCHEMA
+        names = sensor_class.get_headers(include_calculated, include_timestamps).split(',')
+
+        columns = [np.arange(1, len(sensor_table) + 1)]
+        if include_timestamps:
+            columns.extend(np.array(sensor_table.get_column(name)) for name in schema.timestamp_fields)
+            if schema.WALL_TIME_HEADER in schema.timestamp_headers:
+                columns.append(np.array(sensor_table.get_column('app_timestamp'))
+                               + (np.nan if creation_time is None else creation_time))
+        for name in sensor_class.EXPORT_FIELDS:
+            column = sensor_table.get_column(name)
+            columns.append(np.array(column) if isinstance(column, array) else column)
+        if include_calculated:
+            columns.extend(sensor_class.calculate_batch_columns(sensor_table.columns))
+
+        return pd.DataFrame(dict(zip(names, columns)))
+
+    @staticmethod
+    def set_time_index(frame: 'pd.DataFrame') -> 'pd.DataFrame':
+        """
+        Index a DataFrame of sensor data by the time of its rows.
+
+        The time of a row is its wall-clock time (UTC) if the date of creation of the
+        logfile was known, else its AppTimestamp as the time since the start of the
+        recording. Files exported without timestamps fall back to the row index as
+        seconds. The rows are sorted by time, keeping the order of rows with the same
+        time, and a DataFrame that is already indexed by time is returned as it is.
+        The given DataFrame is left unchanged, the result shares its column data.
+
+        Args:
+            frame (pd.DataFrame): The sensor data, with one column per header.
+
+        Returns:
+            pd.DataFrame: The sensor data, indexed by a sorted DatetimeIndex named 'timestamp'.
+        """
+        import pandas as pd
+
+        if isinstance(frame.index, pd.DatetimeIndex):
+            return frame
+
+        wall_time_header = SensorSchema.WALL_TIME_HEADER
+        if wall_time_header in frame and frame[wall_time_header].notna().all():
+            times = pd.to_datetime(frame[wall_time_header], unit='s', utc=True)
+        elif 'app_timestamp' in frame:
+            times = pd.to_datetime(frame['app_timestamp'], unit='s')
+        else:
+            times = pd.to_datetime(frame['index'], unit='s')
+
+        # indexed a shallow copy, leaving the index of the caller's frame as it is
+        frame = frame.copy(deep=False)
+        # rounded away the float error of the seconds, as the logfile holds at most microseconds
+        frame.index = pd.DatetimeIndex(times, name='timestamp').round('us')
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index(kind='stable')
+        return frame
+
+    @staticmethod
+    def get_time_window(frame: 'pd.DataFrame', samples: int) -> 'pd.Timedelta':
+        """
+        Get a time window covering about a number of samples of a time-indexed DataFrame.
+
+        The window lasts the given number of mean sampling intervals of the recording,
+        so a rolling window over it spans the same duration everywhere, even where
+        samples were dropped or delivered in bursts.
+
+        Args:
+            frame (pd.DataFrame): The sensor data, indexed by time.
+            samples (int): The number of samples the window should cover on average.
+
+        Returns:
+            pd.Timedelta: The duration of the window, counting one second per sample if the
+                recording has no duration.
+        """
+        import pandas as pd
+
+        interval = pd.Timedelta(seconds=1)
+        if len(frame) > 1 and frame.index[-1] > frame.index[0]:
+            interval = (frame.index[-1] - frame.index[0]) / (len(frame) - 1)
+        return interval * samples
+
+    @staticmethod
+    def get_sample_times(frame: 'pd.DataFrame') -> 'np.ndarray':
+        """
+        Get the time of every row of a time-indexed DataFrame in seconds, e.g. to integrate over time.
+
+        The time is the SensorTimestamp of the row if the file was exported with the
+        timestamps, as the sensor clock keeps the precise spacing of the samples while
+        the AppTimestamps show when the samples were delivered (often in bursts).
+        Otherwise it is the time of the row in the index.
+
+        Args:
+            frame (pd.DataFrame): The sensor data, indexed by time.
+
+        Returns:
+            np.ndarray: The time of every row in seconds, in row order.
+        """
+        import numpy as np
+
+        if 'sensor_timestamp' in frame:
+            return frame['sensor_timestamp'].to_numpy(dtype=float)
+        if len(frame) == 0:
+            return np.zeros(0)
+        return (frame.index - frame.index[0]).total_seconds().to_numpy()
@@ -0,0 +1,120 @@
+from typing import List, Optional, Sequence
+
+class SensorFrameWriter:
+    """
+    A class to write the exported columns of a sensor type as a binary columnar file.
+
+    Instead of formatting every row as text, the exported columns (see the
+    export_columns method of SensorTable) are converted into one typed NumPy
+    array per header, straight from the column buffers, and the arrays are
+    written as a whole to a Parquet, Arrow IPC (Feather) or NumPy .npz file.
+    Parquet and Feather require the optional pyarrow package.
+
+    Attributes:
+        export_format (str): The file format to write, one of FORMAT_EXTENSIONS.
+        compression (str, optional): The compression codec, or None for the default
+            codec of the format.
+
+    Methods:
+        get_extension(): Get the file extension of the export format.
+        build_columns(headers, columns): Convert exported columns into named typed arrays.
+        write(file_path, headers, columns): Write exported columns as a columnar file.
+    """
+
+    FORMAT_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather', 'npz': '.npz'}
+
+    # supported compression codecs of each format, the first one being the default
+    FORMAT_COMPRESSIONS = {
+        'parquet': ('snappy', 'gzip', 'brotli', 'zstd', 'lz4', 'none'),
+        'feather': ('lz4', 'zstd', 'none'),
+        'npz': ('none', 'zip')
+    }
+
+    def __init__(self, export_format: str, compression: Optional[str] = None):
+        """
+        Initialize the SensorFrameWriter object.
+
+        Args:
+            export_format (str): The file format to write ('parquet', 'feather' or 'npz').
+            compression (str, optional): The compression codec. If None, the default
+                codec of the format is used.
+
+        Raises:
+            ValueError: If the format or the compression codec is not supported.
+        """
+        if export_format not in self.FORMAT_EXTENSIONS:
+            raise ValueError(f'Invalid Export Format! Available Formats: {", ".join(self.FORMAT_EXTENSIONS)}')
+
+        compressions = self.FORMAT_COMPRESSIONS[export_format]
+        if compression is not None and compression not in compressions:
+            raise ValueError(f'Invalid Compression For {export_format.title()}! '
+                             f'Available Compressions: {", ".join(compressions)}')
+
+        self.export_format = export_format
+        self.compression = compression or compressions[0]
+
+    def get_extension(self) -> str:
+        """
+        Get the file extension of the export format.
+
+        Returns:
+            str: The file extension, including the leading dot.
+        """
+        return self.FORMAT_EXTENSIONS[self.export_format]
+
+    @staticmethod
+    def build_columns(headers: str, columns: List[Sequence]) -> dict:
+        """
+        Convert exported columns into named typed arrays.
+
+        Every column is converted into a NumPy array, so numeric values become
+        float64 or int64 columns and text values become string columns. The
+        'd' and 'q' buffers of a SensorTable are used as they are, without
+        going through a Python object per value.
+
+        Args:
+            headers (str): Comma-separated header names, as returned by get_headers.
+            columns (List[Sequence]): Exported columns in header order, as returned by export_columns.
+
+        Returns:
+            dict: A mapping of header name to its column array, in header order.
+        """
+        import numpy as np  # imported on first use, so importing the writer stays cheap
+
+        names = headers.split(',')
+        if not columns or not len(columns[0]):
+            return {name: np.empty(0) for name in names}
+        return {name: np.asarray(column) for name, column in zip(names, columns)}
+
+    def write(self, file_path: str, headers: str, columns: List[Sequence]) -> None:
+        """
+        Write exported columns as a columnar file.
+
+        Args:
+            file_path (str): Path of the file to write.
+            headers (str): Comma-separated header names, as returned by get_headers.
+            columns (List[Sequence]): Exported columns in header order, as returned by export_columns.
+
+        Raises:
+            ImportError: If the format requires pyarrow and it is not installed.
+        """
+        columns = self.build_columns(headers, columns)
+
+        if self.export_format == 'npz':
+            import numpy as np
+            save = np.savez_compressed if self.compression == 'zip' else np.savez
+            save(file_path, **columns)
+            return
+
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            import pyarrow.parquet as parquet
+        except ImportError:
+            raise ImportError(f'{self.export_format.title()} Export Requires pyarrow! Install It With: pip install pyarrow')
+
+        table = pa.table(columns)
+        if self.export_format == 'parquet':
+            parquet.write_table(table, file_path, compression=self.compression)
+        else:
+            feather.write_feather(table, file_path, compression=self.compression)
@@ -0,0 +1,179 @@
+import os
+import hashlib
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..Base.ParseErrorCollector import ParseError
+from ..Base.SensorTable import SensorTable
+
+class SensorParseCache:
+    """
+    A class to keep parsed sensor tables on disk, keyed by the content of the logfile.
+
+    The columns of every SensorTable of a parsed logfile are saved as one
+    uncompressed NumPy .npz file, together with the lines that failed to parse.
+    The file name is made of a hash of the logfile contents and the parser
+    version, so a renamed or copied logfile still hits the cache while an edited
+    logfile or a new parser version misses it. Loading the columns back is much cheaper than
+    splitting and converting the text of the logfile again.
+
+    The total size of the cache directory is capped: after storing an entry, the
+    least recently used entries are deleted until the cache fits again. The
+    modification time of an entry is refreshed whenever it is loaded, so it marks
+    the last use of the entry.
+
+    The cache directory is 'sensor_data_parser' in $XDG_CACHE_HOME, or in ~/.cache
+    if that is not set.
+
+    Attributes:
+        cache_dir (str): Directory of the cache entries.
+        max_size (int): Maximum total size of the cache entries in bytes.
+
+    Methods:
+        get_key(file_source, version): Get the cache key of a logfile.
+        get_entry_path(key): Get the path of the cache entry of a key.
+        load(key, sensor_class_map): Load the parsed tables of a cache entry.
+        store(key, sensors_tables, parse_errors): Save parsed tables as a cache entry.
+        evict(): Delete the least recently used entries until the cache fits its size cap.
+    """
+
+    CACHE_DIR_NAME = 'sensor_data_parser'
+    DEFAULT_MAX_SIZE = 2 * 1024 * 1024 * 1024  # bytes of all cache entries together
+    HASH_BLOCK_SIZE = 8 * 1024 * 1024  # bytes of the logfile hashed at a time
+    ENTRY_EXTENSION = '.npz'
+    ERROR_KEYS = ('_errors.line_number', '_errors.tag', '_errors.category', '_errors.message', '_errors.line')
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: Optional[int] = None):
+        """
+        Initialize the SensorParseCache object.
+
+        Args:
+            cache_dir (str, optional): Directory of the cache entries. If None,
+                CACHE_DIR_NAME in the user cache directory is used.
+            max_size (int, optional): Maximum total size of the cache entries in bytes.
+                If None, DEFAULT_MAX_SIZE is used.
+        """
+        if cache_dir is None:
+            user_cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            cache_dir = os.path.join(user_cache_dir, self.CACHE_DIR_NAME)
+        self.cache_dir = cache_dir
+        self.max_size = self.DEFAULT_MAX_SIZE if max_size is None else max_size
+
+    def get_key(self, file_source: str, version: int) -> str:
+        """
+        Get the cache key of a logfile.
+
+        Args:
+            file_source (str): Path to the logfile.
+            version (int): Version of the parser, so entries of older parsers are not used.
+
+        Returns:
+            str: The SHA-256 hash of the logfile contents followed by the parser version.
+        """
+        digest = hashlib.sha256()
+        with open(file_source, 'rb') as file:
+            for block in iter(lambda: file.read(self.HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        return f'{digest.hexdigest()}_v{version}'
+
+    def get_entry_path(self, key: str) -> str:
+        """
+        Get the path of the cache entry of a key.
+
+        Args:
+            key (str): The cache key, as returned by get_key.
+
+        Returns:
+            str: The path of the .npz file of the entry.
+        """
+        return os.path.join(self.cache_dir, f'{key}{self.ENTRY_EXTENSION}')
+
+    def load(self, key: str, sensor_class_map: dict) -> Optional[Tuple[Dict[str, SensorTable], List[ParseError]]]:
+        """
+        Load the parsed tables of a cache entry.
+
+        Args:
+            key (str): The cache key, as returned by get_key.
+            sensor_class_map (dict): A mapping of sensor tag to its sensor class.
+
+        Returns:
+            Tuple[Dict[str, SensorTable], List[ParseError]], optional: The parsed tables and
+                every line that failed to parse, or None if there is no usable entry for the key.
+        """
+        entry_path = self.get_entry_path(key)
+        try:
+            with np.load(entry_path) as entry:
+                columns = {name: entry[name] for name in entry.files}
+        except (OSError, ValueError):
+            return None  # a missing or broken entry is treated as a cache miss
+
+        # marked the entry as recently used
+        os.utime(entry_path)
+
+        parse_errors = list(zip(*(columns.pop(error_key).tolist() for error_key in self.ERROR_KEYS)))
+
+        # rebuilt the tables in the order they were stored
+        sensors_tables = {}
+        for name, values in columns.items():
+            tag, field = name.split('.', 1)
+            sensor_table = sensors_tables.get(tag)
+            if sensor_table is None:
+                sensor_table = sensors_tables[tag] = SensorTable(tag, sensor_class_map[tag])
+
+            column = sensor_table.get_column(field)
+            if isinstance(column, array):
+                column.frombytes(values.astype(column.typecode).tobytes())
+            else:
+                column.extend(values.tolist())
+        return sensors_tables, parse_errors
+
+    def store(self, key: str, sensors_tables: Dict[str, SensorTable], parse_errors: List[ParseError]) -> None:
+        """
+        Save parsed tables as a cache entry and evict old entries if the cache is full.
+
+        The entry is written to a temporary file first and then moved into place,
+        so concurrent parsers never read a partly written entry.
+
+        Args:
+            key (str): The cache key, as returned by get_key.
+            sensors_tables (Dict[str, SensorTable]): A mapping of sensor tag to its parsed table.
+            parse_errors (List[ParseError]): The line number, tag, category, message and raw
+                line of every line that failed to parse.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        error_columns = list(zip(*parse_errors)) or [()] * len(self.ERROR_KEYS)
+        columns = {error_key: np.array(values, dtype=dtype) for error_key, values, dtype
+                   in zip(self.ERROR_KEYS, error_columns, (np.int64, str, str, str, bytes))}
+        for tag, sensor_table in sensors_tables.items():
+            for field, column in sensor_table.columns.items():
+                columns[f'{tag}.{field}'] = np.array(column, dtype=str) if isinstance(column, list) else np.asarray(column)
+
+        entry_path = self.get_entry_path(key)
+        temp_path = f'{entry_path}.{os.getpid()}.tmp{self.ENTRY_EXTENSION}'
+        np.savez(temp_path, **columns)
+        os.replace(temp_path, entry_path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Delete the least recently used entries until the cache fits its size cap.
+        """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.ENTRY_EXTENSION) and '.tmp' not in entry.name:
+                entry_stat = entry.stat()
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # the entry was already deleted by a concurrent parser
+            total_size -= size
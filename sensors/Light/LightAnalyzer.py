@@ -1,5 +1,8 @@
 import pandas as pd
 import matplotlib.pyplot as plt
+from typing import Union
+from .LightCalculator import LightCalculator
+from ..IO.SensorFrameLoader import SensorFrameLoader
 
 class LightAnalyzer:
     """
@@ -15,22 +18,25 @@ class LightAnalyzer:
         run_analysis(): Run all analysis methods and print statistics.
     """
 
-    def __init__(self, csv_file_path: str):
+    def __init__(self, data: Union[str, pd.DataFrame]):
         """
         Initialize the LightAnalyzer with data from a CSV file.
 
         Args:
-            csv_file_path (str): Path to the CSV file containing light sensor data.
+            data (str | pd.DataFrame): Path to the exported file (CSV, Parquet, Feather or NPZ) containing light sensor data,
+                or a DataFrame of the data, e.g. parsed straight from a logfile.
         """
-        self.df = pd.read_csv(csv_file_path)
-        self.df['timestamp'] = pd.to_datetime(self.df['index'], unit='s')
+        self.df = SensorFrameLoader.load(data)
+        # calculated the day/night column for files exported without the calculated values
+        if 'day_night' not in self.df:
+            self.df['day_night'] = LightCalculator.detect_day_night_batch(self.df['light'])
 
     def plot_light_over_time(self):
         """
         Plot light intensity over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['light'])
+        plt.plot(self.df.index, self.df['light'])
         plt.title('Ambient Light Levels Over Time')
         plt.xlabel('Time')
         plt.ylabel('Light Intensity')
@@ -42,9 +48,9 @@ class LightAnalyzer:
         Plot day/night detection over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['light'], color='gray', alpha=0.5)
-        plt.fill_between(self.df['timestamp'], self.df['light'], where=self.df['day_night'] == 'Day', color='yellow', alpha=0.3, label='Day')
-        plt.fill_between(self.df['timestamp'], self.df['light'], where=self.df['day_night'] == 'Night', color='blue', alpha=0.3, label='Night')
+        plt.plot(self.df.index, self.df['light'], color='gray', alpha=0.5)
+        plt.fill_between(self.df.index, self.df['light'], where=self.df['day_night'] == 'Day', color='yellow', alpha=0.3, label='Day')
+        plt.fill_between(self.df.index, self.df['light'], where=self.df['day_night'] == 'Night', color='blue', alpha=0.3, label='Night')
         plt.title('Day/Night Detection')
         plt.xlabel('Time')
         plt.ylabel('Light Intensity')
@@ -56,14 +62,14 @@ class LightAnalyzer:
         """
         Analyze and plot light intensity patterns.
         """
-        # calculated rolling average
-        window_size = 10  # Adjust as needed
-        self.df['rolling_avg'] = self.df['light'].rolling(window=window_size).mean()
+        # calculated rolling average over a time window of about 10 samples
+        window = SensorFrameLoader.get_time_window(self.df, 10)  # Adjust as needed
+        self.df['rolling_avg'] = self.df['light'].rolling(window).mean()
 
         # plotted rolling average
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['light'], label='Raw Light')
-        plt.plot(self.df['timestamp'], self.df['rolling_avg'], label=f'{window_size}-point Rolling Average', color='red')
+        plt.plot(self.df.index, self.df['light'], label='Raw Light')
+        plt.plot(self.df.index, self.df['rolling_avg'], label=f'{window.total_seconds():g} s Rolling Average', color='red')
         plt.title('Light Intensity Patterns')
         plt.xlabel('Time')
         plt.ylabel('Light Intensity')
@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class LightCalculator:
     """
     A class to perform calculations related to light sensor data.
@@ -28,4 +33,35 @@ class LightCalculator:
         Returns:
             str: 'Day' if light intensity is above threshold, 'Night' otherwise.
         """
-        return 'Day' if light > threshold else 'Night'
\ No newline at end of file
+        return 'Day' if light > threshold else 'Night'
+
+    @staticmethod
+    def calculate_double_light_batch(light: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate double of the light intensity for a whole column.
+
+        Args:
+            light (np.ndarray): Light intensity values.
+
+        Returns:
+            np.ndarray: Double of each input light intensity.
+        """
+        import numpy as np
+
+        return np.asarray(light, dtype=float) * 2
+
+    @staticmethod
+    def detect_day_night_batch(light: 'np.ndarray', threshold: float = 50.0) -> 'np.ndarray':
+        """
+        Detect whether it's day or night based on a whole column of light intensities.
+
+        Args:
+            light (np.ndarray): Light intensity values.
+            threshold (float): Threshold to distinguish between day and night. Default is 50.0.
+
+        Returns:
+            np.ndarray: 'Day' where light intensity is above threshold, 'Night' otherwise.
+        """
+        import numpy as np
+
+        return np.where(np.asarray(light, dtype=float) > threshold, 'Day', 'Night')
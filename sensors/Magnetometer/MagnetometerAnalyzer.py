@@ -1,28 +1,37 @@
 import math
 import pandas as pd
 import matplotlib.pyplot as plt
+from typing import Union
+from .MagnetometerCalculator import MagnetometerCalculator
+from ..IO.SensorFrameLoader import SensorFrameLoader
 
 class MagnetometerAnalyzer:
     """
     A class to analyze magnetometer data from a CSV file.
     """
 
-    def __init__(self, csv_file_path: str):
+    def __init__(self, data: Union[str, pd.DataFrame]):
         """
         Initialize the MagnetometerAnalyzer object.
 
         Args:
-            csv_file_path (str): Path to the CSV file containing magnetometer data.
+            data (str | pd.DataFrame): Path to the exported file (CSV, Parquet, Feather or NPZ) containing magnetometer data,
+                or a DataFrame of the data, e.g. parsed straight from a logfile.
         """
-        self.df = pd.read_csv(csv_file_path)
-        self.df['timestamp'] = pd.to_datetime(self.df['index'], unit='s')
+        self.df = SensorFrameLoader.load(data)
+        # calculated the magnitude and heading for files exported without the calculated values
+        if 'magnitude' not in self.df:
+            self.df['magnitude'] = MagnetometerCalculator.calculate_magnitude_batch(
+                self.df['mag_x'], self.df['mag_y'], self.df['mag_z'])
+        if 'heading' not in self.df:
+            self.df['heading'] = MagnetometerCalculator.calculate_compass_heading_batch(self.df['mag_x'], self.df['mag_y'])
 
     def plot_magnetic_field_over_time(self):
         """
         Plot the magnetic field magnitude over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['magnitude'])
+        plt.plot(self.df.index, self.df['magnitude'])
         plt.title('Magnetic Field Magnitude Over Time')
         plt.xlabel('Time')
         plt.ylabel('Magnitude (μT)')
@@ -69,8 +78,8 @@ class MagnetometerAnalyzer:
         print(f"Number of detected magnetic anomalies: {len(anomalies)}")
         if not anomalies.empty:
             print("Anomaly times:")
-            for _, anomaly in anomalies.iterrows():
-                print(f"  {anomaly['timestamp']}: Magnitude = {anomaly['magnitude']:.2f} μT")
+            for timestamp, anomaly in anomalies.iterrows():
+                print(f"  {timestamp}: Magnitude = {anomaly['magnitude']:.2f} μT")
 
         # calculated and printed statistics
         print("\nMagnetometer Statistics:")
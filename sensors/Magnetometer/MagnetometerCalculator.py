@@ -1,4 +1,8 @@
 import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class MagnetometerCalculator:
     """
@@ -36,4 +40,39 @@ class MagnetometerCalculator:
         heading = math.degrees(heading)
         if heading < 0:
             heading += 360
-        return heading
\ No newline at end of file
+        return heading
+
+    @staticmethod
+    def calculate_magnitude_batch(mag_x: 'np.ndarray', mag_y: 'np.ndarray', mag_z: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the magnitude of the magnetic field for whole columns.
+
+        Args:
+            mag_x (np.ndarray): Magnetometer readings on X-axis.
+            mag_y (np.ndarray): Magnetometer readings on Y-axis.
+            mag_z (np.ndarray): Magnetometer readings on Z-axis.
+
+        Returns:
+            np.ndarray: The magnitude of the magnetic field of each sample.
+        """
+        import numpy as np
+
+        mag_x, mag_y, mag_z = (np.asarray(axis, dtype=float) for axis in (mag_x, mag_y, mag_z))
+        return np.sqrt(mag_x**2 + mag_y**2 + mag_z**2)
+
+    @staticmethod
+    def calculate_compass_heading_batch(mag_x: 'np.ndarray', mag_y: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the compass heading based on whole columns of magnetometer readings.
+
+        Args:
+            mag_x (np.ndarray): Magnetometer readings on X-axis.
+            mag_y (np.ndarray): Magnetometer readings on Y-axis.
+
+        Returns:
+            np.ndarray: The compass heading of each sample in degrees (0-360).
+        """
+        import numpy as np
+
+        heading = np.degrees(np.arctan2(np.asarray(mag_y, dtype=float), np.asarray(mag_x, dtype=float)))
+        return np.where(heading < 0, heading + 360, heading)
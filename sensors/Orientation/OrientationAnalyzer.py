@@ -1,5 +1,8 @@
 import pandas as pd
 import matplotlib.pyplot as plt
+from typing import Union
+from .OrientationCalculator import OrientationCalculator
+from ..IO.SensorFrameLoader import SensorFrameLoader
 
 class OrientationAnalyzer:
     """
@@ -12,19 +15,26 @@ class OrientationAnalyzer:
         plot_3d_orientation(): Plot the 3D orientation of the device.
         plot_rotation_over_time(): Plot the rotation magnitude over time.
         detect_significant_rotations(threshold): Detect and plot significant rotations.
-        analyze_stabilization(window_size): Analyze and plot device stabilization.
+        analyze_stabilization(window_samples): Analyze and plot device stabilization.
         run_analysis(): Run all analysis methods and print statistics.
     """
 
-    def __init__(self, csv_file_path: str):
+    def __init__(self, data: Union[str, pd.DataFrame]):
         """
         Initialize the OrientationAnalyzer object.
 
         Args:
-            csv_file_path (str): Path to the CSV file containing orientation sensor data.
+            data (str | pd.DataFrame): Path to the exported file (CSV, Parquet, Feather or NPZ) containing orientation sensor data,
+                or a DataFrame of the data, e.g. parsed straight from a logfile.
         """
-        self.df = pd.read_csv(csv_file_path)
-        self.df['timestamp'] = pd.to_datetime(self.df['index'], unit='s')
+        self.df = SensorFrameLoader.load(data)
+        # calculated the rotation columns for files exported without the calculated values
+        if 'rotation_magnitude' not in self.df:
+            self.df['rotation_magnitude'] = OrientationCalculator.calculate_rotation_magnitude_batch(
+                self.df['rot_vec_x'], self.df['rot_vec_y'], self.df['rot_vec_z'])
+        if 'total_rotation' not in self.df:
+            self.df['total_rotation'] = OrientationCalculator.calculate_total_rotation_batch(
+                self.df['pitch_x'], self.df['roll_y'], self.df['yaw_z'])
         
     def plot_3d_orientation(self):
         """
@@ -45,7 +55,7 @@ class OrientationAnalyzer:
         Plot the rotation magnitude over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['rotation_magnitude'])
+        plt.plot(self.df.index, self.df['rotation_magnitude'])
         plt.title('Rotation Magnitude Over Time')
         plt.xlabel('Time')
         plt.ylabel('Rotation Magnitude')
@@ -62,8 +72,8 @@ class OrientationAnalyzer:
         significant_rotations = self.df[self.df['rotation_magnitude'] > threshold]
         
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['rotation_magnitude'], label='Rotation Magnitude')
-        plt.scatter(significant_rotations['timestamp'], significant_rotations['rotation_magnitude'], 
+        plt.plot(self.df.index, self.df['rotation_magnitude'], label='Rotation Magnitude')
+        plt.scatter(significant_rotations.index, significant_rotations['rotation_magnitude'], 
                     color='red', label='Significant Rotations')
         plt.title('Significant Rotations Detection')
         plt.xlabel('Time')
@@ -72,18 +82,20 @@ class OrientationAnalyzer:
         plt.grid(True)
         plt.show()
 
-    def analyze_stabilization(self, window_size=10):
+    def analyze_stabilization(self, window_samples=10):
         """
         Analyze and plot device stabilization.
 
         Args:
-            window_size (int): The size of the rolling window for calculating the average.
+            window_samples (int): The number of samples the rolling time window for calculating
+                the average covers on average.
         """
-        self.df['rolling_total_rotation'] = self.df['total_rotation'].rolling(window=window_size).mean()
+        window = SensorFrameLoader.get_time_window(self.df, window_samples)
+        self.df['rolling_total_rotation'] = self.df['total_rotation'].rolling(window).mean()
         
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['total_rotation'], label='Total Rotation', alpha=0.5)
-        plt.plot(self.df['timestamp'], self.df['rolling_total_rotation'], label=f'{window_size}-point Rolling Average', color='red')
+        plt.plot(self.df.index, self.df['total_rotation'], label='Total Rotation', alpha=0.5)
+        plt.plot(self.df.index, self.df['rolling_total_rotation'], label=f'{window.total_seconds():g} s Rolling Average', color='red')
         plt.title('Device Stabilization Analysis')
         plt.xlabel('Time')
         plt.ylabel('Total Rotation')
@@ -1,4 +1,8 @@
 import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class OrientationCalculator:
     """
@@ -33,4 +37,40 @@ class OrientationCalculator:
         Returns:
             float: The total rotation.
         """
-        return abs(pitch_X) + abs(roll_Y) + abs(yaw_Z)
\ No newline at end of file
+        return abs(pitch_X) + abs(roll_Y) + abs(yaw_Z)
+
+    @staticmethod
+    def calculate_rotation_magnitude_batch(rot_vec_X, rot_vec_Y, rot_vec_Z):
+        """
+        Calculate the magnitude of the rotation vector for whole columns.
+
+        Args:
+            rot_vec_X (np.ndarray): Rotation vector components along X-axis.
+            rot_vec_Y (np.ndarray): Rotation vector components along Y-axis.
+            rot_vec_Z (np.ndarray): Rotation vector components along Z-axis.
+
+        Returns:
+            np.ndarray: The magnitude of the rotation vector of each sample.
+        """
+        import numpy as np
+
+        rot_vec_X, rot_vec_Y, rot_vec_Z = (np.asarray(axis, dtype=float) for axis in (rot_vec_X, rot_vec_Y, rot_vec_Z))
+        return np.sqrt(rot_vec_X ** 2 + rot_vec_Y ** 2 + rot_vec_Z ** 2)
+
+    @staticmethod
+    def calculate_total_rotation_batch(pitch_X, roll_Y, yaw_Z):
+        """
+        Calculate the total rotation by summing the absolute values of pitch, roll, and yaw for whole columns.
+
+        Args:
+            pitch_X (np.ndarray): Pitch angles around X-axis.
+            roll_Y (np.ndarray): Roll angles around Y-axis.
+            yaw_Z (np.ndarray): Yaw angles around Z-axis.
+
+        Returns:
+            np.ndarray: The total rotation of each sample.
+        """
+        import numpy as np
+
+        pitch_X, roll_Y, yaw_Z = (np.asarray(angle, dtype=float) for angle in (pitch_X, roll_Y, yaw_Z))
+        return np.abs(pitch_X) + np.abs(roll_Y) + np.abs(yaw_Z)
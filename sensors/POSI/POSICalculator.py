@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class POSICalculator:
     """
     A class to perform calculations related to POSI (Position) sensor data.
@@ -15,4 +20,20 @@ class POSICalculator:
         Returns:
             float: The product of latitude and longitude.
         """
-        return latitude * longitude
\ No newline at end of file
+        return latitude * longitude
+
+    @staticmethod
+    def calculate_lat_long_product_batch(latitude: 'np.ndarray', longitude: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the product of latitude and longitude for whole columns.
+
+        Args:
+            latitude (np.ndarray): The latitude coordinates.
+            longitude (np.ndarray): The longitude coordinates.
+
+        Returns:
+            np.ndarray: The product of latitude and longitude of each sample.
+        """
+        import numpy as np
+
+        return np.asarray(latitude, dtype=float) * np.asarray(longitude, dtype=float)
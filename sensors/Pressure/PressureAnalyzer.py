@@ -1,5 +1,8 @@
 import pandas as pd
 import matplotlib.pyplot as plt
+from typing import Union
+from .PressureCalculator import PressureCalculator
+from ..IO.SensorFrameLoader import SensorFrameLoader
 
 class PressureAnalyzer:
     """
@@ -15,22 +18,25 @@ class PressureAnalyzer:
         run_analysis(): Run all analysis methods and print statistics.
     """
 
-    def __init__(self, csv_file_path: str):
+    def __init__(self, data: Union[str, pd.DataFrame]):
         """
         Initialize the PressureAnalyzer object.
 
         Args:
-            csv_file_path (str): Path to the CSV file containing pressure sensor data.
+            data (str | pd.DataFrame): Path to the exported file (CSV, Parquet, Feather or NPZ) containing pressure sensor data,
+                or a DataFrame of the data, e.g. parsed straight from a logfile.
         """
-        self.df = pd.read_csv(csv_file_path)
-        self.df['timestamp'] = pd.to_datetime(self.df['index'], unit='s')
+        self.df = SensorFrameLoader.load(data)
+        # calculated the altitude for files exported without the calculated values
+        if 'estimated_altitude' not in self.df:
+            self.df['estimated_altitude'] = PressureCalculator.estimate_altitude_batch(self.df['pres'])
 
     def plot_pressure_over_time(self):
         """
         Plot the pressure over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['pres'])
+        plt.plot(self.df.index, self.df['pres'])
         plt.title('Pressure Over Time')
         plt.xlabel('Time')
         plt.ylabel('Pressure (hPa)')
@@ -42,7 +48,7 @@ class PressureAnalyzer:
         Plot the estimated altitude over time.
         """
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['estimated_altitude'])
+        plt.plot(self.df.index, self.df['estimated_altitude'])
         plt.title('Estimated Altitude Over Time')
         plt.xlabel('Time')
         plt.ylabel('Altitude (m)')
@@ -58,7 +64,7 @@ class PressureAnalyzer:
 
         # plotted pressure changes
         plt.figure(figsize=(12, 6))
-        plt.plot(self.df['timestamp'], self.df['pressure_change'])
+        plt.plot(self.df.index, self.df['pressure_change'])
         plt.title('Pressure Changes Over Time')
         plt.xlabel('Time')
         plt.ylabel('Pressure Change (hPa)')
@@ -70,8 +76,8 @@ class PressureAnalyzer:
         significant_changes = self.df[abs(self.df['pressure_change']) > significant_change]
         
         print("Significant Pressure Changes:")
-        for _, row in significant_changes.iterrows():
-            print(f"Time: {row['timestamp']}, Change: {row['pressure_change']:.2f} hPa")
+        for timestamp, row in significant_changes.iterrows():
+            print(f"Time: {timestamp}, Change: {row['pressure_change']:.2f} hPa")
 
     def run_analysis(self):
         """
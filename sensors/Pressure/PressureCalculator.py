@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class PressureCalculator:
     """
     A class to perform calculations related to pressure sensor data.
@@ -28,4 +33,35 @@ class PressureCalculator:
         Returns:
             float: Estimated altitude in meters.
         """
-        return 44330 * (1 - (pressure / sea_level_pressure) ** (1/5.255))
\ No newline at end of file
+        return 44330 * (1 - (pressure / sea_level_pressure) ** (1/5.255))
+
+    @staticmethod
+    def calculate_psi_batch(pressure: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate pressure in PSI from hPa for a whole column.
+
+        Args:
+            pressure (np.ndarray): Pressure values in hPa.
+
+        Returns:
+            np.ndarray: Pressure values in PSI.
+        """
+        import numpy as np
+
+        return np.asarray(pressure, dtype=float) * 0.0145038
+
+    @staticmethod
+    def estimate_altitude_batch(pressure: 'np.ndarray', sea_level_pressure: float = 1013.25) -> 'np.ndarray':
+        """
+        Estimate altitude based on a whole column of pressures.
+
+        Args:
+            pressure (np.ndarray): Pressure values in hPa.
+            sea_level_pressure (float): Sea level pressure in hPa. Defaults to 1013.25.
+
+        Returns:
+            np.ndarray: Estimated altitudes in meters.
+        """
+        import numpy as np
+
+        return 44330 * (1 - (np.asarray(pressure, dtype=float) / sea_level_pressure) ** (1/5.255))
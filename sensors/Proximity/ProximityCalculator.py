@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class ProximityCalculator:
     """
     A class to perform calculations related to proximity sensor data.
@@ -14,4 +19,19 @@ class ProximityCalculator:
         Returns:
             float: The doubled proximity value.
         """
-        return proximity * 2
\ No newline at end of file
+        return proximity * 2
+
+    @staticmethod
+    def calculate_double_proximity_batch(proximity: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the double of the proximity values for a whole column.
+
+        Args:
+            proximity (np.ndarray): The proximity values.
+
+        Returns:
+            np.ndarray: The doubled proximity values.
+        """
+        import numpy as np
+
+        return np.asarray(proximity, dtype=float) * 2
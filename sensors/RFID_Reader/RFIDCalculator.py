@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class RFIDCalculator:
     """
     A class to perform calculations related to RFID Reader sensor data.
@@ -15,4 +20,20 @@ class RFIDCalculator:
         Returns:
             float: The average Received Signal Strength.
         """
-        return (rss_A + rss_B) / 2
\ No newline at end of file
+        return (rss_A + rss_B) / 2
+
+    @staticmethod
+    def calculate_average_rss_batch(rss_A: 'np.ndarray', rss_B: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calculate the average Received Signal Strength (RSS) for whole columns of RSS_A and RSS_B.
+
+        Args:
+            rss_A (np.ndarray): The Received Signal Strengths (RSS) from antenna A.
+            rss_B (np.ndarray): The Received Signal Strengths (RSS) from antenna B.
+
+        Returns:
+            np.ndarray: The average Received Signal Strength of each sample.
+        """
+        import numpy as np
+
+        return (np.asarray(rss_A) + np.asarray(rss_B)) / 2
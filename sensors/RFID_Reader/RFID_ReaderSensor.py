@@ -1,4 +1,5 @@
 from ..Base.SensorBase import SensorBase
+from ..Base.SensorSchema import CalculatedColumn, SensorSchema
 from .RFIDCalculator import RFIDCalculator
 
 class RFID_ReaderSensor(SensorBase):
@@ -18,50 +19,26 @@ class RFID_ReaderSensor(SensorBase):
         app_timestamp (float): Application timestamp.
     """
 
-    def __init__(self, app_timestamp, reader_number, tag_id, rss_A, rss_B):
-        """
-        Initialize the RFID_ReaderSensor object.
-
-        Args:
-            app_timestamp (float): The application timestamp.
-            reader_number (int): The identifier for the RFID reader.
-            tag_id (int): The identifier for the RFID tag.
-            rss_A (int): The Received Signal Strength (RSS) from antenna A.
-            rss_B (int): The Received Signal Strength (RSS) from antenna B.
-        """
-        super().__init__('RFID', float(app_timestamp))
-        self.reader_number = int(reader_number)
-        self.tag_id = int(tag_id)
-        self.rss_A = int(rss_A)
-        self.rss_B = int(rss_B)
-
-    def export_row(self, index, include_calculated=True):
-        """
-        Export RFID Reader data as a row for a CSV file.
-
-        Args:
-            index (int): The row index.
-            include_calculated (bool): Whether to include the calculated average RSS.
-
-        Returns:
-            str: A comma-separated string containing the RFID reader data.
-        """
-        base_row = f'{index},{self.reader_number},{self.tag_id},{self.rss_A},{self.rss_B}'
-        if include_calculated:
-            # calculated average rss using RFIDCalculator
-            avg_rss = RFIDCalculator.calculate_average_rss(self.rss_A, self.rss_B)
-            return f'{base_row},{avg_rss}'
-        return base_row
-    
-    @staticmethod
-    def get_headers(include_calculated=False):
-        """
-        Get the headers for the CSV file.
-
-        Args:
-            include_calculated (bool): Whether to include the header for the calculated value.
-
-        Returns:
-            str: A comma-separated string of header names.
-        """
-        return 'index,reader_number,tag_id,rss_A,rss_B' + (',avg_rss' if include_calculated else '')
\ No newline at end of file
+    SCHEMA = SensorSchema(
+        'RFID',
+        fields=(
+            ('app_timestamp', float),
+            ('reader_number', int),
+            ('tag_id', int),
+            ('rss_A', int),
+            ('rss_B', int)
+        ),
+        export_fields=(
+            ('reader_number', 'reader_number'),
+            ('tag_id', 'tag_id'),
+            ('rss_A', 'rss_A'),
+            ('rss_B', 'rss_B')
+        ),
+        calculated_columns=(
+            CalculatedColumn('avg_rss', ('rss_A', 'rss_B'),
+                             RFIDCalculator.calculate_average_rss,
+                             RFIDCalculator.calculate_average_rss_batch),
+        )
+    )
+
+    __slots__ = ('reader_number', 'tag_id', 'rss_A', 'rss_B')
@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class SoundCalculator:
     """
     A class to perform calculations related to sound data.
@@ -6,6 +11,7 @@ class SoundCalculator:
 
     Methods:
         calculate_spl_category(spl): Calculate sound pressure level category.
+        calculate_spl_category_batch(spl): Calculate sound pressure level categories for a whole column.
     """
 
     @staticmethod
@@ -24,4 +30,20 @@ class SoundCalculator:
         elif 70 <= spl < 90:
             return 'Moderate'
         else:
-            return 'Low'
\ No newline at end of file
+            return 'Low'
+
+    @staticmethod
+    def calculate_spl_category_batch(spl):
+        """
+        Calculate the sound pressure level category for a whole column.
+
+        Args:
+            spl (np.ndarray): Sound Pressure Levels.
+
+        Returns:
+            np.ndarray: 'High' where SPL >= 90, 'Moderate' where 70 <= SPL < 90, 'Low' otherwise.
+        """
+        import numpy as np
+
+        spl = np.asarray(spl, dtype=float)
+        return np.select([spl >= 90, spl >= 70], ['High', 'Moderate'], 'Low')
@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class TemperatureCalculator:
     """
     A class to perform calculations related to temperature data.
@@ -6,6 +11,7 @@ class TemperatureCalculator:
 
     Methods:
         celsius_to_fahrenheit(celsius): Convert Celsius to Fahrenheit.
+        celsius_to_fahrenheit_batch(celsius): Convert a whole column from Celsius to Fahrenheit.
     """
 
     @staticmethod
@@ -19,4 +25,19 @@ class TemperatureCalculator:
         Returns:
             float: Temperature in Fahrenheit.
         """
-        return (celsius * 9/5) + 32
\ No newline at end of file
+        return (celsius * 9/5) + 32
+
+    @staticmethod
+    def celsius_to_fahrenheit_batch(celsius):
+        """
+        Convert a whole column of temperatures from Celsius to Fahrenheit.
+
+        Args:
+            celsius (np.ndarray): Temperatures in Celsius.
+
+        Returns:
+            np.ndarray: Temperatures in Fahrenheit.
+        """
+        import numpy as np
+
+        return (np.asarray(celsius, dtype=float) * 9/5) + 32
@@ -1,3 +1,8 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 class WifiCalculator:
     """
     A class to perform calculations related to WiFi sensor data.
@@ -6,8 +11,13 @@ class WifiCalculator:
 
     Methods:
         calculate_signal_strength(rss): Calculate signal strength category based on RSS.
+        calculate_signal_strength_batch(rss): Calculate signal strength categories for a whole column.
     """
 
+    # lower bounds of the signal strength categories in ascending order, and the category of each interval
+    SIGNAL_STRENGTH_BINS = [-90, -80, -70, -50]
+    SIGNAL_STRENGTH_CATEGORIES = ('Very Weak', 'Weak', 'Fair', 'Good', 'Excellent')
+
     @staticmethod
     def calculate_signal_strength(rss):
         """
@@ -28,4 +38,26 @@ class WifiCalculator:
         elif -80 > rss >= -90:
             return 'Weak'
         else:
-            return 'Very Weak'
\ No newline at end of file
+            return 'Very Weak'
+
+    @staticmethod
+    def calculate_signal_strength_batch(rss):
+        """
+        Calculate the signal strength categories for a whole column of RSS values.
+
+        The category of every value is looked up at once by its interval between the
+        category bounds, instead of comparing each value in turn. A missing value (NaN)
+        fails every comparison of calculate_signal_strength and is 'Very Weak' as well.
+
+        Args:
+            rss (np.ndarray): Received Signal Strengths.
+
+        Returns:
+            np.ndarray: Signal strength category (Excellent, Good, Fair, Weak, or Very Weak) of each value.
+        """
+        import numpy as np
+
+        rss = np.asarray(rss, dtype=float)
+        # sorted NaN into the lowest interval, as np.digitize puts it above the last bound
+        intervals = np.where(np.isnan(rss), 0, np.digitize(rss, WifiCalculator.SIGNAL_STRENGTH_BINS))
+        return np.array(WifiCalculator.SIGNAL_STRENGTH_CATEGORIES)[intervals]
@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from parser003 import SensorDataParser
+from sensors.Wifi.WifiCalculator import WifiCalculator
+
+# values at and around the bounds of the categorical calculations, and a missing value for the float fields
+EDGE_VALUES = (-90, -80.5, -80, -70.5, -70, -60.5, -60, -50.5, -50, 0, 49.5, 50, 50.5, 69.5, 70, 89.5, 90, 1013.25)
+
+class BatchCalculationTest(unittest.TestCase):
+    """
+    Tests that the batch methods of the calculators calculate the values of their scalar versions.
+    """
+
+    def test_calculated_columns_of_every_sensor(self):
+        random = np.random.default_rng(0)
+        sensor_class_map = SensorDataParser().sensor_class_map
+        for tag in sensor_class_map:
+            schema = sensor_class_map[tag].SCHEMA
+            columns = {}
+            for name, field_type in schema.fields:
+                if field_type is int:
+                    values = [int(value) for value in EDGE_VALUES] + random.integers(-120, 120, 200).tolist()
+                else:
+                    values = list(map(float, EDGE_VALUES)) + [float('nan')] + random.normal(0, 100, 199).tolist()
+                columns[name] = values
+
+            scalar_columns = schema.calculate_columns(columns)
+            with np.errstate(invalid='ignore'):
+                batch_columns = schema.calculate_batch_columns(columns)
+            for column, scalar_values, batch_values in zip(schema.calculated_columns, scalar_columns, batch_columns):
+                with self.subTest(sensor=tag, column=column.header):
+                    self.assertEqual(len(batch_values), len(scalar_values))
+                    if isinstance(scalar_values[0], str):
+                        self.assertEqual(list(batch_values), scalar_values)
+                        continue
+                    # left out the invalid readings whose powers are complex (e.g. negative pressures)
+                    valid = [not isinstance(value, complex) for value in scalar_values]
+                    expected_values = [value for value, is_valid in zip(scalar_values, valid) if is_valid]
+                    np.testing.assert_allclose(np.asarray(batch_values)[valid], expected_values, rtol=1e-12, atol=1e-12)
+
+    def test_wifi_signal_strength_bounds_and_nan(self):
+        rss = [float('nan'), -49, -50, -51, -70, -71, -80, -81, -90, -91]
+        self.assertEqual(list(WifiCalculator.calculate_signal_strength_batch(rss)),
+                         [WifiCalculator.calculate_signal_strength(value) for value in rss])
+        self.assertEqual(WifiCalculator.calculate_signal_strength_batch([float('nan')])[0], 'Very Weak')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import sys
+import glob
+import tempfile
+import unittest
+import subprocess
+from typing import Dict
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARSER_SCRIPT = os.path.join(REPOSITORY_DIR, 'parser003.py')
+LOGFILE = os.path.join(REPOSITORY_DIR, 'data', 'logfile_2024_09_23_11_58_27.txt')
+
+class CalculatedExportTest(unittest.TestCase):
+    """
+    Tests that the calculated columns are exported identically by every parse engine.
+    """
+
+    def export(self, *options: str) -> Dict[str, bytes]:
+        """
+        Export all sensors of the logfile with calculated values.
+
+        Args:
+            *options (str): Additional command-line options of the parser.
+
+        Returns:
+            Dict[str, bytes]: The contents of the exported CSV file of every sensor tag.
+        """
+        with tempfile.TemporaryDirectory() as working_dir:
+            subprocess.run([sys.executable, PARSER_SCRIPT, LOGFILE, '-all', '-c', '--no-cache', *options],
+                           cwd=working_dir, check=True, stdout=subprocess.DEVNULL)
+            exported_files = {}
+            for file_path in glob.glob(os.path.join(working_dir, '*', '*.csv')):
+                with open(file_path, 'rb') as file:
+                    exported_files[os.path.basename(file_path).split('_')[0]] = file.read()
+        return exported_files
+
+    def test_jobs_and_columnar_match_serial_export(self):
+        serial_files = self.export('-j', '1')
+        self.assertIn('MAGN', serial_files)
+
+        for options in (('-j', '2'), ('-j', '4'), ('--columnar',)):
+            exported_files = self.export(*options)
+            self.assertEqual(sorted(exported_files), sorted(serial_files))
+            for tag, contents in serial_files.items():
+                with self.subTest(options=' '.join(options), sensor=tag):
+                    self.assertTrue(exported_files[tag] == contents, f'{tag} Differs From the Serial Export')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import glob
+import tempfile
+import unittest
+import subprocess
+from typing import Dict
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from parser003 import SensorDataParser
+from sensors.IO.SensorCsvWriter import SensorCsvWriter
+
+PARSER_SCRIPT = os.path.join(REPOSITORY_DIR, 'parser003.py')
+LOGFILE = os.path.join(REPOSITORY_DIR, 'data', 'logfile_2024_09_23_11_58_27.txt')
+
+class FloatPrecisionTest(unittest.TestCase):
+    """
+    Tests that a float precision rounds only the float values of the CSV files.
+    """
+
+    def export(self, *options: str) -> Dict[str, bytes]:
+        """
+        Export all sensors of the logfile with calculated values and timestamps.
+
+        Args:
+            *options (str): Additional command-line options of the parser.
+
+        Returns:
+            Dict[str, bytes]: The contents of the exported CSV file of every sensor tag.
+        """
+        with tempfile.TemporaryDirectory() as working_dir:
+            subprocess.run([sys.executable, PARSER_SCRIPT, LOGFILE, '-all', '-c', '--timestamps', '--no-cache',
+                            *options], cwd=working_dir, check=True, stdout=subprocess.DEVNULL)
+            exported_files = {}
+            for file_path in glob.glob(os.path.join(working_dir, '*', '*.csv')):
+                with open(file_path, 'rb') as file:
+                    exported_files[os.path.basename(file_path).split('_')[0]] = file.read()
+        return exported_files
+
+    def test_floats_are_rounded_in_every_parse_mode(self):
+        full_files = self.export()
+        rounded_files = self.export('--float-precision', '3')
+        self.assertEqual(sorted(rounded_files), sorted(full_files))
+        self.assertIn(b',-0.575,', rounded_files['ACCE'])
+
+        for tag, contents in full_files.items():
+            with self.subTest(sensor=tag):
+                full_lines = contents.decode().splitlines()
+                rounded_lines = rounded_files[tag].decode().splitlines()
+                self.assertEqual(rounded_lines[0], full_lines[0])
+                self.assertEqual(len(rounded_lines), len(full_lines))
+
+                # compared the values that changed with their rounding, as ints and text are written as they are
+                for full_line, rounded_line in zip(full_lines[1:], rounded_lines[1:]):
+                    for full_value, rounded_value in zip(full_line.split(','), rounded_line.split(',')):
+                        if rounded_value != full_value:
+                            self.assertEqual(rounded_value, f'{float(full_value):.3f}')
+                    self.assertEqual(rounded_line.count(','), full_line.count(','))
+
+        for options in (('--columnar',), ('--stream',), ('-j', '2')):
+            exported_files = self.export('--float-precision', '3', *options)
+            for tag, contents in rounded_files.items():
+                with self.subTest(options=' '.join(options), sensor=tag):
+                    self.assertTrue(exported_files[tag] == contents, f'{tag} Differs From the Serial Export')
+
+    def test_format_rows(self):
+        csv_writer = SensorCsvWriter(2)
+        self.assertEqual(csv_writer.format_rows([(1, 0.125, 'a'), (2, float('nan'), 'b'), (3, 2.0, '1.5')]),
+                         '1,0.12,a\n2,nan,b\n3,2.00,1.5\n')
+        # formatted a text value in a float column value by value
+        self.assertEqual(csv_writer.format_rows([(1, 0.5), (2, 'x')]), '1,0.50\n2,x\n')
+        self.assertEqual(SensorCsvWriter(0).format_rows([(1.5, 2.5)]), '2,2\n')
+        self.assertEqual(SensorCsvWriter().format_rows([(1, 0.1 + 0.2)]), '1,0.30000000000000004\n')
+
+    def test_invalid_float_precision(self):
+        with self.assertRaises(ValueError):
+            SensorCsvWriter(-1)
+        with self.assertRaises(ValueError):
+            SensorDataParser().get_csv_writer('parquet', 3)
+
+if __name__ == '__main__':
+    unittest.main()
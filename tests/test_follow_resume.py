@@ -0,0 +1,99 @@
+import io
+import os
+import sys
+import glob
+import shutil
+import tempfile
+import unittest
+import contextlib
+from typing import Dict
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from parser003 import SensorDataParser
+
+LOGFILE = os.path.join(REPOSITORY_DIR, 'data', 'logfile_2024_09_23_11_58_27.txt')
+# split before the first PROX line, so the sensor first shows up after the split
+SPLIT_LINE = 2500
+
+class FollowResumeTest(unittest.TestCase):
+    """
+    Tests that a restarted follow mode exports every row once, whenever the previous process stopped.
+    """
+
+    def setUp(self):
+        self.working_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.working_dir)
+        with open(LOGFILE, 'rb') as file:
+            self.lines = file.readlines()
+        self.source = os.path.join(self.working_dir, 'logfile.txt')
+        self.reference_files = self.follow(len(self.lines), 'reference')
+        os.remove(self.source)
+
+    def follow(self, line_count: int, export_name: str) -> Dict[str, bytes]:
+        """
+        Follow the logfile after writing its first lines, until no more lines arrive.
+
+        Args:
+            line_count (int): Number of lines of the logfile written to the followed file.
+            export_name (str): Name of the export directory in the working directory.
+
+        Returns:
+            Dict[str, bytes]: The contents of the exported CSV file of every sensor tag.
+        """
+        with open(self.source, 'wb') as file:
+            file.writelines(self.lines[:line_count])
+        export_dir = os.path.join(self.working_dir, export_name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            SensorDataParser().follow_sensor_data(self.source, export_dir=export_dir, poll_interval=0, idle_timeout=0)
+
+        exported_files = {}
+        for file_path in glob.glob(os.path.join(export_dir, '*.csv')):
+            with open(file_path, 'rb') as file:
+                exported_files[os.path.basename(file_path).split('_')[0]] = file.read()
+        return exported_files
+
+    def assert_reference_export(self, exported_files: Dict[str, bytes]) -> None:
+        """
+        Assert that the exported CSV files are those of following the whole logfile at once.
+
+        Args:
+            exported_files (Dict[str, bytes]): The contents of the exported CSV file of every sensor tag.
+        """
+        self.assertEqual(sorted(exported_files), sorted(self.reference_files))
+        for tag, contents in self.reference_files.items():
+            with self.subTest(sensor=tag):
+                self.assertTrue(exported_files[tag] == contents, f'{tag} Differs From the Reference Export')
+
+    def test_resume_without_checkpoint(self):
+        # stopped after the rows were appended, but before the first checkpoint was saved
+        self.follow(SPLIT_LINE, 'export')
+        os.remove(os.path.join(self.working_dir, 'export', SensorDataParser.FOLLOW_CHECKPOINT_FILE))
+        self.assert_reference_export(self.follow(len(self.lines), 'export'))
+
+    def test_resume_from_earlier_checkpoint(self):
+        # stopped after the rows were appended, but before the checkpoint was saved,
+        # when PROX rows were exported for the first time
+        self.follow(SPLIT_LINE, 'export')
+        checkpoint_path = os.path.join(self.working_dir, 'export', SensorDataParser.FOLLOW_CHECKPOINT_FILE)
+        shutil.copy(checkpoint_path, f'{checkpoint_path}.saved')
+        self.follow(len(self.lines), 'export')
+        os.replace(f'{checkpoint_path}.saved', checkpoint_path)
+
+        exported_files = self.follow(len(self.lines), 'export')
+        self.assertIn('PROX', exported_files)
+        self.assert_reference_export(exported_files)
+
+    def test_resume_after_csv_was_removed(self):
+        self.follow(SPLIT_LINE, 'export')
+        os.remove(os.path.join(self.working_dir, 'export', 'ACCE_sensor.csv'))
+
+        exported_files = self.follow(len(self.lines), 'export')
+        header_line = self.reference_files['ACCE'].split(b'\n', 1)[0]
+        self.assertTrue(exported_files['ACCE'].startswith(header_line + b'\n1,'))
+        self.assertEqual(exported_files['ACCE'].count(header_line), 1)
+        self.assertTrue(exported_files['MAGN'] == self.reference_files['MAGN'], 'MAGN Differs From the Reference Export')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import io
+import os
+import sys
+import glob
+import shutil
+import tempfile
+import unittest
+import contextlib
+import numpy as np
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from parser003 import SensorDataParser
+
+LOGFILE = os.path.join(REPOSITORY_DIR, 'data', 'logfile_2024_09_23_11_58_27.txt')
+
+class FrameWriterTest(unittest.TestCase):
+    """
+    Tests that columnar tables are written as the same typed columns as the rows of sensor objects.
+    """
+
+    def setUp(self):
+        self.working_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.working_dir)
+
+    def export(self, columnar: bool) -> dict:
+        """
+        Export all sensors with their calculated values and timestamps as NPZ files.
+
+        Args:
+            columnar (bool): Whether to parse into columnar tables instead of sensor objects.
+
+        Returns:
+            dict: A mapping of sensor tag to the arrays of its NPZ file.
+        """
+        export_dir = os.path.join(self.working_dir, 'columnar' if columnar else 'objects')
+        with contextlib.redirect_stdout(io.StringIO()):
+            SensorDataParser().parser(LOGFILE, include_calculated=True, columnar=columnar, export_dir=export_dir,
+                                      export_format='npz', use_cache=False, include_timestamps=True)
+
+        exported_frames = {}
+        for file_path in glob.glob(os.path.join(export_dir, '*.npz')):
+            with np.load(file_path) as frame:
+                exported_frames[os.path.basename(file_path).split('_')[0]] = {name: frame[name] for name in frame.files}
+        return exported_frames
+
+    def test_columnar_tables_match_sensor_objects(self):
+        columnar_frames = self.export(columnar=True)
+        object_frames = self.export(columnar=False)
+        self.assertEqual(sorted(columnar_frames), sorted(object_frames))
+
+        for tag, object_frame in object_frames.items():
+            with self.subTest(sensor=tag):
+                columnar_frame = columnar_frames[tag]
+                self.assertEqual(list(columnar_frame), list(object_frame))
+                for name, values in object_frame.items():
+                    self.assertEqual(columnar_frame[name].dtype, values.dtype, name)
+                    np.testing.assert_array_equal(columnar_frame[name], values, name)
+
+        accelerometer_frame = columnar_frames['ACCE']
+        self.assertEqual(accelerometer_frame['index'].dtype, np.int64)
+        self.assertEqual(accelerometer_frame['acc_x'].dtype, np.float64)
+        self.assertEqual(accelerometer_frame['index'][0], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import sys
+import math
+import unittest
+import numpy as np
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from sensors.GNSS_GPS.GNSS_GPS_Calculator import GNSS_GPS_Calculator
+
+# (lat1, lon1, lat2, lon2, distance in meters) of known distances on the WGS-84 ellipsoid
+VINCENTY_DISTANCES = (
+    (-(37 + 57 / 60 + 3.72030 / 3600), 144 + 25 / 60 + 29.52440 / 3600,
+     -(37 + 39 / 60 + 10.15610 / 3600), 143 + 55 / 60 + 35.38390 / 3600, 54972.271),  # Flinders Peak to Buninyong
+    (0.0, 0.0, 0.0, 1.0, GNSS_GPS_Calculator.WGS84_A * math.pi / 180),  # one degree along the equator
+    (0.0, 0.0, 90.0, 0.0, 10001965.729),  # meridian quadrant
+    (32.5, 74.1, 32.5, 74.1, 0.0)  # coincident points
+)
+
+# (lat1, lon1, lat2, lon2, distance in meters) of known distances on the sphere of the mean Earth radius
+HAVERSINE_DISTANCES = (
+    (0.0, 0.0, 0.0, 1.0, GNSS_GPS_Calculator.EARTH_RADIUS * math.pi / 180),  # one degree along the equator
+    (-90.0, 0.0, 90.0, 0.0, GNSS_GPS_Calculator.EARTH_RADIUS * math.pi),  # pole to pole
+    (0.0, 0.0, 0.0, 180.0, GNSS_GPS_Calculator.EARTH_RADIUS * math.pi),  # antipodes on the equator
+    (32.5, 74.1, 32.5, 74.1, 0.0)  # coincident points
+)
+
+class GNSSDistanceTest(unittest.TestCase):
+    """
+    Tests that the batch distance calculations return known distances and agree with geopy.
+    """
+
+    def assert_distances(self, method: str, known_distances: tuple) -> None:
+        """
+        Assert that a distance method returns the known distances, both one by one and at once.
+
+        Args:
+            method (str): Distance method, 'vincenty' or 'haversine'.
+            known_distances (tuple): The (lat1, lon1, lat2, lon2, distance) of every known distance.
+        """
+        lat1, lon1, lat2, lon2, expected = np.array(known_distances).T
+        np.testing.assert_allclose(GNSS_GPS_Calculator.calculate_distance_batch(lat1, lon1, lat2, lon2, method),
+                                   expected, atol=1e-3)
+        for *coordinates, distance in known_distances:
+            with self.subTest(method=method, coordinates=coordinates):
+                self.assertAlmostEqual(GNSS_GPS_Calculator.calculate_distance_batch(*coordinates, method=method),
+                                       distance, places=3)
+
+    def test_known_vincenty_distances(self):
+        self.assert_distances('vincenty', VINCENTY_DISTANCES)
+
+    def test_known_haversine_distances(self):
+        self.assert_distances('haversine', HAVERSINE_DISTANCES)
+
+    def test_vincenty_matches_geodesic(self):
+        random = np.random.default_rng(0)
+        lat1, lat2 = random.uniform(-80, 80, (2, 50))
+        lon1, lon2 = random.uniform(-180, 180, (2, 50))
+        expected = [GNSS_GPS_Calculator.calculate_distance(*coordinates) for coordinates in zip(lat1, lon1, lat2, lon2)]
+        np.testing.assert_allclose(GNSS_GPS_Calculator.calculate_vincenty_distance_batch(lat1, lon1, lat2, lon2),
+                                   expected, rtol=1e-9, atol=1e-3)
+
+        # kept the haversine distance within 0.5% of the ellipsoidal distance
+        haversine = GNSS_GPS_Calculator.calculate_haversine_distance_batch(lat1, lon1, lat2, lon2)
+        np.testing.assert_allclose(haversine, expected, rtol=5e-3)
+
+    def test_nearly_antipodal_points_fall_back_to_haversine(self):
+        # paired a nearly antipodal point with a point one degree along the equator
+        distance = GNSS_GPS_Calculator.calculate_vincenty_distance_batch([0.0, 0.0], [0.0, 0.0],
+                                                                         [0.5, 0.0], [179.7, 1.0])
+        haversine = GNSS_GPS_Calculator.calculate_haversine_distance_batch([0.0], [0.0], [0.5], [179.7])
+        self.assertEqual(distance[0], haversine[0])
+        geodesic_distance = GNSS_GPS_Calculator.calculate_distance(0.0, 0.0, 0.5, 179.7)
+        self.assertAlmostEqual(distance[0] / geodesic_distance, 1.0, delta=5e-3)
+        # kept the Vincenty distance of the pairs that converged
+        self.assertAlmostEqual(distance[1], GNSS_GPS_Calculator.WGS84_A * math.pi / 180, places=3)
+
+    def test_path_length_leaves_out_missing_fixes(self):
+        latitude = [0.0, 0.0, float('nan'), 0.0, 0.0]
+        longitude = [0.0, 1.0, float('nan'), 1.0, 2.0]
+        np.testing.assert_allclose(GNSS_GPS_Calculator.calculate_path_length_batch(latitude, longitude),
+                                   np.array([0.0, 1.0, 1.0, 1.0, 2.0]) * GNSS_GPS_Calculator.WGS84_A * math.pi / 180)
+
+    def test_invalid_distance_method(self):
+        with self.assertRaises(ValueError):
+            GNSS_GPS_Calculator.calculate_distance_batch([0.0], [0.0], [0.0], [1.0], 'euclidean')
+
+if __name__ == '__main__':
+    unittest.main()
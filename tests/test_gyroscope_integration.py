@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from sensors.Gyroscope.GyroscopeCalculator import GyroscopeCalculator
+
+class GyroscopeIntegrationTest(unittest.TestCase):
+    """
+    Tests that the gyroscope integration leaves out the gaps of a recording.
+    """
+
+    def setUp(self):
+        # sampled a constant rotation of 1 rad/s around the Z-axis at 100 Hz for 1 s,
+        # paused the recording for 60 s and sampled it for another second
+        self.timestamps = np.concatenate([np.arange(101) * 0.01, 61.0 + np.arange(101) * 0.01])
+        self.gyr_z = np.ones(len(self.timestamps))
+        self.zeros = np.zeros(len(self.timestamps))
+
+    def test_gap_adds_no_rotation(self):
+        for method in GyroscopeCalculator.INTEGRATION_METHODS:
+            with self.subTest(method=method):
+                integrated_columns = GyroscopeCalculator.integrate_angular_velocity_batch(
+                    self.zeros, self.zeros, self.gyr_z, self.timestamps, method)
+                self.assertEqual(integrated_columns['time_delta'][101], 0.0)
+                self.assertAlmostEqual(integrated_columns['cumulative_rotation'][-1], 2.0)
+                self.assertAlmostEqual(integrated_columns['angle_z'][-1], 2.0)
+
+    def test_max_gap_argument(self):
+        time_delta = GyroscopeCalculator.calculate_time_delta_batch(self.timestamps, max_gap=100.0)
+        self.assertAlmostEqual(time_delta[101], 60.0)
+        time_delta = GyroscopeCalculator.calculate_time_delta_batch(self.timestamps, max_gap=0.005)
+        self.assertFalse(time_delta.any())
+
+    def test_window_after_gap_holds_only_samples_since_gap(self):
+        integrated_columns = GyroscopeCalculator.integrate_angular_velocity_batch(
+            self.zeros, self.zeros, self.gyr_z, self.timestamps)
+        windowed_rotation = GyroscopeCalculator.calculate_windowed_rotation_batch(
+            integrated_columns['rotation_angle'], self.timestamps, 0.5)
+        self.assertLess(windowed_rotation.max(), 0.52)
+        self.assertAlmostEqual(windowed_rotation[101], 0.0)
+        self.assertAlmostEqual(windowed_rotation[111], 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import contextlib
+from typing import Dict, List, Optional
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from parser003 import SensorDataParser
+from sensors.IO.LogFileIndex import LogFileIndex
+
+LOGFILE = os.path.join(REPOSITORY_DIR, 'data', 'logfile_2024_09_23_11_58_27.txt')
+TAGS = ['ACCE', 'PRES', 'WIFI', 'PROX']
+
+class LogFileIndexTest(unittest.TestCase):
+    """
+    Tests that the sensor slices read through the sidecar index hold the rows of a full parse.
+    """
+
+    def setUp(self):
+        self.working_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.working_dir)
+        self.source = os.path.join(self.working_dir, 'logfile.txt')
+        shutil.copy(LOGFILE, self.source)
+
+    def parse_rows(self, time_from: Optional[float] = None, time_to: Optional[float] = None,
+                   use_index: bool = True) -> Dict[str, List[tuple]]:
+        """
+        Parse the rows of the tested sensors in a time window.
+
+        Args:
+            time_from (float, optional): First AppTimestamp of the window, or None for the start.
+            time_to (float, optional): Last AppTimestamp of the window, or None for the end.
+            use_index (bool): Whether to read the lines through the index, or to filter the
+                rows of a full parse on their AppTimestamp.
+
+        Returns:
+            Dict[str, List[tuple]]: A mapping of sensor tag to its rows in the window.
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            if use_index:
+                sensors_tables = SensorDataParser().parse_sensor_slice(self.source, TAGS, time_from, time_to)
+            else:
+                sensors_tables = SensorDataParser().parse_sensor_tables(self.source, tags=TAGS)
+
+        low = float('-inf') if time_from is None else time_from
+        high = float('inf') if time_to is None else time_to
+        sensors_rows = {}
+        for tag, sensor_table in sensors_tables.items():
+            rows = [row for row in zip(*sensor_table.columns.values()) if low <= row[0] <= high]
+            if rows:
+                sensors_rows[tag] = rows
+        return sensors_rows
+
+    def test_slices_match_full_parse(self):
+        full_rows = self.parse_rows(use_index=False)
+        # taken a window bounded by the AppTimestamps of two lines, to check both bounds are included,
+        # and windows inside and across the gap of the recording between 4.8 s and 89.8 s
+        first_time, last_time = full_rows['ACCE'][500][0], full_rows['ACCE'][2500][0]
+
+        time_windows = ((None, None), (first_time, last_time), (None, 5.0), (60.5, None), (40.0, 40.0), (90.0, 92.5))
+
+        for time_from, time_to in time_windows:
+            with self.subTest(time_from=time_from, time_to=time_to):
+                expected_rows = self.parse_rows(time_from, time_to, use_index=False)
+                self.assertEqual(self.parse_rows(time_from, time_to), expected_rows)
+        self.assertIsNotNone(LogFileIndex.load(self.source))
+
+    def test_changed_logfile_rebuilds_index(self):
+        self.parse_rows()
+        with open(self.source, 'ab') as file:
+            file.write(b'\nPROX;100.700;305010.000;5.0;0')  # the logfile has no trailing newline
+
+        self.assertIsNone(LogFileIndex.load(self.source))
+        self.assertEqual(self.parse_rows(100.65), {'PROX': [(100.7, 305010.0, 5.0, 0)]})
+
+    def test_query_exports_time_window(self):
+        export_dir = os.path.join(self.working_dir, 'export')
+        with contextlib.redirect_stdout(io.StringIO()):
+            export_counts = SensorDataParser().query(self.source, ['ACCE', 'PRES'], 90.0, 95.0, export_dir=export_dir)
+
+        expected_rows = self.parse_rows(90.0, 95.0, use_index=False)
+        self.assertEqual(export_counts, {tag: len(expected_rows[tag]) for tag in ('ACCE', 'PRES')})
+
+    def test_invalid_time_window(self):
+        with self.assertRaises(ValueError):
+            SensorDataParser().query(self.source, ['ACCE'], 45.0, 30.0)
+
+if __name__ == '__main__':
+    unittest.main()
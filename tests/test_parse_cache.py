@@ -0,0 +1,89 @@
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import contextlib
+from unittest import mock
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from parser003 import SensorDataParser
+from analyzer003 import SensorDataAnalyzer
+
+LOGFILE = os.path.join(REPOSITORY_DIR, 'data', 'logfile_2024_09_23_11_58_27.txt')
+
+class ParseCacheTest(unittest.TestCase):
+    """
+    Tests that the parse cache is shared by the parser and the analyzer, and keyed by the logfile contents.
+    """
+
+    def setUp(self):
+        self.working_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.working_dir)
+        self.source = os.path.join(self.working_dir, 'logfile.txt')
+        shutil.copy(LOGFILE, self.source)
+
+        # kept the cache entries of the tests out of the cache of the user
+        environment = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': os.path.join(self.working_dir, 'cache')})
+        environment.start()
+        self.addCleanup(environment.stop)
+        self.cache_dir = os.path.join(self.working_dir, 'cache', 'sensor_data_parser')
+
+    def parse(self, tags=None):
+        """
+        Parse the logfile with the parse cache.
+
+        Args:
+            tags (List[str], optional): Sensor tags to parse. If None, all sensors are parsed.
+
+        Returns:
+            Tuple[Dict[str, SensorTable], bool]: The parsed tables, and whether they were loaded from the cache.
+        """
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            sensors_tables = SensorDataParser().parse_sensor_tables(self.source, use_cache=True, tags=tags)
+        return sensors_tables, 'From Parse Cache' in output.getvalue()
+
+    def test_second_run_hits_and_changed_file_misses(self):
+        sensors_tables, cache_hit = self.parse()
+        self.assertFalse(cache_hit)
+        cached_tables, cache_hit = self.parse()
+        self.assertTrue(cache_hit)
+        self.assertEqual(sorted(cached_tables), sorted(sensors_tables))
+        self.assertEqual(cached_tables['MAGN'].columns, sensors_tables['MAGN'].columns)
+
+        with open(self.source, 'r+b') as file:
+            contents = file.read().replace(b'MAGN;', b'MAGN;1', 1)
+            file.seek(0)
+            file.write(contents)
+        self.assertFalse(self.parse()[1])
+        self.assertTrue(self.parse()[1])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_analyzer_uses_entry_of_parser(self):
+        sensors_tables, _ = self.parse()
+
+        for tag in ('MAGN', 'PRES'):
+            with self.subTest(sensor=tag):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    frame = SensorDataAnalyzer().load_logfile(self.source, tag)
+                self.assertIn('From Parse Cache', output.getvalue())
+                self.assertEqual(len(frame), len(sensors_tables[tag]))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_tags_of_first_run_serve_other_tags(self):
+        magnetometer_tables, cache_hit = self.parse(['MAGN'])
+        self.assertFalse(cache_hit)
+        self.assertEqual(list(magnetometer_tables), ['MAGN'])
+
+        sensors_tables, cache_hit = self.parse()
+        self.assertTrue(cache_hit)
+        self.assertIn('PRES', sensors_tables)
+        self.assertEqual(sensors_tables['MAGN'].columns, magnetometer_tables['MAGN'].columns)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import contextlib
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from parser003 import SensorDataParser
+
+LOGFILE = os.path.join(REPOSITORY_DIR, 'data', 'logfile_2024_09_23_11_58_27.txt')
+
+# (index of the line inserted before, bad line, category) of the bad lines of the dirty logfile
+BAD_LINES = (
+    (100, b'ACCE;1.000;304840.000;-0.57461;4.47955;7.74764', 'field_count'),
+    (3000, b'MAGN;2.000;304841.000;-27.66000;abc;-33.36000;3', 'invalid_value'),
+    (None, b'ACCE;3.000;304842.000;-0.57461;\xff\xfe;7.74764;3', 'encoding')
+)
+
+# parse modes of the parser, which all collect the same errors
+PARSE_MODES = {
+    'objects': {},
+    'columnar': {'columnar': True},
+    'stream': {'stream': True},
+    'parallel': {'jobs': 2}
+}
+
+class ParseErrorTest(unittest.TestCase):
+    """
+    Tests that the lines that fail to parse are counted, quarantined and held against the error budget.
+    """
+
+    def setUp(self):
+        self.working_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.working_dir)
+        self.source = os.path.join(self.working_dir, 'logfile.txt')
+        self.quarantine_file = os.path.join(self.working_dir, 'quarantine.txt')
+
+        # inserted the bad lines into the lines of the logfile, and noted their line numbers
+        with open(LOGFILE, 'rb') as file:
+            lines = file.read().split(b'\n')
+        self.line_numbers = []
+        for index, bad_line, _ in BAD_LINES:
+            index = len(lines) if index is None else index + len(self.line_numbers)
+            lines.insert(index, bad_line)
+            self.line_numbers.append(index + 1)
+        with open(self.source, 'wb') as file:
+            file.write(b'\n'.join(lines))
+
+    def parse(self, error_budget=None, **options) -> SensorDataParser:
+        """
+        Parse and export the dirty logfile, saving its bad lines to the quarantine file.
+
+        Args:
+            error_budget (int, optional): Maximum number of bad lines before the run is aborted.
+            **options: Further arguments of the parser method.
+
+        Returns:
+            SensorDataParser: The parser, holding the parse errors of the run.
+        """
+        parser = SensorDataParser(quarantine_file=self.quarantine_file, error_budget=error_budget)
+        with contextlib.redirect_stdout(io.StringIO()):
+            parser.parser(self.source, export_dir=os.path.join(self.working_dir, 'export'), use_cache=False, **options)
+        return parser
+
+    def read_quarantine(self) -> bytes:
+        """
+        Read the quarantine file.
+
+        Returns:
+            bytes: The contents of the quarantine file.
+        """
+        with open(self.quarantine_file, 'rb') as file:
+            return file.read()
+
+    def test_every_parse_mode_collects_bad_lines(self):
+        for mode, options in PARSE_MODES.items():
+            with self.subTest(mode=mode):
+                error_collector = self.parse(**options).error_collector
+                self.assertEqual(error_collector.total_errors, len(BAD_LINES))
+                self.assertEqual(error_collector.category_counts, {category: 1 for _, _, category in BAD_LINES})
+                self.assertEqual(error_collector.tag_counts, {'ACCE': 2, 'MAGN': 1})
+                self.assertEqual([error[0] for error in error_collector.examples], self.line_numbers)
+                self.assertEqual(self.read_quarantine(), b''.join(bad_line + b'\n' for _, bad_line, _ in BAD_LINES))
+                os.remove(self.quarantine_file)
+
+    def test_error_budget(self):
+        for mode, options in PARSE_MODES.items():
+            with self.subTest(mode=mode):
+                self.parse(error_budget=len(BAD_LINES), **options)
+                with self.assertRaises(ValueError):
+                    self.parse(error_budget=len(BAD_LINES) - 1, **options)
+                # saved the bad line that exceeded the budget before the run was aborted
+                self.assertEqual(self.read_quarantine().count(b'\n'), len(BAD_LINES))
+
+    def test_error_budget_counts_only_parsed_sensors(self):
+        self.assertEqual(self.parse(error_budget=0, target_sensor='PRES', columnar=True).error_collector.total_errors, 0)
+        with self.assertRaises(ValueError):
+            self.parse(error_budget=1, target_sensor='ACCE', columnar=True)
+
+    def test_clean_logfile_writes_no_quarantine_file(self):
+        shutil.copy(LOGFILE, self.source)
+        self.assertEqual(self.parse(error_budget=0).error_collector.total_errors, 0)
+        self.assertFalse(os.path.exists(self.quarantine_file))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+from parser003 import SensorDataParser
+from sensors.Base.SensorTable import SensorTable
+from sensors.Fusion.SensorAligner import SensorAligner
+
+class SensorAlignerTest(unittest.TestCase):
+    """
+    Tests that the sampling methods of the aligner take the values of the right samples.
+    """
+
+    def setUp(self):
+        # sampled the accelerometer at 10 Hz and the barometer at 2 Hz, with unrelated sensor clocks
+        self.acce_times = np.round(np.arange(11) * 0.1, 3)
+        self.pres_times = np.array([0.03, 0.53, 1.03])
+        self.sensors_tables = {
+            'ACCE': self.build_table('ACCE', [(time, time + 5000.0, 10.0 * time, -time, 9.81, 3)
+                                              for time in self.acce_times]),
+            'PRES': self.build_table('PRES', [(time, time - 20.0, 1000.0 + 20.0 * index, 3)
+                                              for index, time in enumerate(self.pres_times)])
+        }
+
+    @staticmethod
+    def build_table(tag: str, rows: list) -> SensorTable:
+        """
+        Build the table of a sensor from its rows.
+
+        Args:
+            tag (str): Sensor tag of the table.
+            rows (list): The field values of every row, in the order of the sensor layout.
+
+        Returns:
+            SensorTable: The table holding the rows.
+        """
+        sensor_table = SensorTable(tag, SensorDataParser().sensor_class_map[tag])
+        for row in rows:
+            sensor_table.append([str(value) for value in row])
+        return sensor_table
+
+    @staticmethod
+    def sample(method: str, times: np.ndarray, values: np.ndarray, grid: np.ndarray) -> np.ndarray:
+        """
+        Sample values at the grid times one grid time at a time, as a reference for the aligner.
+
+        Args:
+            method (str): Sampling method, 'nearest', 'linear' or 'asof'.
+            times (np.ndarray): The sorted timestamps of the samples.
+            values (np.ndarray): The values of the samples.
+            grid (np.ndarray): The grid times.
+
+        Returns:
+            np.ndarray: The value at every grid time.
+        """
+        if method == 'linear':
+            return np.array([np.interp(time, times, values) for time in grid])
+        if method == 'nearest':
+            return np.array([values[np.argmin(np.abs(times - time))] for time in grid])
+        return np.array([values[np.flatnonzero(times <= time)[-1]] for time in grid])
+
+    def test_sampling_methods(self):
+        for method in SensorAligner.METHODS:
+            with self.subTest(method=method):
+                aligned_data = SensorAligner(10.0, method).align(self.sensors_tables, ['ACCE', 'PRES'])
+                grid = aligned_data['time'].to_numpy()
+                np.testing.assert_allclose(grid, 0.03 + np.arange(10) * 0.1)
+                self.assertEqual(list(aligned_data.columns),
+                                 ['time', 'ACCE_acc_x', 'ACCE_acc_y', 'ACCE_acc_z', 'PRES_pres'])
+
+                np.testing.assert_allclose(aligned_data['ACCE_acc_x'],
+                                           self.sample(method, self.acce_times, 10.0 * self.acce_times, grid))
+                pres_values = np.array([1000.0, 1020.0, 1040.0])
+                np.testing.assert_allclose(aligned_data['PRES_pres'],
+                                           self.sample(method, self.pres_times, pres_values, grid))
+
+    def test_known_values(self):
+        grid_values = {
+            'nearest': [1000.0, 1000.0, 1000.0, 1020.0, 1020.0, 1020.0, 1020.0, 1020.0, 1040.0, 1040.0],
+            'linear': [1000.0, 1004.0, 1008.0, 1012.0, 1016.0, 1020.0, 1024.0, 1028.0, 1032.0, 1036.0],
+            'asof': [1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1020.0, 1020.0, 1020.0, 1020.0, 1020.0]
+        }
+        for method, values in grid_values.items():
+            with self.subTest(method=method):
+                aligned_data = SensorAligner(10.0, method).align(self.sensors_tables, ['ACCE', 'PRES'])
+                np.testing.assert_allclose(aligned_data['PRES_pres'], values)
+
+    def test_tolerance(self):
+        aligned_data = SensorAligner(10.0, 'asof', tolerance=0.25).align(self.sensors_tables, ['ACCE', 'PRES'])
+        np.testing.assert_array_equal(np.isnan(aligned_data['PRES_pres']), [False, False, False, True, True] * 2)
+        self.assertFalse(aligned_data['ACCE_acc_x'].isna().any())
+
+    def test_sensor_time_base_and_unsorted_rows(self):
+        app_aligned_data = SensorAligner(10.0, 'linear').align(self.sensors_tables, ['ACCE', 'PRES'])
+
+        # shuffled the accelerometer rows, which the aligner sorts by time again
+        rows = list(zip(*self.sensors_tables['ACCE'].columns.values()))
+        shuffled_tables = dict(self.sensors_tables, ACCE=self.build_table('ACCE', rows[::2] + rows[1::2]))
+        for time_base in SensorAligner.TIME_BASES:
+            with self.subTest(time_base=time_base):
+                aligned_data = SensorAligner(10.0, 'linear', time_base).align(shuffled_tables, ['ACCE', 'PRES'])
+                np.testing.assert_allclose(aligned_data.to_numpy(), app_aligned_data.to_numpy(), atol=1e-9)
+
+    def test_invalid_alignments(self):
+        with self.assertRaises(ValueError):
+            SensorAligner(10.0, 'cubic')
+        with self.assertRaises(ValueError):
+            SensorAligner(0)
+        with self.assertRaises(ValueError):
+            SensorAligner(10.0).align(self.sensors_tables, ['ACCE', 'GYRO'])
+
+        later_table = self.build_table('PRES', [(time + 2.0, time, 1000.0, 3) for time in self.pres_times])
+        with self.assertRaises(ValueError):
+            SensorAligner(10.0).align(dict(self.sensors_tables, PRES=later_table), ['ACCE', 'PRES'])
+
+if __name__ == '__main__':
+    unittest.main()